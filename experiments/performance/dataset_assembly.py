@@ -0,0 +1,106 @@
+"""Time the assembly of the prediction dataset for many series.
+
+`NeuralForecast.predict` appends the future rows of `futr_df` (or the `h`
+empty rows) to the stored dataset with `TimeSeriesDataset.append`. This
+script times it, as well as `trim_dataset`, against the previous per-serie
+loops and checks that both give the same result.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+import torch
+
+from neuralforecast.tsdataset import TimeSeriesDataset
+
+
+def append_loop(dataset, futr_dataset):
+    len_temporal, col_temporal = dataset.temporal.shape
+    len_futr = futr_dataset.temporal.shape[0]
+    new_temporal = torch.empty(size=(len_temporal + len_futr, col_temporal))
+    new_indptr = dataset.indptr + futr_dataset.indptr
+    for i in range(dataset.n_groups):
+        curr_slice = slice(dataset.indptr[i], dataset.indptr[i + 1])
+        curr_size = curr_slice.stop - curr_slice.start
+        futr_slice = slice(futr_dataset.indptr[i], futr_dataset.indptr[i + 1])
+        new_temporal[new_indptr[i] : new_indptr[i] + curr_size] = dataset.temporal[
+            curr_slice
+        ]
+        new_temporal[new_indptr[i] + curr_size : new_indptr[i + 1]] = (
+            futr_dataset.temporal[futr_slice]
+        )
+    return new_temporal
+
+
+def trim_loop(dataset, left_trim, right_trim):
+    len_temporal, col_temporal = dataset.temporal.shape
+    total_trim = (left_trim + right_trim) * dataset.n_groups
+    new_temporal = torch.zeros(size=(len_temporal - total_trim, col_temporal))
+    acum = 0
+    for i in range(dataset.n_groups):
+        new_length = dataset.indptr[i + 1] - dataset.indptr[i] - left_trim - right_trim
+        new_temporal[acum : (acum + new_length), :] = dataset.temporal[
+            dataset.indptr[i] + left_trim : dataset.indptr[i + 1] - right_trim, :
+        ]
+        acum += new_length
+    return new_temporal
+
+
+def make_dataset(sizes, n_cols, seed):
+    rng = np.random.default_rng(seed)
+    indptr = np.append(0, np.cumsum(sizes)).astype(np.int32)
+    temporal = rng.random((indptr[-1], n_cols), dtype=np.float32)
+    return TimeSeriesDataset(
+        temporal=temporal,
+        temporal_cols=pd.Index([f"x{i}" for i in range(n_cols - 1)] + ["available_mask"]),
+        indptr=indptr,
+        y_idx=0,
+    )
+
+
+def timeit(fn, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        out = fn()
+        times.append(time.perf_counter() - start)
+    return out, min(times)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n_series", type=int, default=1_000_000)
+    parser.add_argument("--min_length", type=int, default=20)
+    parser.add_argument("--max_length", type=int, default=100)
+    parser.add_argument("--h", type=int, default=12)
+    parser.add_argument("--n_cols", type=int, default=3)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--skip_loop", action="store_true")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    sizes = rng.integers(args.min_length, args.max_length + 1, size=args.n_series)
+    dataset = make_dataset(sizes, args.n_cols, seed=1)
+    futr_dataset = make_dataset(np.full(args.n_series, args.h), args.n_cols, seed=2)
+    print(f"{args.n_series:,} series, {dataset.temporal.shape[0]:,} rows")
+
+    appended, append_time = timeit(
+        lambda: dataset.append(futr_dataset), args.repeats
+    )
+    trimmed, trim_time = timeit(
+        lambda: TimeSeriesDataset.trim_dataset(dataset, 2, args.h), args.repeats
+    )
+    print(f"append:       {append_time:8.3f}s")
+    print(f"trim_dataset: {trim_time:8.3f}s")
+
+    if not args.skip_loop:
+        expected, loop_append_time = timeit(
+            lambda: append_loop(dataset, futr_dataset), 1
+        )
+        assert torch.equal(appended.temporal, expected)
+        expected, loop_trim_time = timeit(lambda: trim_loop(dataset, 2, args.h), 1)
+        assert torch.equal(trimmed.temporal, expected)
+        print(f"append (loop):       {loop_append_time:8.3f}s")
+        print(f"trim_dataset (loop): {loop_trim_time:8.3f}s")
@@ -0,0 +1,86 @@
+"""Peak memory of `TimeSeriesDataset.from_df`.
+
+Each implementation runs in its own process, which builds the input DataFrame,
+records its peak resident set size and then builds the dataset. The increase of
+the peak is reported per million rows of the DataFrame. The previous implementation
+appended the available mask with `np.append` and cloned the arrays when creating the
+tensors.
+"""
+
+import argparse
+import gc
+import resource
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import torch
+import utilsforecast.processing as ufp
+
+from neuralforecast.tsdataset import TimeSeriesDataset
+
+
+def make_df(n_series, length, n_exog, seed):
+    rng = np.random.default_rng(seed)
+    n_rows = n_series * length
+    data = {
+        "unique_id": np.repeat(np.arange(n_series), length),
+        "ds": np.tile(np.arange(length), n_series),
+        "y": rng.random(n_rows),
+    }
+    for i in range(n_exog):
+        data[f"x{i}"] = rng.random(n_rows)
+    return pd.DataFrame(data)
+
+
+def from_df_previous(df, id_col="unique_id", time_col="ds", target_col="y"):
+    _, _, data, indptr, _ = ufp.process_df(df, id_col, time_col, target_col)
+    temporal_cols = pd.Index(
+        [target_col] + [c for c in df.columns if c not in (id_col, time_col, target_col)]
+    )
+    available_mask = np.ones((len(data), 1), dtype=np.float32)
+    data = np.append(data, available_mask, axis=1)
+    temporal = torch.from_numpy(data).to(torch.float32, copy=False).clone()
+    return temporal, temporal_cols.append(pd.Index(["available_mask"])), indptr
+
+
+def max_rss_mb():
+    # kilobytes on linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run(args):
+    df = make_df(args.n_series, args.length, args.n_exog, args.seed)
+    gc.collect()
+    before = max_rss_mb()
+    if args.mode == "previous":
+        temporal, *_ = from_df_previous(df)
+    else:
+        dataset, *_ = TimeSeriesDataset.from_df(df)
+        temporal = dataset.temporal
+    peak = max_rss_mb() - before
+    n_million = len(df) / 1e6
+    print(
+        f"{args.mode:>8}: peak increase {peak:,.0f}MB "
+        f"({peak / n_million:,.1f}MB per million rows), "
+        f"final tensor {temporal.nbytes / 2**20:,.0f}MB"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n_series", type=int, default=10_000)
+    parser.add_argument("--length", type=int, default=500)
+    parser.add_argument("--n_exog", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mode", choices=["previous", "current"], default=None)
+    args = parser.parse_args()
+
+    if args.mode is not None:
+        run(args)
+    else:
+        for mode in ["previous", "current"]:
+            subprocess.run(
+                [sys.executable, __file__, "--mode", mode, *sys.argv[1:]], check=True
+            )
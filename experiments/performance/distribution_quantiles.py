@@ -0,0 +1,109 @@
+"""Cost of the prediction quantiles of the StudentT and NegativeBinomial losses.
+
+`DistributionLoss.predict_quantiles` inverts the CDF of these distributions, which is
+evaluated with the continued fraction of the incomplete beta function, instead of
+drawing `num_samples` samples of every output. Each distribution and mode runs in its
+own process, which reports the time of the calls and the increase of the peak memory
+(resident set size on CPU, allocated memory on GPU).
+
+With `--recurrent` the quantiles are computed one horizon step at a time, as in the
+prediction of the recurrent models.
+"""
+
+import argparse
+import gc
+import resource
+import subprocess
+import sys
+import time
+
+import torch
+
+from neuralforecast.losses.pytorch import DistributionLoss
+
+
+def make_distr_args(distribution, n_series, h, device):
+    g = torch.Generator().manual_seed(0)
+    shape = (n_series, h, 1)
+
+    def rand(scale, shift):
+        return (torch.rand(shape, generator=g) * scale + shift).to(device)
+
+    if distribution == "StudentT":
+        return (
+            rand(10.0, 1.0),
+            torch.randn(shape, generator=g).to(device) * 3,
+            rand(1.0, 0.5),
+        )
+    return (rand(10.0, 0.5), rand(0.9, 0.05))
+
+
+def peak_memory_mb(device):
+    if device.type == "cuda":
+        return torch.cuda.max_memory_allocated(device) / 2**20
+    # kilobytes on linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run(args):
+    device = torch.device(args.device)
+    loss = DistributionLoss(
+        distribution=args.distribution,
+        level=[80, 90],
+        num_samples=args.num_samples,
+        analytic_quantiles=args.mode == "analytic",
+    ).to(device)
+    distr_args = make_distr_args(args.distribution, args.n_series, args.h, device)
+    if args.recurrent:
+        steps = [tuple(arg[:, [i]] for arg in distr_args) for i in range(args.h)]
+    else:
+        steps = [distr_args]
+    gc.collect()
+    before = peak_memory_mb(device)
+    start = time.perf_counter()
+    with torch.no_grad():
+        for step_args in steps:
+            _, quants = loss.predict_quantiles(step_args)
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+    elapsed = time.perf_counter() - start
+    peak = peak_memory_mb(device) - before
+    print(
+        f"{args.distribution:>16} {args.mode:>8}: {elapsed:8.3f}s, "
+        f"peak memory increase {peak:,.0f}MB, {len(steps)} calls"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n_series", type=int, default=100_000)
+    parser.add_argument("--h", type=int, default=12)
+    parser.add_argument("--num_samples", type=int, default=1000)
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--recurrent", action="store_true")
+    parser.add_argument(
+        "--distribution", choices=["StudentT", "NegativeBinomial"], default=None
+    )
+    parser.add_argument("--mode", choices=["sampling", "analytic"], default=None)
+    args = parser.parse_args()
+
+    if args.distribution is not None and args.mode is not None:
+        run(args)
+    else:
+        distributions = (
+            [args.distribution] if args.distribution else ["StudentT", "NegativeBinomial"]
+        )
+        for distribution in distributions:
+            for mode in ["sampling", "analytic"]:
+                subprocess.run(
+                    [
+                        sys.executable,
+                        __file__,
+                        *sys.argv[1:],
+                        "--distribution",
+                        distribution,
+                        "--mode",
+                        mode,
+                    ],
+                    check=True,
+                )
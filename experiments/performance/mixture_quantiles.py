@@ -0,0 +1,96 @@
+"""Cost of the prediction quantiles of the mixture losses.
+
+`GMM`, `PMM` and `NBMM` used to draw `num_samples` samples of every output and reduce
+them with `torch.quantile`. Their `predict_quantiles` now inverts the mixture CDF by
+bisection. Each loss and mode runs in its own process, which reports the time of the
+call and the increase of the peak memory (resident set size on CPU, allocated memory
+on GPU).
+"""
+
+import argparse
+import gc
+import resource
+import subprocess
+import sys
+import time
+
+import torch
+
+from neuralforecast.losses.pytorch import GMM, NBMM, PMM
+
+
+def make_distr_args(loss_name, n_series, h, n_components, device):
+    g = torch.Generator().manual_seed(0)
+    shape = (n_series, h, 1, n_components)
+
+    def rand(scale, shift):
+        return (torch.rand(shape, generator=g) * scale + shift).to(device)
+
+    if loss_name == "GMM":
+        return (torch.randn(shape, generator=g).to(device) * 3, rand(1.0, 0.5))
+    if loss_name == "PMM":
+        return (rand(50.0, 0.1),)
+    return (rand(10.0, 0.5), rand(0.9, 0.05))
+
+
+def peak_memory_mb(device):
+    if device.type == "cuda":
+        return torch.cuda.max_memory_allocated(device) / 2**20
+    # kilobytes on linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run(args):
+    device = torch.device(args.device)
+    losses = dict(GMM=GMM, PMM=PMM, NBMM=NBMM)
+    loss = losses[args.loss](
+        n_components=args.n_components,
+        num_samples=args.num_samples,
+        analytic_quantiles=args.mode == "bisection",
+    ).to(device)
+    distr_args = make_distr_args(
+        args.loss, args.n_series, args.h, args.n_components, device
+    )
+    gc.collect()
+    before = peak_memory_mb(device)
+    start = time.perf_counter()
+    with torch.no_grad():
+        _, quants = loss.predict_quantiles(distr_args)
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+    elapsed = time.perf_counter() - start
+    peak = peak_memory_mb(device) - before
+    print(
+        f"{args.loss:>4} {args.mode:>9}: {elapsed:8.3f}s, "
+        f"peak memory increase {peak:,.0f}MB, quantiles {tuple(quants.shape)}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n_series", type=int, default=100_000)
+    parser.add_argument("--h", type=int, default=12)
+    parser.add_argument("--n_components", type=int, default=10)
+    parser.add_argument("--num_samples", type=int, default=1000)
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--loss", choices=["GMM", "PMM", "NBMM"], default=None)
+    parser.add_argument("--mode", choices=["sampling", "bisection"], default=None)
+    args = parser.parse_args()
+
+    if args.loss is not None and args.mode is not None:
+        run(args)
+    else:
+        for loss_name in [args.loss] if args.loss else ["GMM", "PMM", "NBMM"]:
+            for mode in ["sampling", "bisection"]:
+                subprocess.run(
+                    [
+                        sys.executable,
+                        __file__,
+                        *sys.argv[1:],
+                        "--loss",
+                        loss_name,
+                        "--mode",
+                        mode,
+                    ],
+                    check=True,
+                )
@@ -0,0 +1,89 @@
+"""Time single requests to a trained model.
+
+An online service answers requests for the forecasts of one or a few series.
+This script times `BaseModel.predict`, which builds a Lightning `Trainer` and
+a `DataLoader` on every call, against the engine returned by
+`BaseModel.compile_predictor`, which runs the prediction steps directly, and
+checks that both give the same forecasts.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from neuralforecast.models import LSTM, MLP, NHITS
+from neuralforecast.tsdataset import TimeSeriesDataset
+from neuralforecast.utils import generate_series
+
+MODELS = {"MLP": MLP, "NHITS": NHITS, "LSTM": LSTM}
+
+
+def latencies(fn, requests):
+    times = []
+    for request in requests:
+        start = time.perf_counter()
+        fn(request)
+        times.append(time.perf_counter() - start)
+    return 1000 * np.array(times)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", choices=list(MODELS), default="NHITS")
+    parser.add_argument("--h", type=int, default=12)
+    parser.add_argument("--input_size", type=int, default=48)
+    parser.add_argument("--n_series", type=int, default=100)
+    parser.add_argument("--series_per_request", type=int, default=1)
+    parser.add_argument("--n_requests", type=int, default=200)
+    parser.add_argument("--device", default="cpu")
+    args = parser.parse_args()
+
+    df = generate_series(
+        n_series=args.n_series, min_length=4 * args.input_size, seed=0
+    )
+    dataset, uids, *_ = TimeSeriesDataset.from_df(df)
+    model = MODELS[args.model](
+        h=args.h,
+        input_size=args.input_size,
+        max_steps=10,
+        accelerator=args.device,
+        devices=1,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+        logger=False,
+    )
+    model.fit(dataset)
+    # predict the last h rows of each serie
+    model.set_test_size(args.h)
+
+    rng = np.random.default_rng(0)
+    requests = []
+    for _ in range(args.n_requests):
+        idxs = rng.choice(args.n_series, size=args.series_per_request, replace=False)
+        requests.append(dataset._get_batch(np.sort(idxs)))
+
+    predictor = model.compile_predictor(device=args.device)
+
+    def trainer_predict(batch):
+        request_df = df[df["unique_id"].isin(uids[batch["idx"].numpy()])]
+        request_dataset, *_ = TimeSeriesDataset.from_df(request_df)
+        return model.predict(request_dataset)
+
+    def compiled_predict(batch):
+        return predictor(batch["temporal"], temporal_cols=batch["temporal_cols"])
+
+    for batch in requests[:5]:
+        np.testing.assert_allclose(
+            compiled_predict(batch), trainer_predict(batch), rtol=1e-5
+        )
+
+    print(
+        f"{args.model}, {args.series_per_request} series per request, "
+        f"{args.n_requests} requests (ms)"
+    )
+    print(f"{'':10} {'p50':>8} {'p90':>8} {'p99':>8}")
+    for name, fn in [("predict", trainer_predict), ("compiled", compiled_predict)]:
+        times = latencies(fn, requests)
+        p50, p90, p99 = np.percentile(times, [50, 90, 99])
+        print(f"{name:10} {p50:8.2f} {p90:8.2f} {p99:8.2f}")
@@ -1,4 +1,4 @@
-__all__ = ["DistributedConfig", "BaseModel"]
+__all__ = ["DistributedConfig", "BaseModel", "CompiledPredictor"]
 
 
 import inspect
@@ -8,14 +8,17 @@ import warnings
 from contextlib import contextmanager
 from copy import deepcopy
 from dataclasses import dataclass
+from types import SimpleNamespace
 from typing import Dict, List, Optional, Union
 
 import fsspec
 import numpy as np
+import pandas as pd
 import pytorch_lightning as pl
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
+import utilsforecast.processing as ufp
 from pytorch_lightning.callbacks.early_stopping import EarlyStopping
 
 import neuralforecast.losses.pytorch as losses
@@ -23,6 +26,8 @@ from neuralforecast.common.enums import ExplainerEnum
 from neuralforecast.tsdataset import (
     BaseTimeSeriesDataset,
     TimeSeriesDataModule,
+    TimeSeriesDataset,
+    _BatchPadding,
     _DistributedTimeSeriesDataModule,
 )
 
@@ -49,6 +54,12 @@ class DistributedConfig:
     devices: int
 
 
+@dataclass
+class _WarmStart:
+    new_size: int
+    replay_fraction: float
+
+
 @contextmanager
 def _disable_torch_init():
     """Context manager used to disable pytorch's weight initialization.
@@ -79,6 +90,40 @@ def _disable_torch_init():
         nn.init.xavier_normal_ = xavier_normal
 
 
+def _map_state(fn, *states):
+    # hidden states of torch's recurrent layers are [num_layers, B, hidden_size],
+    # or a tuple of them for LSTMs
+    if isinstance(states[0], (tuple, list)):
+        return type(states[0])(_map_state(fn, *group) for group in zip(*states))
+    return fn(*states)
+
+
+def _repeat_state(state, repeats):
+    return _map_state(lambda s: s.repeat_interleave(repeats, dim=1), state)
+
+
+# Maximum number of sample paths decoded at once, as the recurrent state grows with them
+_PATHS_BATCH_SIZE = 2**16
+
+
+def _paths_quantiles(paths: torch.Tensor, quantiles: torch.Tensor) -> torch.Tensor:
+    """Linearly interpolated quantiles over dim 1, like `torch.quantile`.
+
+    `torch.quantile` rejects inputs with more than 2**24 elements, so the paths are
+    sorted and the two closest order statistics of every quantile are interpolated.
+    """
+    n_paths = paths.shape[1]
+    paths = paths.sort(dim=1).values
+    position = quantiles * (n_paths - 1)
+    below = position.floor().long()
+    above = position.ceil().long()
+    shape = (1, -1) + (1,) * (paths.ndim - 2)
+    weight = (position - below).view(shape)
+    return torch.lerp(
+        paths.index_select(1, below), paths.index_select(1, above), weight
+    )
+
+
 def tensor_to_numpy(tensor: torch.Tensor) -> np.ndarray:
     """Convert a tensor to numpy"""
     if tensor.dtype == torch.bfloat16:
@@ -184,6 +229,7 @@ class BaseModel(pl.LightningModule):
             self.inference_input_size = inference_input_size
             self.rnn_state = None
             self.maintain_state = False
+            self.n_paths = None
 
         with warnings.catch_warnings(record=False):
             warnings.filterwarnings("ignore")
@@ -448,6 +494,12 @@ class BaseModel(pl.LightningModule):
         # used by on_validation_epoch_end hook
         self.validation_step_outputs: List = []
         self.alias = alias
+        # Valid training windows of the dataset being fitted, see `_fit`
+        self._train_windows_index = None
+        # Optimizer and scheduler states kept to continue the training, see `refit`
+        self._keep_optimizer_state = False
+        self._optimizer_state = None
+        self._warm_start = None
 
     def __repr__(self):
         return type(self).__name__ if self.alias is None else self.alias
@@ -600,6 +652,8 @@ class BaseModel(pl.LightningModule):
             valid_batch_size=valid_batch_size,
             drop_last=self.drop_last_loader,
             shuffle_train=shuffle_train,
+            train_padding=self._batch_padding(step="train"),
+            valid_padding=self._batch_padding(step="val"),
             **dataloader_kwargs,
         )
 
@@ -625,8 +679,17 @@ class BaseModel(pl.LightningModule):
 
         if is_local:
             model = self
+            model._train_windows_index = model._build_train_windows_index(dataset)
             trainer = pl.Trainer(**model.trainer_kwargs)
-            trainer.fit(model, datamodule=datamodule)
+            try:
+                trainer.fit(model, datamodule=datamodule)
+            finally:
+                model._train_windows_index = None
+            if model._keep_optimizer_state or model._warm_start is not None:
+                model._optimizer_state = dict(
+                    optimizer=trainer.optimizers[0].state_dict(),
+                    lr_scheduler=trainer.lr_scheduler_configs[0].scheduler.state_dict(),
+                )
             model.metrics = trainer.callback_metrics
             model.__dict__.pop("_trainer", None)
         else:
@@ -638,6 +701,41 @@ class BaseModel(pl.LightningModule):
             )
         return model
 
+    def _batch_padding(self, step):
+        # Batches are only padded as much as the windows of each step need.
+        # Training windows are sampled from the left of the batch, so the padding
+        # keeps room for windows that start before the longest serie and is
+        # removed in multiples of step_size to keep the same windows.
+        if step == "train":
+            left_padding = self.padder_train.padding[0]
+            return _BatchPadding(
+                left_margin=self.input_size - 1 - left_padding,
+                alignment=self.step_size,
+            )
+        # Validation and prediction windows are taken from the right
+        input_size = max(self.input_size, getattr(self, "inference_input_size", 0))
+        return _BatchPadding(min_length=input_size + self.val_size + self.test_size)
+
+    def _build_train_windows_index(self, dataset):
+        # The index is cached in the dataset, so it's computed once per fit and
+        # shared by the models with the same window settings.
+        # Multivariate models check the availability over all the series of
+        # the batch, so they compute it from the batch itself.
+        if self.MULTIVARIATE or not isinstance(dataset, TimeSeriesDataset):
+            return None
+        h = self.h_train if self.RECURRENT else self.h
+        left_padding, right_padding = self.padder_train.padding
+        return dataset.windows_index(
+            input_size=self.input_size,
+            h=h,
+            step_size=self.step_size,
+            min_insample_fraction=self.min_insample_fraction,
+            min_outsample_fraction=self.min_outsample_fraction,
+            left_padding=left_padding,
+            right_padding=right_padding,
+            right_trim=self.val_size + self.test_size,
+        )
+
     def on_fit_start(self):
         torch.manual_seed(self.random_seed)
         np.random.seed(self.random_seed)
@@ -682,6 +780,13 @@ class BaseModel(pl.LightningModule):
             lr_scheduler["scheduler"] = torch.optim.lr_scheduler.StepLR(
                 optimizer=optimizer, step_size=self.lr_decay_steps, gamma=0.5
             )
+
+        # Continue the optimization of the previous fit
+        if self._warm_start is not None and self._optimizer_state is not None:
+            optimizer.load_state_dict(self._optimizer_state["optimizer"])
+            lr_scheduler["scheduler"].load_state_dict(
+                self._optimizer_state["lr_scheduler"]
+            )
         return {"optimizer": optimizer, "lr_scheduler": lr_scheduler}
 
     def get_test_size(self):
@@ -726,10 +831,15 @@ class BaseModel(pl.LightningModule):
     def load(cls, path, **kwargs):
         if "weights_only" in inspect.signature(torch.load).parameters:
             kwargs["weights_only"] = False
-        with fsspec.open(path, "rb") as f, warnings.catch_warnings():
+        with warnings.catch_warnings():
             # ignore possible warnings about weights_only=False
             warnings.filterwarnings("ignore", category=FutureWarning)
-            content = torch.load(f, **kwargs)
+            if kwargs.get("mmap", False):
+                # memory-mapped weights need the path of a local file
+                content = torch.load(path, **kwargs)
+            else:
+                with fsspec.open(path, "rb") as f:
+                    content = torch.load(f, **kwargs)
         with _disable_torch_init():
             model = cls(**content["hyper_parameters"])
         if "assign" in inspect.signature(model.load_state_dict).parameters:
@@ -738,6 +848,58 @@ class BaseModel(pl.LightningModule):
             model.load_state_dict(content["state_dict"], strict=True)
         return model
 
+    def _available_windows(self, temporal, temporal_cols, window_starts):
+        window_size = self.input_size + self.h
+
+        # Calculate minimum required available points based on fractions
+        min_insample_points = max(
+            1, int(self.input_size * self.min_insample_fraction * self.n_series)
+        )
+        min_outsample_points = max(
+            1, int(self.h * self.min_outsample_fraction * self.n_series)
+        )
+
+        # Sample based on available conditions. Available points of every
+        # window are obtained from the cumulative sum of the mask.
+        available_idx = temporal_cols.get_loc("available_mask")
+        available_cumsum = F.pad(
+            temporal[:, available_idx].cumsum(dim=-1), pad=(1, 0), value=0.0
+        )
+        insample_end = window_starts + self.input_size
+        insample_condition = (
+            available_cumsum[:, insample_end] - available_cumsum[:, window_starts]
+        )
+        if self.MULTIVARIATE:
+            # Sum over series dimension: [n_series, Ws] -> [Ws]
+            insample_condition = insample_condition.sum(dim=0)
+        final_condition = insample_condition >= min_insample_points
+
+        if self.h > 0:
+            outsample_condition = (
+                available_cumsum[:, window_starts + window_size]
+                - available_cumsum[:, insample_end]
+            )
+            if self.MULTIVARIATE:
+                outsample_condition = outsample_condition.sum(dim=0)
+            final_condition = (outsample_condition >= min_outsample_points) & (
+                insample_condition >= min_insample_points
+            )
+
+        # Univariate windows are indexed as serie * Ws + window
+        return torch.nonzero(final_condition.flatten()).squeeze(-1)
+
+    def _warm_start_windows(self, final_condition, window_starts, length):
+        # Keep the windows whose outsample reaches the newly revealed observations
+        # at the end of the series, plus a random sample of the older windows.
+        starts = window_starts[final_condition % len(window_starts)]
+        new_start = length - self.padder_train.padding[1] - self._warm_start.new_size
+        is_new = starts + self.input_size + self.h > new_start
+        replay = (
+            torch.rand(len(final_condition), device=final_condition.device)
+            < self._warm_start.replay_fraction
+        )
+        return final_condition[is_new | replay]
+
     def _create_windows(self, batch, step):
         # Parse common data
         window_size = self.input_size + self.h
@@ -756,76 +918,45 @@ class BaseModel(pl.LightningModule):
                     "Time series is too short for training, consider setting a smaller input size or set start_padding_enabled=True"
                 )
 
-            windows = temporal.unfold(
-                dimension=-1, size=window_size, step=self.step_size
+            # Windows are never materialized here. We only compute which window
+            # starts satisfy the availability thresholds, the sampled windows are
+            # later gathered by `_gather_train_windows`.
+            window_starts = torch.arange(
+                0,
+                temporal.shape[-1] - window_size + 1,
+                self.step_size,
+                device=temporal.device,
             )
 
-            if self.MULTIVARIATE:
-                # [n_series, C, Ws, L + h] -> [Ws, L + h, C, n_series]
-                windows = windows.permute(2, 3, 1, 0)
-            else:
-                # [n_series, C, Ws, L + h] -> [Ws * n_series, L + h, C, 1]
-                windows_per_serie = windows.shape[2]
-                windows = windows.permute(0, 2, 3, 1)
-                windows = windows.flatten(0, 1)
-                windows = windows.unsqueeze(-1)
-
-            # Extract sample_weight before availability filtering so it is never
-            # seen by the model as a feature
-            if "sample_weight" in temporal_cols:
-                sw_idx = temporal_cols.get_loc("sample_weight")
-                # Aggregate mean over outsample horizon steps → [Ws*n_series, 1, 1]
-                sample_weight_windows = windows[
-                    :, self.input_size :, sw_idx : sw_idx + 1, :
-                ].mean(dim=1, keepdim=False)
-                keep = [i for i in range(windows.shape[2]) if i != sw_idx]
-                windows = windows[:, :, keep, :]
-                temporal_cols = temporal_cols.delete(sw_idx)
+            # Use the index precomputed for the dataset when the batch comes from it
+            index = self._train_windows_index
+            window_offset = batch.get("left_trim", 0) // self.step_size
+            if (
+                index is not None
+                and "idx" in batch
+                and index.n_windows - window_offset == len(window_starts)
+            ):
+                if index.indptr.device != temporal.device:
+                    index = index.to(temporal.device)
+                    self._train_windows_index = index
+                final_condition = index.batch_condition(
+                    batch["idx"], window_offset=window_offset
+                )
             else:
-                sample_weight_windows = None
-
-            # Calculate minimum required available points based on fractions
-            min_insample_points = max(
-                1, int(self.input_size * self.min_insample_fraction * self.n_series)
-            )
-            min_outsample_points = max(
-                1, int(self.h * self.min_outsample_fraction * self.n_series)
-            )
-
-            # Sample based on available conditions
-            available_idx = temporal_cols.get_loc("available_mask")
-            insample_condition = windows[:, : self.input_size, available_idx]
-            insample_condition = torch.sum(
-                insample_condition, axis=(1, -1)
-            )  # Sum over time & series dimension
-            final_condition = insample_condition >= min_insample_points
-
-            if self.h > 0:
-                outsample_condition = windows[:, self.input_size :, available_idx]
-                outsample_condition = torch.sum(
-                    outsample_condition, axis=(1, -1)
-                )  # Sum over time & series dimension
-                final_condition = (outsample_condition >= min_outsample_points) & (
-                    insample_condition >= min_insample_points
+                final_condition = self._available_windows(
+                    temporal, temporal_cols, window_starts
                 )
 
-            # Parse Static data to match windows
-            static = batch.get("static", None)
-            static_cols = batch.get("static_cols", None)
-
-            # Repeat static if univariate: [n_series, S] -> [Ws * n_series, S]
-            if static is not None and not self.MULTIVARIATE:
-                static = torch.repeat_interleave(
-                    static, repeats=windows_per_serie, dim=0
+            if self._warm_start is not None:
+                final_condition = self._warm_start_windows(
+                    final_condition, window_starts, temporal.shape[-1]
                 )
 
             # Protection of empty windows
-            if final_condition.sum() == 0:
+            if len(final_condition) == 0:
                 raise Exception("No windows available for training")
 
-            final_condition = torch.nonzero(final_condition).squeeze(-1)
-
-            return windows, static, static_cols, final_condition, sample_weight_windows, temporal_cols
+            return temporal, window_starts, final_condition
 
         elif step in ["predict", "val"]:
 
@@ -955,6 +1086,55 @@ class BaseModel(pl.LightningModule):
             return final_condition
         return final_condition[self.global_rank :: world_size]
 
+    def _gather_train_windows(self, batch, temporal, window_starts, w_idxs_final):
+        """Gather the sampled training windows from the padded batch.
+
+        Only the `len(w_idxs_final)` windows selected in `training_step` are
+        copied, so the cost of a step does not depend on the length of the series.
+        """
+        temporal_cols = batch["temporal_cols"]
+        window_size = self.input_size + self.h
+        n_starts = len(window_starts)
+        window_range = torch.arange(window_size, device=temporal.device)
+
+        if self.MULTIVARIATE:
+            # [n_series, C, T] -> [n_series, C, Ws, L + h] -> [Ws, L + h, C, n_series]
+            time_idxs = window_starts[w_idxs_final].unsqueeze(-1) + window_range
+            windows = temporal[:, :, time_idxs].permute(2, 3, 1, 0)
+        else:
+            # [n_series, C, T] -> [Ws, L + h, C] -> [Ws, L + h, C, 1]
+            serie_idxs = torch.div(w_idxs_final, n_starts, rounding_mode="floor")
+            start_idxs = window_starts[w_idxs_final % n_starts]
+            time_idxs = start_idxs.unsqueeze(-1) + window_range
+            windows = temporal[serie_idxs.unsqueeze(-1), :, time_idxs]
+            windows = windows.unsqueeze(-1)
+
+        # Extract sample_weight so it is never seen by the model as a feature
+        if "sample_weight" in temporal_cols:
+            sw_idx = temporal_cols.get_loc("sample_weight")
+            # Aggregate mean over outsample horizon steps -> [Ws, 1, n_series]
+            sample_weight = windows[:, self.input_size :, sw_idx : sw_idx + 1, :].mean(
+                dim=1, keepdim=False
+            )
+            keep = [i for i in range(windows.shape[2]) if i != sw_idx]
+            windows = windows[:, :, keep, :]
+            temporal_cols = temporal_cols.delete(sw_idx)
+        else:
+            sample_weight = None
+
+        static = batch.get("static", None)
+        if static is not None and not self.MULTIVARIATE:
+            static = static[serie_idxs]
+
+        windows_batch = dict(
+            temporal=windows,
+            temporal_cols=temporal_cols,
+            static=static,
+            static_cols=batch.get("static_cols", None),
+            sample_weight=sample_weight,
+        )
+        return windows_batch
+
     def _sample_windows(
         self,
         windows_temporal,
@@ -983,6 +1163,64 @@ class BaseModel(pl.LightningModule):
         )
         return windows_batch
 
+    def _predict_windows(
+        self,
+        batch,
+        windows_temporal,
+        static,
+        static_cols,
+        temporal_cols,
+        w_idxs,
+        final_condition,
+    ):
+        # Normalized prediction windows. Models that build the same windows of a
+        # cached batch and scale them in the same way share them through the cache.
+        y_idx = batch["y_idx"]
+
+        def compute():
+            windows = self._sample_windows(
+                windows_temporal=windows_temporal,
+                static=static,
+                static_cols=static_cols,
+                temporal_cols=temporal_cols,
+                w_idxs=w_idxs,
+                final_condition=final_condition,
+            )
+            windows = self._normalization(windows=windows, y_idx=y_idx)
+            return windows, self.scaler.x_shift, self.scaler.x_scale
+
+        window_cache = getattr(self, "_window_cache", None)
+        if (
+            window_cache is None
+            or "cache_key" not in batch
+            or self.scaler.scaler_type == "revin"
+        ):
+            return compute()[0]
+        key = (
+            batch["cache_key"],
+            str(windows_temporal.device),
+            y_idx,
+            self.MULTIVARIATE,
+            self.input_size,
+            self.h,
+            self.test_size,
+            self.predict_step_size,
+            len(self.futr_exog_list) == 0,
+            self.scaler.scaler_type,
+            self.scaler.dim,
+            self.scaler.eps,
+            tuple(self._get_temporal_exogenous_cols(temporal_cols=temporal_cols)),
+            int(w_idxs[0]),
+            len(w_idxs),
+        )
+        windows, x_shift, x_scale = window_cache.windows(key, compute)
+        self.scaler.x_shift, self.scaler.x_scale = x_shift, x_scale
+        # the models get their own copy, the cached windows are never modified
+        windows = dict(windows, temporal=windows["temporal"].clone())
+        if windows["static"] is not None:
+            windows["static"] = windows["static"].clone()
+        return windows
+
     def _parse_windows(self, batch, windows):
         # windows: [Ws, L + h, C, n_series]
 
@@ -1084,7 +1322,7 @@ class BaseModel(pl.LightningModule):
             if isinstance(
                 self.valid_loss, (losses.sCRPS, losses.MQLoss, losses.HuberMQLoss)
             ):
-                _, _, quants = self.loss.sample(distr_args=distr_args)
+                _, quants = self.loss.predict_quantiles(distr_args=distr_args)
                 output = quants
                 output_from_scaled_distribution = True
             elif isinstance(self.valid_loss, losses.BasePointLoss):
@@ -1216,6 +1454,16 @@ class BaseModel(pl.LightningModule):
     def _predict_step_recurrent_batch(
         self, insample_y, insample_mask, futr_exog, hist_exog, stat_exog, y_idx
     ):
+        if getattr(self, "n_paths", None) and self.loss.is_distribution_output:
+            return self._predict_step_recurrent_paths(
+                insample_y=insample_y,
+                insample_mask=insample_mask,
+                futr_exog=futr_exog,
+                hist_exog=hist_exog,
+                stat_exog=stat_exog,
+                y_idx=y_idx,
+            )
+
         # Remember state in network and set horizon to 1
         self.rnn_state = None
         self.maintain_state = True
@@ -1280,6 +1528,133 @@ class BaseModel(pl.LightningModule):
 
         return y_hat
 
+    def _predict_step_recurrent_paths(
+        self, insample_y, insample_mask, futr_exog, hist_exog, stat_exog, y_idx
+    ):
+        # Ancestral sampling: the history is encoded once, then `n_paths` trajectories per
+        # window are decoded as an expanded batch, feeding back their own samples
+        n_paths = self.n_paths
+        y_loc, y_scale = self._get_loc_scale(y_idx)
+        windows_per_chunk = max(1, _PATHS_BATCH_SIZE // n_paths)
+        paths = []
+        for start in range(0, insample_y.shape[0], windows_per_chunk):
+            chunk = slice(start, start + windows_per_chunk)
+            paths.append(
+                self._decode_sample_paths(
+                    insample_y=insample_y[chunk],
+                    insample_mask=insample_mask[chunk],
+                    futr_exog=futr_exog[chunk] if self.futr_exog_size > 0 else None,
+                    hist_exog=hist_exog[chunk] if self.hist_exog_size > 0 else None,
+                    stat_exog=(
+                        stat_exog[chunk]
+                        if stat_exog is not None and not self.MULTIVARIATE
+                        else stat_exog
+                    ),
+                    y_loc=y_loc[chunk],
+                    y_scale=y_scale[chunk],
+                )
+            )
+        paths = torch.cat(paths, dim=0)
+
+        if getattr(self, "_return_paths", False):
+            # the paths themselves, [B, P, H, N] -> [B, H, N, P]
+            y_hat = paths.permute(0, 2, 3, 1)
+        else:
+            quantiles = self.loss.quantiles.to(paths.device, paths.dtype)
+            quants = _paths_quantiles(paths, quantiles)
+            # [B, Q, H, N] -> [B, H, N, Q]
+            quants = quants.permute(0, 2, 3, 1)
+            y_hat = torch.concat((paths.mean(dim=1).unsqueeze(-1), quants), dim=-1)
+
+        # Squeeze for univariate case
+        if not self.MULTIVARIATE:
+            y_hat = y_hat.squeeze(2)
+
+        return y_hat
+
+    def _decode_sample_paths(
+        self, insample_y, insample_mask, futr_exog, hist_exog, stat_exog, y_loc, y_scale
+    ):
+        """Decodes `n_paths` trajectories of each window, [B, P, H, N]."""
+        n_paths = self.n_paths
+        self.rnn_state = None
+        self.maintain_state = True
+        self.h = 1
+        distribution_kwargs = getattr(self.loss, "distribution_kwargs", {})
+
+        def sample_step(windows_batch, y_loc, y_scale, sample_shape):
+            output_batch = self.loss.domain_map(self(windows_batch))
+            distr_args = self.loss.scale_decouple(
+                output=output_batch, loc=y_loc, scale=y_scale
+            )
+            distr = self.loss.get_distribution(
+                distr_args=distr_args, **distribution_kwargs
+            )
+            return distr.sample(sample_shape)
+
+        def expand(tensor):
+            return tensor.repeat_interleave(n_paths, dim=0)
+
+        # First step from the history: [P, B, 1, N] -> [B * P, 1, N]
+        samples = sample_step(
+            dict(
+                insample_y=insample_y[:, : self.input_size],
+                insample_mask=insample_mask[:, : self.input_size],
+                futr_exog=(
+                    futr_exog[:, : self.input_size] if self.futr_exog_size > 0 else None
+                ),
+                hist_exog=(
+                    hist_exog[:, : self.input_size] if self.hist_exog_size > 0 else None
+                ),
+                stat_exog=stat_exog,
+            ),
+            y_loc,
+            y_scale,
+            sample_shape=(n_paths,),
+        )
+        samples = samples.transpose(0, 1).flatten(0, 1)
+
+        # The trajectories share the state of their window
+        self.rnn_state = _repeat_state(self.rnn_state, n_paths)
+        y_loc, y_scale = expand(y_loc), expand(y_scale)
+        if stat_exog is not None and not self.MULTIVARIATE:
+            stat_exog = expand(stat_exog)
+
+        paths = [samples]
+        for tau in range(1, self.predict_horizon):
+            hist_exog_current = None
+            if self.hist_exog_size > 0:
+                hist_exog_current = expand(
+                    hist_exog[:, self.input_size + tau - 1].unsqueeze(1)
+                )
+            futr_exog_current = None
+            if self.futr_exog_size > 0:
+                futr_exog_current = expand(
+                    futr_exog[:, self.input_size + tau - 1].unsqueeze(1)
+                )
+            samples = sample_step(
+                dict(
+                    insample_y=self.scaler.scaler(samples, y_loc, y_scale),
+                    insample_mask=None,
+                    futr_exog=futr_exog_current,
+                    hist_exog=hist_exog_current,
+                    stat_exog=stat_exog,
+                ),
+                y_loc,
+                y_scale,
+                sample_shape=(),
+            )
+            paths.append(samples)
+
+        # Reset state and horizon
+        self.maintain_state = False
+        self.rnn_state = None
+        self.h = self.horizon_backup
+
+        # [B * P, H, N] -> [B, P, H, N]
+        paths = torch.cat(paths, dim=1)
+        return paths.view(-1, n_paths, *paths.shape[1:])
+
     def _predict_step_recurrent_single(
         self, insample_y, insample_mask, hist_exog, futr_exog, stat_exog, y_idx
     ):
@@ -1294,6 +1669,10 @@ class BaseModel(pl.LightningModule):
 
         # Model Predictions
         output_batch_unmapped = self(windows_batch)
+        return self._recurrent_step_outputs(output_batch_unmapped, y_idx)
+
+    def _recurrent_step_outputs(self, output_batch_unmapped, y_idx):
+        # Predictions of a single recurrent step and the input of the next one
         output_batch = self.loss.domain_map(output_batch_unmapped)
 
         # Inverse normalization and sampling
@@ -1303,8 +1682,8 @@ class BaseModel(pl.LightningModule):
             distr_args = self.loss.scale_decouple(
                 output=output_batch, loc=y_loc, scale=y_scale
             )
-            # When predicting, we need to sample to get the quantiles. The mean is an attribute.
-            _, _, quants = self.loss.sample(
+            # The mean is fed back as input, the quantiles are only needed for the outputs
+            _, quants = self.loss.predict_quantiles(
                 distr_args=distr_args, num_samples=self.n_samples
             )
             mean = self.loss.distr_mean
@@ -1359,9 +1738,8 @@ class BaseModel(pl.LightningModule):
             distr_args = self.loss.scale_decouple(
                 output=output_batch, loc=y_loc, scale=y_scale
             )
-            # Normal mode: full distribution processing with sampling
-            _, sample_mean, quants = self.loss.sample(distr_args=distr_args)
-            y_hat = torch.concat((sample_mean, quants), axis=-1)
+            mean, quants = self.loss.predict_quantiles(distr_args=distr_args)
+            y_hat = torch.concat((mean.unsqueeze(-1), quants), axis=-1)
             
             if self.loss.return_params:
                 distr_args = torch.stack(distr_args, dim=-1)
@@ -1401,7 +1779,8 @@ class BaseModel(pl.LightningModule):
             w_idxs = torch.arange(
                 i * windows_batch_size, min((i + 1) * windows_batch_size, n_windows), device=windows_temporal.device
             )
-            windows = self._sample_windows(
+            windows = self._predict_windows(
+                batch=batch,
                 windows_temporal=windows_temporal,
                 static=static,
                 static_cols=static_cols,
@@ -1409,7 +1788,6 @@ class BaseModel(pl.LightningModule):
                 w_idxs=w_idxs,
                 final_condition=final_condition,
             )
-            windows = self._normalization(windows=windows, y_idx=y_idx)
 
             # Parse windows
             insample_y, insample_mask, _, _, hist_exog, futr_exog, stat_exog = (
@@ -1572,6 +1950,10 @@ class BaseModel(pl.LightningModule):
             total_test_size = self.test_size
             futr_temporal = batch["temporal"][:, :, -total_test_size + self.h :]
             batch["temporal"] = batch["temporal"][:, :, : -total_test_size + self.h]
+            if "cache_key" in batch:
+                # the predictions are written into the batch, which can't be shared
+                batch = {k: v for k, v in batch.items() if k != "cache_key"}
+                batch["temporal"] = batch["temporal"].clone()
             self.test_size = self.h
             
             # Initialize explanation storage if explaining
@@ -1692,7 +2074,8 @@ class BaseModel(pl.LightningModule):
                 w_idxs = torch.arange(
                     i * windows_batch_size, min((i + 1) * windows_batch_size, n_windows), device=windows_temporal.device
                 )
-                windows = self._sample_windows(
+                windows = self._predict_windows(
+                    batch=batch,
                     windows_temporal=windows_temporal,
                     static=static,
                     static_cols=static_cols,
@@ -1700,7 +2083,6 @@ class BaseModel(pl.LightningModule):
                     w_idxs=w_idxs,
                     final_condition=final_condition,
                 )
-                windows = self._normalization(windows=windows, y_idx=y_idx)
 
                 # Parse windows
                 insample_y, insample_mask, _, _, hist_exog, futr_exog, stat_exog = (
@@ -1793,8 +2175,8 @@ class BaseModel(pl.LightningModule):
         # windows: [Ws, L + h, C, n_series] or [Ws, L + h, C]
         y_idx = batch["y_idx"]
 
-        windows_temporal, static, static_cols, final_condition, sample_weight_windows, temporal_cols = (
-            self._create_windows(batch, step="train")
+        temporal, window_starts, final_condition = self._create_windows(
+            batch, step="train"
         )
         final_condition = self._shard_multivariate_windows(final_condition)
         n_windows = len(final_condition)
@@ -1804,22 +2186,19 @@ class BaseModel(pl.LightningModule):
                     0,
                     n_windows,
                     size=(self.windows_batch_size,),
-                    device=windows_temporal.device,
+                    device=temporal.device,
                 )
             else:
-                w_idxs = torch.randperm(n_windows, device=windows_temporal.device)[
+                w_idxs = torch.randperm(n_windows, device=temporal.device)[
                     : self.windows_batch_size
                 ]
         else:
-            w_idxs = torch.arange(n_windows, device=windows_temporal.device)
-        windows = self._sample_windows(
-            windows_temporal=windows_temporal,
-            static=static,
-            static_cols=static_cols,
-            temporal_cols=temporal_cols,
-            w_idxs=w_idxs,
-            final_condition=final_condition,
-            sample_weight=sample_weight_windows,
+            w_idxs = torch.arange(n_windows, device=temporal.device)
+        windows = self._gather_train_windows(
+            batch=batch,
+            temporal=temporal,
+            window_starts=window_starts,
+            w_idxs_final=final_condition[w_idxs],
         )
         original_outsample_y = torch.clone(
             windows["temporal"][:, self.input_size :, y_idx]
@@ -2040,6 +2419,61 @@ class BaseModel(pl.LightningModule):
             distributed_config=distributed_config,
         )
 
+    def refit(
+        self,
+        dataset,
+        new_size,
+        max_steps,
+        replay_fraction=0.0,
+        val_size=0,
+        test_size=0,
+        random_seed=None,
+    ):
+        """Refit.
+
+        Continues the training of a fitted model after `new_size` observations
+        were added at the end of each serie. The model trains for `max_steps`
+        on the windows whose outsample contains new observations and on a
+        `replay_fraction` random sample of the older windows. When the previous
+        fit kept its optimizer state, the optimizer and the learning rate
+        schedule continue from it.
+
+        Args:
+            dataset (TimeSeriesDataset): NeuralForecast's `TimeSeriesDataset`, see [documentation](./tsdataset.html).
+            new_size (int): Number of new observations at the end of the training data of each serie.
+            max_steps (int): Maximum number of training steps of the refit.
+            replay_fraction (float): Fraction of the older windows that are trained on again.
+            val_size (int): Validation size for temporal cross-validation.
+            test_size (int): Test size for temporal cross-validation.
+            random_seed (int): Random seed for pytorch initializer and numpy generators, overwrites model.__init__'s.
+
+        Returns:
+            None
+        """
+        if new_size < 1:
+            raise ValueError(f"new_size must be positive, got {new_size}.")
+        if not 0.0 <= replay_fraction <= 1.0:
+            raise ValueError(
+                f"replay_fraction must be between 0.0 and 1.0, got {replay_fraction}"
+            )
+        init_max_steps = self.max_steps
+        self.max_steps = max_steps
+        self.trainer_kwargs["max_steps"] = max_steps
+        self._warm_start = _WarmStart(
+            new_size=new_size, replay_fraction=replay_fraction
+        )
+        try:
+            return self.fit(
+                dataset=dataset,
+                val_size=val_size,
+                test_size=test_size,
+                random_seed=random_seed,
+            )
+        finally:
+            self.max_steps = init_max_steps
+            self.trainer_kwargs["max_steps"] = init_max_steps
+            self._warm_start = None
+
     def predict(
         self,
         dataset,
@@ -2049,6 +2483,7 @@ class BaseModel(pl.LightningModule):
         quantiles=None,
         h=None,
         explainer_config=None,
+        n_paths=None,
         **data_module_kwargs,
     ):
         """Predict.
@@ -2063,6 +2498,9 @@ class BaseModel(pl.LightningModule):
             quantiles (list): Target quantiles to predict.
             h (int): Prediction horizon, if None, uses the model's fitted horizon. Defaults to None.
             explainer_config (dict): configuration for explanations.
+            n_paths (int): Number of sample paths decoded by recurrent models with a distribution loss.
+                Each path feeds back its own samples and the mean and quantiles are computed over the paths.
+                If None, the mean is fed back at every step. Other models raise when it's set. Defaults to None.
             **data_module_kwargs (dict): PL's TimeSeriesDataModule args, see [documentation](https://pytorch-lightning.readthedocs.io/en/1.6.1/extensions/datamodules.html#using-a-datamodule).
 
         Returns:
@@ -2082,15 +2520,130 @@ class BaseModel(pl.LightningModule):
 
         self.predict_step_size = step_size
         self.decompose_forecast = False
-
-        # Protect when case of multiple gpu. PL does not support return preds with multiple gpu.
-        pred_trainer_kwargs = self.trainer_kwargs.copy()
-        if (pred_trainer_kwargs.get("accelerator", None) == "gpu") and (
-            torch.cuda.device_count() > 1
+        if n_paths is not None and not (
+            self.RECURRENT and self.loss.is_distribution_output
         ):
-            pred_trainer_kwargs["devices"] = [0]
-            pred_trainer_kwargs["strategy"] = "auto"
+            raise Exception(
+                "Sample paths are only decoded by recurrent models with a distribution loss."
+            )
+        if self.RECURRENT:
+            if n_paths is not None and self.loss.return_params:
+                raise Exception("Sample paths don't support 'return_params=True'")
+            self.n_paths = n_paths
+
+        try:
+            # Protect when case of multiple gpu. PL does not support return preds with multiple gpu.
+            pred_trainer_kwargs = self.trainer_kwargs.copy()
+            if (pred_trainer_kwargs.get("accelerator", None) == "gpu") and (
+                torch.cuda.device_count() > 1
+            ):
+                pred_trainer_kwargs["devices"] = [0]
+                pred_trainer_kwargs["strategy"] = "auto"
+
+            self._set_predict_horizon(h)
 
+            # Explanations use the whole batch, keep its padding
+            if explainer_config is None:
+                data_module_kwargs.setdefault(
+                    "valid_padding", self._batch_padding(step="predict")
+                )
+            datamodule = TimeSeriesDataModule(
+                dataset=dataset,
+                valid_batch_size=self.valid_batch_size,
+                **data_module_kwargs,
+            )
+
+            # We need to re-enable grad for explanations
+            self.explain = explainer_config is not None
+            if self.explain:
+                pred_trainer_kwargs["inference_mode"] = False
+                self.explainer_config = explainer_config
+                trainer = pl.Trainer(**pred_trainer_kwargs)
+                out = trainer.predict(self, datamodule=datamodule)
+                fcsts = []
+                insample_explanations = []
+                futr_exog_explanations = []
+                hist_exog_explanations = []
+                stat_exog_explanations = []
+                baseline_predictions = []
+                for tensors in out:
+                    (
+                        fcst,
+                        insample_explanation,
+                        futr_exog_explanation,
+                        hist_exog_explanation,
+                        stat_exog_explanation,
+                        baseline_prediction
+                    ) = tensors
+                    fcsts.append(fcst)
+                    insample_explanations.append(insample_explanation)
+                    if self.futr_exog_list:
+                        futr_exog_explanations.append(futr_exog_explanation)
+                    if self.hist_exog_list:
+                        hist_exog_explanations.append(hist_exog_explanation)
+                    if self.stat_exog_list:
+                        stat_exog_explanations.append(stat_exog_explanation)
+                    baseline_predictions.append(baseline_prediction)
+
+                fcsts = torch.vstack(fcsts)
+                insample_explanations = torch.vstack(insample_explanations)
+                if futr_exog_explanations and futr_exog_explanations[0] is not None:
+                    futr_exog_explanations = torch.vstack(futr_exog_explanations)
+                else:
+                    futr_exog_explanations = None
+                if hist_exog_explanations and hist_exog_explanations[0] is not None:
+                    hist_exog_explanations = torch.vstack(hist_exog_explanations)
+                else:
+                    hist_exog_explanations = None
+                if stat_exog_explanations and stat_exog_explanations[0] is not None:
+                    stat_exog_explanations = torch.vstack(stat_exog_explanations)
+                else:
+                    stat_exog_explanations = None
+                if baseline_predictions and baseline_predictions[0] is not None:
+                    baseline_predictions = torch.vstack(baseline_predictions)
+                else:
+                    baseline_predictions = None
+                self.explanations = {
+                    'insample_explanations': insample_explanations,
+                    'futr_exog_explanations': futr_exog_explanations if futr_exog_explanations is not None else None,
+                    'hist_exog_explanations': hist_exog_explanations if hist_exog_explanations is not None else None,
+                    'stat_exog_explanations': stat_exog_explanations if stat_exog_explanations is not None else None,
+                    'baseline_predictions': baseline_predictions
+                }
+            else:
+                if (
+                    not hasattr(self, "_pred_trainer")
+                    or self._pred_trainer_kwargs != pred_trainer_kwargs
+                ):
+                    self._pred_trainer = pl.Trainer(**pred_trainer_kwargs)
+                    self._pred_trainer_kwargs = pred_trainer_kwargs
+                trainer = self._pred_trainer
+                # batches shared with the other models of a NeuralForecast prediction
+                dataloader = None
+                window_cache = getattr(self, "_window_cache", None)
+                if window_cache is not None and data_module_kwargs.keys() == {
+                    "valid_padding"
+                }:
+                    dataloader = window_cache.dataloader(
+                        dataset,
+                        batch_size=self.valid_batch_size,
+                        padding=data_module_kwargs["valid_padding"],
+                    )
+                if dataloader is not None:
+                    fcsts = trainer.predict(self, dataloaders=dataloader)
+                else:
+                    fcsts = trainer.predict(self, datamodule=datamodule)
+                fcsts = torch.vstack(fcsts)
+                self.explanations = None
+                if h is not None:
+                    fcsts = fcsts[:, :h]
+
+            return self._format_predictions(fcsts)
+        finally:
+            # the next predictions feed back the mean again
+            self.n_paths = None
+
+    def _set_predict_horizon(self, h):
         # Determine the number of predictions to make in case h > self.h
         if h is None:
             self.predict_horizon = self.horizon_backup
@@ -2107,82 +2660,16 @@ class BaseModel(pl.LightningModule):
             else:
                 self.h = h
 
-        datamodule = TimeSeriesDataModule(
-            dataset=dataset,
-            valid_batch_size=self.valid_batch_size,
-            **data_module_kwargs,
-        )
-
-        # We need to re-enable grad for explanations
-        self.explain = explainer_config is not None
-        if self.explain:
-            pred_trainer_kwargs["inference_mode"] = False
-            self.explainer_config = explainer_config
-            trainer = pl.Trainer(**pred_trainer_kwargs)
-            out = trainer.predict(self, datamodule=datamodule)
-            fcsts = []
-            insample_explanations = []
-            futr_exog_explanations = []
-            hist_exog_explanations = []
-            stat_exog_explanations = []
-            baseline_predictions = []
-            for tensors in out:
-                (
-                    fcst,
-                    insample_explanation,
-                    futr_exog_explanation,
-                    hist_exog_explanation,
-                    stat_exog_explanation,
-                    baseline_prediction
-                ) = tensors
-                fcsts.append(fcst)
-                insample_explanations.append(insample_explanation)
-                if self.futr_exog_list:
-                    futr_exog_explanations.append(futr_exog_explanation)
-                if self.hist_exog_list:
-                    hist_exog_explanations.append(hist_exog_explanation)
-                if self.stat_exog_list:
-                    stat_exog_explanations.append(stat_exog_explanation)
-                baseline_predictions.append(baseline_prediction)
+    def _reset_predict_horizon(self):
+        self.n_predicts = 1
+        self.h = self.horizon_backup
+        self.predict_horizon = self.horizon_backup
 
-            fcsts = torch.vstack(fcsts)
-            insample_explanations = torch.vstack(insample_explanations)
-            if futr_exog_explanations and futr_exog_explanations[0] is not None:
-                futr_exog_explanations = torch.vstack(futr_exog_explanations)
-            else:
-                futr_exog_explanations = None
-            if hist_exog_explanations and hist_exog_explanations[0] is not None:
-                hist_exog_explanations = torch.vstack(hist_exog_explanations)
-            else:
-                hist_exog_explanations = None
-            if stat_exog_explanations and stat_exog_explanations[0] is not None:
-                stat_exog_explanations = torch.vstack(stat_exog_explanations)
-            else:
-                stat_exog_explanations = None
-            if baseline_predictions and baseline_predictions[0] is not None:
-                baseline_predictions = torch.vstack(baseline_predictions)
-            else:
-                baseline_predictions = None
-            self.explanations = {
-                'insample_explanations': insample_explanations,
-                'futr_exog_explanations': futr_exog_explanations if futr_exog_explanations is not None else None,
-                'hist_exog_explanations': hist_exog_explanations if hist_exog_explanations is not None else None,
-                'stat_exog_explanations': stat_exog_explanations if stat_exog_explanations is not None else None,
-                'baseline_predictions': baseline_predictions
-            }
-        else:
-            if (
-                not hasattr(self, "_pred_trainer")
-                or self._pred_trainer_kwargs != pred_trainer_kwargs
-            ):
-                self._pred_trainer = pl.Trainer(**pred_trainer_kwargs)
-                self._pred_trainer_kwargs = pred_trainer_kwargs
-            trainer = self._pred_trainer
-            fcsts = trainer.predict(self, datamodule=datamodule)
-            fcsts = torch.vstack(fcsts)
-            self.explanations = None
-            if h is not None:
-                fcsts = fcsts[:, :h]
+    def _format_predictions(self, fcsts):
+        if getattr(self, "_return_paths", False):
+            self._reset_predict_horizon()
+            # [B, h, P] -> [B, P, h]
+            return tensor_to_numpy(fcsts).transpose(0, 2, 1)
 
         if self.MULTIVARIATE:
             # [B, h, n_series (, Q)] -> [n_series, B, h (, Q)]
@@ -2193,12 +2680,62 @@ class BaseModel(pl.LightningModule):
         fcsts = fcsts.reshape(-1, len(self.loss.output_names))
 
         # Reset n_predicts
-        self.n_predicts = 1
-        self.h = self.horizon_backup
-        self.predict_horizon = self.horizon_backup
+        self._reset_predict_horizon()
 
         return fcsts
 
+    def compile_predictor(self, batch_size=None, device=None):
+        """Compile Predictor.
+
+        Returns an inference engine that computes the same predictions as
+        `predict` without a Lightning `Trainer` nor a `DataLoader`. The model is
+        kept in eval mode and each call runs the prediction steps in a plain loop
+        under `torch.inference_mode`, which removes the per-call overhead of
+        `predict` for online serving of a few series.
+
+        Args:
+            batch_size (int): Number of series per prediction step, defaults to `valid_batch_size`.
+            device (str or torch.device): Device to move the model to, defaults to its current device.
+
+        Returns:
+            CompiledPredictor: callable with the arguments of `CompiledPredictor.predict`.
+        """
+        return CompiledPredictor(model=self, batch_size=batch_size, device=device)
+
+    def streaming_forecaster(
+        self,
+        freq,
+        id_col="unique_id",
+        time_col="ds",
+        target_col="y",
+        device=None,
+    ):
+        """Streaming Forecaster.
+
+        Returns a forecaster that keeps the recurrent state of each serie between
+        calls. `update` advances the states by the new observations only, and
+        `forecast` decodes the horizon from the stored states, so each new tick costs
+        O(new observations) instead of encoding the whole `inference_input_size` window.
+
+        Args:
+            freq (str or int): Frequency of the data, see [pandas' available frequencies](https://pandas.pydata.org/pandas-docs/stable/user_guide/timeseries.html#offset-aliases).
+            id_col (str): Column that identifies each serie. Defaults to 'unique_id'.
+            time_col (str): Column that identifies each timestep, its values can be timestamps or integers. Defaults to 'ds'.
+            target_col (str): Column that contains the target. Defaults to 'y'.
+            device (str or torch.device): Device to move the model to, defaults to its current device.
+
+        Returns:
+            StreamingForecaster: forecaster with `update` and `forecast` methods.
+        """
+        return StreamingForecaster(
+            model=self,
+            freq=freq,
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+            device=device,
+        )
+
     def simulate(
         self,
         dataset,
@@ -2214,7 +2751,9 @@ class BaseModel(pl.LightningModule):
         sample paths using the specified simulation method.
 
         Works with any loss that supports quantile output (``DistributionLoss``,
-        ``MQLoss``, etc.).
+        ``MQLoss``, etc.). Univariate recurrent models with a distribution loss
+        decode the paths instead, feeding back their own samples at every step,
+        so ``quantiles`` and ``method`` aren't used.
 
         Args:
             dataset (TimeSeriesDataset): NeuralForecast's ``TimeSeriesDataset``.
@@ -2244,6 +2783,19 @@ class BaseModel(pl.LightningModule):
         if quantiles is None:
             quantiles = DEFAULT_QUANTILE_GRID
 
+        if (
+            self.RECURRENT
+            and not self.MULTIVARIATE
+            and self.loss.is_distribution_output
+            and not self.loss.return_params
+        ):
+            return self._predict_sample_paths(
+                dataset=dataset,
+                n_paths=n_paths,
+                random_seed=random_seed,
+                **data_module_kwargs,
+            )
+
         # Determine quantile grid based on loss type
         if self.loss.is_distribution_output:
             # DistributionLoss/mixture: can produce arbitrary quantiles
@@ -2254,7 +2806,7 @@ class BaseModel(pl.LightningModule):
             predict_quantiles = None  # use model's built-in quantiles
             quantile_positions = self.loss.quantiles.cpu().numpy()
         elif isinstance(self.loss, (losses.IQLoss, losses.HuberIQLoss)):
-            # IQLoss: one forward pass per quantile, then take quantile over results
+            # IQLoss: predict a grid of quantiles, then take quantile over results
             predict_quantiles = None  # handled below
             quantile_positions = np.array(quantiles)
         else:
@@ -2266,19 +2818,14 @@ class BaseModel(pl.LightningModule):
 
         # Get quantile forecasts via existing predict infrastructure
         if isinstance(self.loss, (losses.IQLoss, losses.HuberIQLoss)):
-            # IQLoss: multiple forward passes, one per quantile in a grid
+            # IQLoss: predictions for every quantile in a grid
             iq_grid = [0.01, 0.05, 0.1, 0.2, 0.3, 0.5, 0.7, 0.8, 0.9, 0.95, 0.99]
-            iq_fcsts = []
-            for q in iq_grid:
-                f = self.predict(
-                    dataset=dataset,
-                    random_seed=random_seed,
-                    quantiles=[q],
-                    **data_module_kwargs,
-                )
-                iq_fcsts.append(f)
-            # Each f is (n_series * H, 1); stack along last axis
-            iq_all = np.concatenate(iq_fcsts, axis=-1)  # (n_series * H, len(iq_grid))
+            iq_all = self._predict_quantile_grid(
+                dataset=dataset,
+                quantiles=iq_grid,
+                random_seed=random_seed,
+                **data_module_kwargs,
+            )  # (n_series * H, len(iq_grid))
             # Interpolate to the requested quantile positions
             fcsts = np.quantile(iq_all, quantiles, axis=-1).T  # (n_series * H, n_quantiles)
             n_quantiles = len(quantile_positions)
@@ -2315,6 +2862,43 @@ class BaseModel(pl.LightningModule):
             method=method,
         )  # (n_series, n_paths, H)
 
+    def _predict_sample_paths(self, dataset, n_paths, **predict_kwargs):
+        """Sample paths decoded by a recurrent model with a distribution loss.
+
+        Returns:
+            np.ndarray: Array of shape (n_windows, n_paths, h).
+        """
+        self._return_paths = True
+        try:
+            return self.predict(dataset=dataset, n_paths=n_paths, **predict_kwargs)
+        finally:
+            self._return_paths = False
+
+    def _predict_quantile_grid(self, dataset, quantiles, h=None, **predict_kwargs):
+        """Predictions of an `IQLoss`/`HuberIQLoss` model for each of `quantiles`.
+
+        All the quantiles are evaluated in a single prediction. Recurrent models and
+        recursive predictions feed their predictions back to the network, so they
+        predict each quantile separately.
+
+        Returns:
+            np.ndarray: Array of shape (n_series * h, len(quantiles)).
+        """
+        try:
+            if not self.RECURRENT and (h is None or h <= self.h):
+                return self.predict(
+                    dataset=dataset, quantiles=quantiles, h=h, **predict_kwargs
+                )
+            fcsts = [
+                self.predict(dataset=dataset, quantiles=[q], h=h, **predict_kwargs)
+                for q in quantiles
+            ]
+            return np.concatenate(fcsts, axis=-1)
+        finally:
+            # a later fit must not see the [B, h, N, Q] outputs of the grid
+            self.loss.update_quantile()
+            self.loss.has_predicted = False
+
     def decompose(
         self,
         dataset,
@@ -2737,3 +3321,400 @@ class BaseModel(pl.LightningModule):
             stat_exog_explanations,
             baseline_predictions
         )
+
+
+class CompiledPredictor:
+    """Inference engine of a trained model, see `BaseModel.compile_predictor`.
+
+    The prediction steps of the model are run directly on batches built from a
+    `TimeSeriesDataset` or from a pre-padded tensor, with the same results as
+    `BaseModel.predict`.
+
+    Args:
+        model (BaseModel): trained model.
+        batch_size (int): Number of series per prediction step, defaults to the model's `valid_batch_size`.
+        device (str or torch.device): Device to move the model to, defaults to its current device.
+    """
+
+    def __init__(self, model, batch_size=None, device=None):
+        self.model = model
+        self.batch_size = model.valid_batch_size if batch_size is None else batch_size
+        if device is not None:
+            model.to(device)
+        model.eval()
+
+    def _to_device(self, batch):
+        device = self.model.device
+        return {
+            k: v.to(device) if isinstance(v, torch.Tensor) else v
+            for k, v in batch.items()
+        }
+
+    def _batches(self, data, temporal_cols, static, static_cols):
+        if isinstance(data, TimeSeriesDataset):
+            self.model._check_exog(data)
+            padding = self.model._batch_padding(step="predict")
+            for start in range(0, len(data), self.batch_size):
+                idxs = range(start, min(start + self.batch_size, len(data)))
+                yield data._get_batch(idxs, padding=padding)
+        elif isinstance(data, torch.Tensor):
+            if temporal_cols is None:
+                raise ValueError("temporal_cols is required to predict from a tensor.")
+            temporal_cols = pd.Index(temporal_cols)
+            if static is not None:
+                static_cols = pd.Index(static_cols)
+            self.model._check_exog(
+                SimpleNamespace(temporal_cols=temporal_cols, static_cols=static_cols)
+            )
+            for start in range(0, data.shape[0], self.batch_size):
+                batch = dict(
+                    temporal=data[start : start + self.batch_size],
+                    temporal_cols=temporal_cols,
+                    y_idx=0,
+                )
+                if static is not None:
+                    batch["static"] = static[start : start + self.batch_size]
+                    batch["static_cols"] = static_cols
+                yield batch
+        else:
+            raise ValueError(
+                f"Expected a TimeSeriesDataset or a torch.Tensor, got {type(data).__name__}."
+            )
+
+    def predict(
+        self,
+        data,
+        step_size=1,
+        h=None,
+        quantiles=None,
+        random_seed=None,
+        temporal_cols=None,
+        static=None,
+        static_cols=None,
+    ):
+        """Predict.
+
+        Args:
+            data (TimeSeriesDataset or torch.Tensor): NeuralForecast's `TimeSeriesDataset` or a left padded tensor of shape [n_series, n_temporal_cols, n_time] with the target as first column and an `available_mask` column, as in the batches of the `TimeSeriesDataset`.
+            step_size (int): Step size between each window.
+            h (int): Prediction horizon, if None, uses the model's fitted horizon. Defaults to None.
+            quantiles (list): Target quantiles to predict.
+            random_seed (int): Random seed for pytorch initializer and numpy generators, overwrites model.__init__'s.
+            temporal_cols (list): Names of the temporal columns of a tensor `data`.
+            static (torch.Tensor): Static features of a tensor `data`, of shape [n_series, n_static_cols].
+            static_cols (list): Names of the static columns.
+
+        Returns:
+            np.ndarray: the same array as `BaseModel.predict`.
+        """
+        model = self.model
+        model._restart_seed(random_seed)
+        model._set_quantiles(quantiles)
+        model.predict_step_size = step_size
+        model.decompose_forecast = False
+        model.explain = False
+        model._set_predict_horizon(h)
+        try:
+            fcsts = []
+            with torch.inference_mode():
+                batches = self._batches(data, temporal_cols, static, static_cols)
+                for batch_idx, batch in enumerate(batches):
+                    fcst = model.predict_step(self._to_device(batch), batch_idx)
+                    fcsts.append(fcst.cpu())
+        except Exception:
+            model._reset_predict_horizon()
+            raise
+        fcsts = torch.vstack(fcsts)
+        if h is not None:
+            fcsts = fcsts[:, :h]
+        return model._format_predictions(fcsts)
+
+    __call__ = predict
+
+
+class StreamingForecaster:
+    """Forecaster that keeps the state of a trained recurrent model, see `BaseModel.streaming_forecaster`.
+
+    The first time a serie is seen, its last `inference_input_size` observations are
+    encoded as in `BaseModel.predict`, and its recurrent state, the output of its last
+    step and its scaling statistics are stored. Later observations advance the stored
+    state step by step, scaled with the statistics of the first window, which are kept
+    fixed.
+
+    Args:
+        model (BaseModel): trained recurrent model.
+        freq (str or int): Frequency of the data.
+        id_col (str): Column that identifies each serie. Defaults to 'unique_id'.
+        time_col (str): Column that identifies each timestep. Defaults to 'ds'.
+        target_col (str): Column that contains the target. Defaults to 'y'.
+        device (str or torch.device): Device to move the model to, defaults to its current device.
+    """
+
+    def __init__(
+        self,
+        model,
+        freq,
+        id_col="unique_id",
+        time_col="ds",
+        target_col="y",
+        device=None,
+    ):
+        if not model.RECURRENT:
+            raise Exception(
+                f"{type(model).__name__} doesn't forecast recurrently, streaming requires a recurrent model."
+            )
+        if model.hist_exog_list or model.futr_exog_list:
+            raise Exception(
+                "Streaming doesn't support historic nor future exogenous features."
+            )
+        if model.scaler.scaler_type == "revin":
+            raise Exception("Streaming doesn't support the revin scaler.")
+        self.model = model
+        self.freq = freq
+        self.id_col = id_col
+        self.time_col = time_col
+        self.target_col = target_col
+        if device is not None:
+            model.to(device)
+        model.eval()
+
+        # per serie store, aligned with `uids`
+        self.uids = pd.Index([])
+        self.last_times = None
+        self._states = None  # recurrent state, [num_layers, n_series, hidden_size]
+        self._outputs = None  # network output of the last step, [n_series, 1, n_outputs]
+        self._loc = None  # [n_series, 1, 1]
+        self._scale = None  # [n_series, 1, 1]
+        self._static = None  # [n_series, n_static]
+
+    def _encode(self, insample_y, insample_mask, stat_exog, state):
+        model = self.model
+        model.rnn_state = state
+        model.maintain_state = True
+        model.h = 1
+        try:
+            output = model(
+                dict(
+                    insample_y=insample_y,
+                    insample_mask=insample_mask,
+                    futr_exog=None,
+                    hist_exog=None,
+                    stat_exog=stat_exog,
+                )
+            )
+            return output[:, -1:], model.rnn_state
+        finally:
+            model.maintain_state = False
+            model.rnn_state = None
+            model.h = model.horizon_backup
+
+    def _add_series(self, uids, y, indptr, last_times, static_df):
+        model = self.model
+        device = model.device
+        # left padded windows of the last `inference_input_size` observations
+        window_size = model.inference_input_size
+        ends = indptr[1:]
+        sizes = np.minimum(np.diff(indptr), window_size)
+        idxs = ends[:, None] - window_size + np.arange(window_size)
+        available = idxs >= (ends - sizes)[:, None]
+        temporal = np.where(available, y[np.maximum(idxs, 0)], 0.0)
+        # [n_series, L] -> [n_series, L, C, 1]
+        temporal = torch.from_numpy(temporal).to(device, torch.float32)[..., None, None]
+        mask = torch.from_numpy(available).to(device, torch.float32)[..., None, None]
+        insample_y = model.scaler.transform(x=temporal, mask=mask)[:, :, 0]
+        loc, scale = model._get_loc_scale(y_idx=0)
+
+        stat_exog = None
+        if model.stat_exog_list:
+            if static_df is None:
+                raise ValueError(
+                    "static_df is required to add new series to a model with static features."
+                )
+            static = static_df.set_index(self.id_col).loc[uids, model.stat_exog_list]
+            stat_exog = torch.from_numpy(static.to_numpy(np.float32)).to(device)
+
+        outputs, states = self._encode(insample_y, mask[:, :, 0], stat_exog, None)
+        if self._states is None:
+            self._states, self._outputs = states, outputs
+            self._loc, self._scale, self._static = loc, scale, stat_exog
+            self.last_times = last_times
+        else:
+            self._states = _map_state(
+                lambda old, new: torch.cat([old, new], dim=1), self._states, states
+            )
+            self._outputs = torch.cat([self._outputs, outputs])
+            self._loc = torch.cat([self._loc, loc])
+            self._scale = torch.cat([self._scale, scale])
+            if stat_exog is not None:
+                self._static = torch.cat([self._static, stat_exog])
+            self.last_times = np.concatenate([self.last_times, last_times])
+        self.uids = self.uids.append(pd.Index(uids))
+
+    def _advance(self, positions, y, indptr):
+        model = self.model
+        device = model.device
+        sizes = np.diff(indptr)
+        # series with the same number of new observations advance together
+        for size in np.unique(sizes):
+            group = np.flatnonzero(sizes == size)
+            values = y[indptr[group][:, None] + np.arange(size)]
+            pos = torch.from_numpy(positions[group]).to(device)
+            loc, scale = self._loc[pos], self._scale[pos]
+            x = torch.from_numpy(values).to(device, torch.float32).unsqueeze(-1)
+            insample_y = model.scaler.scaler(x, loc, scale)
+            stat_exog = None if self._static is None else self._static[pos]
+            outputs, states = self._encode(
+                insample_y,
+                torch.ones_like(insample_y),
+                stat_exog,
+                _map_state(lambda s: s[:, pos], self._states),
+            )
+            _map_state(
+                lambda store, new: store.index_copy_(1, pos, new), self._states, states
+            )
+            self._outputs[pos] = outputs
+
+    def _check_times(self, times, indptr, positions):
+        # the observations of a serie must follow each other, and its stored last time
+        times = times.reset_index(drop=True)
+        next_times = ufp.offset_times(times, self.freq, 1).to_numpy()
+        times = times.to_numpy()
+        follows = np.ones(len(times), dtype=bool)
+        follows[indptr[:-1]] = False
+        consecutive = times[1:] == next_times[:-1]
+        valid = np.append(True, consecutive | ~follows[1:])
+        seen = positions != -1
+        if seen.any():
+            expected = ufp.offset_times(
+                pd.Series(self.last_times[positions[seen]]), self.freq, 1
+            ).to_numpy()
+            valid[indptr[:-1][seen]] = times[indptr[:-1][seen]] == expected
+        if not valid.all():
+            rows = np.flatnonzero(~valid)
+            bad_series = np.unique(np.searchsorted(indptr, rows, side="right") - 1)
+            raise ValueError(
+                "The new observations must be consecutive at the frequency and follow the last "
+                f"time of their serie, found gaps or repeated times in {len(bad_series)} series."
+            )
+
+    def update(self, df, static_df=None):
+        """Advance the states with new observations.
+
+        Series that weren't seen before are encoded from the observations in `df`.
+        The observations of each serie must be consecutive at `freq`, start right after
+        its last time and have no missing values, since they can't be removed from the
+        states once added.
+
+        Args:
+            df (pandas.DataFrame): New observations with columns [`id_col`, `time_col`, `target_col`].
+            static_df (pandas.DataFrame): Static features of the new series, with the `id_col` column. Only needed by models with static features.
+
+        Returns:
+            StreamingForecaster: the updated forecaster.
+        """
+        df = df.sort_values([self.id_col, self.time_col])
+        sizes = df.groupby(self.id_col, sort=False, observed=True).size()
+        uids = sizes.index
+        sizes = sizes.to_numpy()
+        indptr = np.append(0, sizes.cumsum())
+        y = df[self.target_col].to_numpy(dtype=np.float32)
+        if np.isnan(y).any():
+            raise ValueError(f"Found missing values in {self.target_col}.")
+        last_times = df[self.time_col].to_numpy()[indptr[1:] - 1]
+
+        positions = self.uids.get_indexer(uids)
+        self._check_times(df[self.time_col], indptr, positions)
+        new = positions == -1
+        with torch.inference_mode():
+            if (~new).any():
+                self._advance(
+                    positions=positions[~new],
+                    y=y[np.repeat(~new, sizes)],
+                    indptr=np.append(0, sizes[~new].cumsum()),
+                )
+                self.last_times[positions[~new]] = last_times[~new]
+            if new.any():
+                self._add_series(
+                    uids=uids[new],
+                    y=y[np.repeat(new, sizes)],
+                    indptr=np.append(0, sizes[new].cumsum()),
+                    last_times=last_times[new],
+                    static_df=static_df,
+                )
+        return self
+
+    def forecast(self, h=None, ids=None, quantiles=None):
+        """Forecast from the stored states.
+
+        Args:
+            h (int): Forecast horizon, if None, uses the model's fitted horizon. Defaults to None.
+            ids (list): Series to forecast, defaults to all the stored series.
+            quantiles (list): Target quantiles to predict.
+
+        Returns:
+            pandas.DataFrame: DataFrame with the forecasts of the model.
+        """
+        if self._states is None:
+            raise Exception("No series have been added, call update first.")
+        model = self.model
+        h = model.horizon_backup if h is None else h
+        if ids is None:
+            uids = self.uids
+            pos = torch.arange(len(uids), device=model.device)
+        else:
+            uids = pd.Index(ids)
+            positions = self.uids.get_indexer(uids)
+            if (positions == -1).any():
+                missing = uids[positions == -1].tolist()
+                raise ValueError(f"The following ids haven't been added: {missing}")
+            pos = torch.from_numpy(positions).to(model.device)
+        model._set_quantiles(quantiles)
+        stat_exog = None if self._static is None else self._static[pos]
+
+        # _get_loc_scale reads [n_series, 1, C, 1] statistics from the scaler
+        scaler_stats = (
+            getattr(model.scaler, "x_shift", None),
+            getattr(model.scaler, "x_scale", None),
+        )
+        model.scaler.x_shift = self._loc[pos].unsqueeze(2)
+        model.scaler.x_scale = self._scale[pos].unsqueeze(2)
+        model.rnn_state = _map_state(lambda s: s[:, pos], self._states)
+        model.maintain_state = True
+        model.h = 1
+        try:
+            with torch.inference_mode():
+                y_hat, insample_y = model._recurrent_step_outputs(
+                    self._outputs[pos], y_idx=0
+                )
+                y_hats = [y_hat]
+                for _ in range(1, h):
+                    y_hat, insample_y = model._predict_step_recurrent_single(
+                        insample_y=insample_y,
+                        insample_mask=None,
+                        hist_exog=None,
+                        futr_exog=None,
+                        stat_exog=stat_exog,
+                        y_idx=0,
+                    )
+                    y_hats.append(y_hat)
+        finally:
+            model.maintain_state = False
+            model.rnn_state = None
+            model.h = model.horizon_backup
+            model.scaler.x_shift, model.scaler.x_scale = scaler_stats
+
+        # [n_series, h, 1, n_outputs] -> [n_series * h, n_outputs]
+        output_names = model.loss.output_names
+        fcsts = torch.stack(y_hats, dim=1).squeeze(2).reshape(-1, len(output_names))
+        fcsts_df = ufp.make_future_dataframe(
+            uids=uids,
+            last_times=self.last_times[pos.cpu().numpy()],
+            freq=self.freq,
+            h=h,
+            id_col=self.id_col,
+            time_col=self.time_col,
+        )
+        fcsts = tensor_to_numpy(fcsts)
+        for i, name in enumerate(output_names):
+            fcsts_df[repr(model) + name] = fcsts[:, i]
+        return fcsts_df
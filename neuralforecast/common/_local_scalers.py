@@ -0,0 +1,197 @@
+__all__ = ['scaled_temporal_cols', 'local_scalers_fit_transform', 'local_scalers_transform', 'local_scalers_inverse_transform']
+
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import torch
+from coreforecast.grouped_array import GroupedArray
+from coreforecast.scalers import (
+    LocalBoxCoxScaler,
+    LocalMinMaxScaler,
+    LocalRobustScaler,
+    LocalStandardScaler,
+)
+
+
+_type2scaler = {
+    "standard": LocalStandardScaler,
+    "robust": lambda: LocalRobustScaler(scale="mad"),
+    "robust-iqr": lambda: LocalRobustScaler(scale="iqr"),
+    "minmax": LocalMinMaxScaler,
+    "boxcox": lambda: LocalBoxCoxScaler(method="loglik", lower=0.0),
+}
+
+
+def scaled_temporal_cols(temporal_cols) -> Dict[str, int]:
+    """Position of the temporal columns that are scaled by the local scalers."""
+    return {
+        col: i
+        for i, col in enumerate(temporal_cols)
+        if col not in ("available_mask", "sample_weight")
+    }
+
+
+def _map_columns(fn: Callable, cols: List, num_threads: int) -> List:
+    # numpy reductions and torch ops release the GIL, so threads run in parallel
+    if num_threads > 1 and len(cols) > 1:
+        with ThreadPoolExecutor(min(num_threads, len(cols))) as executor:
+            return list(executor.map(fn, cols))
+    return [fn(col) for col in cols]
+
+
+def _offset_scale_stats(
+    data: np.ndarray, indptr: np.ndarray, scaler_type: str
+) -> np.ndarray:
+    """Per serie offset and scale of every column of `data` in one grouped pass.
+
+    Args:
+        data (np.ndarray): Values with shape [n_rows, n_cols].
+        indptr (np.ndarray): Boundaries of the series in the rows of `data`.
+        scaler_type (str): Either 'standard' or 'minmax'.
+
+    Returns:
+        np.ndarray: Statistics with shape [n_series, n_cols, 2].
+    """
+    starts = indptr[:-1]
+    dtype = data.dtype
+    if scaler_type == "minmax":
+        # fmin and fmax ignore missing values
+        offset = np.fmin.reduceat(data, starts, axis=0)
+        scale = np.fmax.reduceat(data, starts, axis=0) - offset
+        return np.stack([offset, scale], axis=-1)
+    nan_mask = np.isnan(data)
+    if nan_mask.any():
+        data = np.where(nan_mask, 0.0, data)
+        counts = np.add.reduceat(~nan_mask, starts, axis=0)
+    else:
+        counts = np.diff(indptr)[:, None]
+    # accumulate in float64 to keep the variance accurate
+    sums = np.add.reduceat(data, starts, axis=0, dtype=np.float64)
+    sq_sums = np.add.reduceat(np.square(data, dtype=np.float64), starts, axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = sums / counts
+        var = np.maximum(sq_sums / counts - mean**2, 0.0)
+    return np.stack([mean, np.sqrt(var)], axis=-1).astype(dtype)
+
+
+def _expand(stats: np.ndarray, sizes: np.ndarray) -> Tuple[torch.Tensor, torch.Tensor]:
+    offset, scale = torch.from_numpy(np.repeat(stats, sizes, axis=0)).unbind(-1)
+    # same as coreforecast, constant series are only shifted
+    scale = torch.where(scale.abs() < torch.finfo(scale.dtype).eps, 1.0, scale)
+    return offset, scale
+
+
+def local_scalers_fit_transform(
+    data: torch.Tensor,
+    indptr: np.ndarray,
+    cols: Dict[str, int],
+    scaler_type: str,
+    num_threads: int = 1,
+) -> Dict:
+    """Fit a local scaler to several columns and scale them in place.
+
+    The statistics of the 'standard' and 'minmax' scalers are computed for all the
+    columns at once, the other scalers are fitted column by column.
+
+    Args:
+        data (torch.Tensor): Values with shape [n_rows, n_cols], updated in place.
+        indptr (np.ndarray): Boundaries of the series in the rows of `data`.
+        cols (Dict[str, int]): Position in `data` of each column to scale.
+        scaler_type (str): Type of the local scaler.
+        num_threads (int): Number of threads used across columns. Defaults to 1.
+
+    Returns:
+        Dict: Fitted coreforecast scaler of each column.
+    """
+    if not cols:
+        return {}
+    names, idxs = list(cols.keys()), list(cols.values())
+    values = data.numpy()
+    scalers = {name: _type2scaler[scaler_type]() for name in names}
+    if scaler_type in ("standard", "minmax"):
+        chunks = np.array_split(np.arange(len(idxs)), min(num_threads, len(idxs)))
+        stats = np.concatenate(
+            _map_columns(
+                lambda chunk: _offset_scale_stats(
+                    values[:, [idxs[j] for j in chunk]], indptr, scaler_type
+                ),
+                chunks,
+                num_threads,
+            ),
+            axis=1,
+        )
+        for j, name in enumerate(names):
+            scalers[name].stats_ = np.ascontiguousarray(stats[:, j])
+    else:
+
+        def fit(j):
+            ga = GroupedArray(values[:, idxs[j]], indptr)
+            scalers[names[j]].fit(ga)
+
+        _map_columns(fit, list(range(len(names))), num_threads)
+    local_scalers_transform(data, indptr, cols, scalers, num_threads)
+    return scalers
+
+
+def local_scalers_transform(
+    data: torch.Tensor,
+    indptr: np.ndarray,
+    cols: Dict[str, int],
+    scalers: Dict,
+    num_threads: int = 1,
+) -> None:
+    """Scale several columns in place with fitted local scalers.
+
+    Args:
+        data (torch.Tensor): Values with shape [n_rows, n_cols], updated in place.
+        indptr (np.ndarray): Boundaries of the series in the rows of `data`.
+        cols (Dict[str, int]): Position in `data` of each column to scale.
+        scalers (Dict): Fitted coreforecast scaler of each column.
+        num_threads (int): Number of threads used across columns. Defaults to 1.
+    """
+    sizes = np.diff(indptr)
+
+    def transform(name):
+        i, scaler = cols[name], scalers[name]
+        if isinstance(scaler, LocalBoxCoxScaler):
+            ga = GroupedArray(data[:, i].numpy(), indptr)
+            data[:, i] = torch.from_numpy(scaler.transform(ga))
+            return
+        offset, scale = _expand(scaler.stats_, sizes)
+        data[:, i].sub_(offset).div_(scale)
+
+    _map_columns(transform, [name for name in cols if name in scalers], num_threads)
+
+
+def local_scalers_inverse_transform(
+    data: np.ndarray,
+    indptr: np.ndarray,
+    scaler,
+    num_threads: int = 1,
+) -> np.ndarray:
+    """Invert the scaling of every column of `data` with the same local scaler.
+
+    Args:
+        data (np.ndarray): Scaled values with shape [n_rows, n_cols], updated in place.
+        indptr (np.ndarray): Boundaries of the series in the rows of `data`.
+        scaler: Fitted coreforecast scaler.
+        num_threads (int): Number of threads used across columns. Defaults to 1.
+
+    Returns:
+        np.ndarray: Values in the original scale.
+    """
+    if isinstance(scaler, LocalBoxCoxScaler):
+        for i in range(data.shape[1]):
+            ga = GroupedArray(data[:, i], indptr)
+            data[:, i] = scaler.inverse_transform(ga)
+        return data
+    offset, scale = _expand(scaler.stats_.astype(data.dtype), np.diff(indptr))
+    out = torch.from_numpy(data)
+
+    def inverse_transform(i):
+        out[:, i].mul_(scale).add_(offset)
+
+    _map_columns(inverse_transform, list(range(data.shape[1])), num_threads)
+    return data
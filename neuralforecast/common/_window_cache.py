@@ -0,0 +1,126 @@
+__all__ = ['WindowCache']
+
+
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Tuple
+
+import torch
+from torch.utils.data import DataLoader
+
+from ..tsdataset import TimeSeriesDataset, _BatchPadding
+
+
+def _identity(batch):
+    return batch
+
+
+def _nbytes(obj) -> int:
+    if isinstance(obj, torch.Tensor):
+        return obj.nbytes
+    if isinstance(obj, dict):
+        return sum(_nbytes(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sum(_nbytes(v) for v in obj)
+    return 0
+
+
+class WindowCache:
+    """Prediction inputs shared by several models that predict the same dataset.
+
+    Keeps the padded batches of each dataset, and the normalized windows of each
+    batch for every distinct window configuration (input size, horizon, test size,
+    step size and scaler). The entries are evicted in least recently used order once
+    their tensors take more than `max_bytes`.
+
+    Args:
+        max_bytes (int): Maximum size in bytes of the cached tensors.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._n_builds = 0
+
+    def _get(self, key: Hashable):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def _put(self, key: Hashable, value) -> None:
+        nbytes = _nbytes(value)
+        if nbytes > self.max_bytes:
+            return
+        if key in self._entries:
+            self.nbytes -= self._entries.pop(key)[1]
+        self._entries[key] = (value, nbytes)
+        self.nbytes += nbytes
+        while self.nbytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.nbytes -= evicted
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.nbytes = 0
+
+    def dataloader(
+        self, dataset, batch_size: int, padding: _BatchPadding
+    ) -> Optional[DataLoader]:
+        """Loader over the cached prediction batches of `dataset`.
+
+        Batches padded beyond `padding.min_length` are reused, since prediction
+        windows are taken from the right of the series.
+
+        Args:
+            dataset (TimeSeriesDataset): Dataset to predict.
+            batch_size (int): Number of series per batch.
+            padding (_BatchPadding): Padding required by the model.
+
+        Returns:
+            DataLoader: Loader of the batches, or None if the dataset can't be cached.
+        """
+        if not isinstance(dataset, TimeSeriesDataset):
+            return None
+        key = ("batches", id(dataset), batch_size)
+        entry = self._get(key)
+        if entry is not None:
+            # the dataset is kept in the entry, so its id can't be reused
+            _, cached_padding, batches = entry
+            if not (
+                cached_padding.min_length >= padding.min_length
+                and cached_padding.left_margin == padding.left_margin
+                and cached_padding.alignment == padding.alignment
+            ):
+                entry = None
+        if entry is None:
+            self._n_builds += 1
+            batches = []
+            for i, start in enumerate(range(0, len(dataset), batch_size)):
+                idxs = list(range(start, min(start + batch_size, len(dataset))))
+                batch = dataset._get_batch(idxs, padding=padding)
+                # identifies the batch in the keys of its windows
+                batch["cache_key"] = (self._n_builds, i)
+                batches.append(batch)
+            self._put(key, (dataset, padding, batches))
+        return DataLoader(batches, batch_size=None, collate_fn=_identity)
+
+    def windows(
+        self, key: Tuple, compute: Callable[[], Tuple]
+    ) -> Tuple:
+        """Cached result of `compute`, which builds the normalized windows of a batch.
+
+        Args:
+            key (tuple): Batch and window configuration that determine the windows.
+            compute (Callable): Returns the windows and the scaler's shift and scale.
+
+        Returns:
+            tuple: Windows, shift and scale.
+        """
+        key = ("windows",) + key
+        value = self._get(key)
+        if value is None:
+            value = compute()
+            self._put(key, value)
+        return value
@@ -1,11 +1,16 @@
 __all__ = ['NeuralForecast']
 
 
+import os
 import pickle
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from copy import deepcopy
+from functools import partial, wraps
 from itertools import chain
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 import fsspec
 import numpy as np
@@ -14,12 +19,6 @@ import pytorch_lightning as pl
 import torch
 import utilsforecast.processing as ufp
 from coreforecast.grouped_array import GroupedArray
-from coreforecast.scalers import (
-    LocalBoxCoxScaler,
-    LocalMinMaxScaler,
-    LocalRobustScaler,
-    LocalStandardScaler,
-)
 from utilsforecast.compat import DataFrame, DFType, Series, pl_DataFrame, pl_Series
 from utilsforecast.validation import validate_freq
 from neuralforecast.common.enums import ExplainerEnum
@@ -65,6 +64,7 @@ from neuralforecast.tsdataset import (
     LocalFilesTimeSeriesDataset,
     TimeSeriesDataset,
     _FilesDataset,
+    _is_local_fs,
 )
 from neuralforecast.utils import (
     DEFAULT_QUANTILE_GRID,
@@ -77,7 +77,15 @@ from neuralforecast.utils import (
 )
 
 from .common._base_auto import BaseAuto, MockTrial
-from .common._base_model import DistributedConfig, MULTIQUANTILE_LOSSES
+from .common._base_model import BaseModel, DistributedConfig, MULTIQUANTILE_LOSSES
+from .common._window_cache import WindowCache
+from .common._local_scalers import (
+    _type2scaler,
+    local_scalers_fit_transform,
+    local_scalers_inverse_transform,
+    local_scalers_transform,
+    scaled_temporal_cols,
+)
 from .compat import SparkDataFrame
 from .losses.pytorch import HuberIQLoss, IQLoss, sCRPS
 
@@ -86,6 +94,137 @@ from .losses.pytorch import HuberIQLoss, IQLoss, sCRPS
 warnings.filterwarnings("ignore", category=pl.utilities.warnings.PossibleUserWarning)
 
 
+def _fit_model(model, dataset, val_size, test_size, n_threads):
+    # Runs in a worker process of `NeuralForecast.fit(n_jobs=...)`
+    torch.set_num_threads(n_threads)
+    return model.fit(dataset, val_size=val_size, test_size=test_size)
+
+
+def _load_model(path: str, model_file: str, alias_to_model: Dict[str, str], **kwargs):
+    model_name = "_".join(model_file.split("_")[:-1])
+    model_class_name = alias_to_model.get(model_name, model_name)
+    model = MODEL_FILENAME_DICT[model_class_name].load(f"{path}/{model_file}", **kwargs)
+    model.alias = model_name
+    return model
+
+
+def _model_nbytes(model) -> int:
+    tensors = chain(model.parameters(), model.buffers())
+    return sum(t.numel() * t.element_size() for t in tensors)
+
+
+class _LazyModels:
+    """Models of a saved `NeuralForecast` that are loaded on first access.
+
+    The loaded models are kept in a LRU cache holding at most `max_memory` bytes
+    of weights, evicted models are loaded again from their checkpoint when needed
+    with the test size they had. Models that are replaced, e.g. by fitting them,
+    are kept until they're replaced again. Models loaded while the models are
+    `pinned` are only evicted once the outermost `pinned` exits.
+
+    Args:
+        loaders (List[Callable]): Functions that load each model.
+        h (int): Forecast horizon of the models.
+        max_memory (int, optional): Memory budget in bytes for the loaded models.
+            Defaults to None, which keeps every loaded model.
+    """
+
+    def __init__(
+        self,
+        loaders: List[Callable[[], Any]],
+        h: int,
+        max_memory: Optional[int] = None,
+    ):
+        self._loaders = loaders
+        self.h = h
+        self.max_memory = max_memory
+        self._loaded: OrderedDict = OrderedDict()
+        self._nbytes: Dict[int, int] = {}
+        self._replaced: Dict[int, Any] = {}
+        self._test_sizes: Dict[int, int] = {}
+        self._pins = 0
+
+    def copy(self) -> "_LazyModels":
+        return _LazyModels(self._loaders, h=self.h, max_memory=self.max_memory)
+
+    def __len__(self) -> int:
+        return len(self._loaders)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def _index(self, idx: int) -> int:
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("model index out of range")
+        return idx
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        idx = self._index(idx)
+        if idx in self._replaced:
+            return self._replaced[idx]
+        if idx in self._loaded:
+            self._loaded.move_to_end(idx)
+            return self._loaded[idx]
+        model = self._loaders[idx]()
+        if idx in self._test_sizes:
+            model.set_test_size(self._test_sizes.pop(idx))
+        self._loaded[idx] = model
+        self._nbytes[idx] = _model_nbytes(model)
+        self._evict()
+        return model
+
+    def __setitem__(self, idx: int, model: Any) -> None:
+        idx = self._index(idx)
+        # a replaced model can't be loaded again from its checkpoint
+        self._loaded.pop(idx, None)
+        self._nbytes.pop(idx, None)
+        self._test_sizes.pop(idx, None)
+        self._replaced[idx] = model
+
+    def _evict(self) -> None:
+        if self.max_memory is None or self._pins:
+            return
+        total = sum(self._nbytes.values())
+        # the most recently used model is always kept
+        while total > self.max_memory and len(self._loaded) > 1:
+            idx, model = self._loaded.popitem(last=False)
+            total -= self._nbytes.pop(idx)
+            self._test_sizes[idx] = model.get_test_size()
+
+    @contextmanager
+    def pinned(self):
+        """Keep the models loaded during the context, so they're loaded at most once."""
+        self._pins += 1
+        try:
+            yield self
+        finally:
+            self._pins -= 1
+            self._evict()
+
+    @property
+    def loaded(self) -> List[int]:
+        """Indices of the models currently in memory."""
+        return sorted([*self._loaded, *self._replaced])
+
+
+def _pin_lazy_models(method):
+    # a lazy model is loaded at most once per call and keeps its state during it
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        models = getattr(self, "models", None)
+        if not isinstance(models, _LazyModels):
+            return method(self, *args, **kwargs)
+        with models.pinned():
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 def _insample_times(
     times: np.ndarray,
     uids: Series,
@@ -214,15 +353,6 @@ MODEL_FILENAME_DICT = {
 }
 
 
-_type2scaler = {
-    "standard": LocalStandardScaler,
-    "robust": lambda: LocalRobustScaler(scale="mad"),
-    "robust-iqr": lambda: LocalRobustScaler(scale="iqr"),
-    "minmax": LocalMinMaxScaler,
-    "boxcox": lambda: LocalBoxCoxScaler(method="loglik", lower=0.0),
-}
-
-
 class NeuralForecast:
     models: List[Any]
 
@@ -232,6 +362,8 @@ class NeuralForecast:
         freq: Union[str, int],
         local_scaler_type: Optional[str] = None,
         local_static_scaler_type: Optional[str] = None,
+        local_scaler_num_threads: int = 1,
+        window_cache_size: Optional[int] = 2**28,
     ):
         """The `core.StatsForecast` class allows you to efficiently fit multiple `NeuralForecast` models
         for large sets of time series. It operates with a pandas DataFrame `df` that identifies series
@@ -246,10 +378,40 @@ class NeuralForecast:
                 Can be 'standard', 'robust', 'robust-iqr', 'minmax' or 'boxcox'.
             local_static_scaler_type (str, optional): Scaler to apply to static exogenous features before fitting.
                 Can be 'standard', 'robust', 'robust-iqr', 'minmax' or 'boxcox'.
+            local_scaler_num_threads (int): Number of threads used to scale the columns
+                with the local scalers. Defaults to 1.
+            window_cache_size (int, optional): Maximum size in bytes of the prediction batches and
+                windows shared between the models during `predict`. Set to None to disable it. Defaults to 2**28.
 
         Returns:
             NeuralForecast: Returns instantiated `NeuralForecast` class.
         """
+        if isinstance(models, _LazyModels):
+            # the models were checked before they were saved
+            self.h = models.h
+        else:
+            self._check_models(models)
+            self.h = models[0].h
+        self.models_init = models
+        self.freq = freq
+        if local_scaler_type is not None and local_scaler_type not in _type2scaler:
+            raise ValueError(f"scaler_type must be one of {_type2scaler.keys()}")
+        if local_static_scaler_type is not None and local_static_scaler_type not in _type2scaler:
+            raise ValueError(f"static_scaler_type must be one of {_type2scaler.keys()}")
+        self.local_scaler_type = local_scaler_type
+        self.local_static_scaler_type = local_static_scaler_type
+        self.local_scaler_num_threads = local_scaler_num_threads
+        self.window_cache_size = window_cache_size
+        self.scalers_: Dict
+        self.static_scalers_: Dict
+
+        # Flags and attributes
+        self._fitted = False
+        self._reset_models()
+        self._add_level = False
+
+    @staticmethod
+    def _check_models(models: List[Any]) -> None:
         assert all(
             model.h == models[0].h for model in models
         ), "All models should have the same horizon"
@@ -274,77 +436,75 @@ class NeuralForecast:
                     f"Ensure both use the same `level` or `quantiles` argument."
                 )
 
-        self.h = models[0].h
-        self.models_init = models
-        self.freq = freq
-        if local_scaler_type is not None and local_scaler_type not in _type2scaler:
-            raise ValueError(f"scaler_type must be one of {_type2scaler.keys()}")
-        if local_static_scaler_type is not None and local_static_scaler_type not in _type2scaler:
-            raise ValueError(f"static_scaler_type must be one of {_type2scaler.keys()}")
-        self.local_scaler_type = local_scaler_type
-        self.local_static_scaler_type = local_static_scaler_type
-        self.scalers_: Dict
-        self.static_scalers_: Dict
-
-        # Flags and attributes
-        self._fitted = False
-        self._reset_models()
-        self._add_level = False
-
     def _scalers_fit_transform(self, dataset: TimeSeriesDataset) -> None:
         self.scalers_, self.static_scalers_ = {}, {}
         if self.local_scaler_type is not None:
-            for i, col in enumerate(dataset.temporal_cols):
-                if col in ("available_mask", "sample_weight"):
-                    continue
-                ga = GroupedArray(dataset.temporal[:, i].numpy(), dataset.indptr)
-                self.scalers_[col] = _type2scaler[self.local_scaler_type]().fit(ga)
-                dataset.temporal[:, i] = torch.from_numpy(self.scalers_[col].transform(ga))
+            self.scalers_ = local_scalers_fit_transform(
+                dataset.temporal,
+                dataset.indptr,
+                scaled_temporal_cols(dataset.temporal_cols),
+                scaler_type=self.local_scaler_type,
+                num_threads=self.local_scaler_num_threads,
+            )
         if self.local_static_scaler_type is not None and dataset.static is not None:
-            for i, col in enumerate(dataset.static_cols):
-                ga = GroupedArray(dataset.static[:, i].numpy(), np.array([0, dataset.static.shape[0]]))
-                self.static_scalers_[col] = _type2scaler[self.local_static_scaler_type]().fit(ga)
-                dataset.static[:, i] = torch.from_numpy(self.static_scalers_[col].transform(ga))
+            self.static_scalers_ = local_scalers_fit_transform(
+                dataset.static,
+                np.array([0, dataset.static.shape[0]]),
+                {col: i for i, col in enumerate(dataset.static_cols)},
+                scaler_type=self.local_static_scaler_type,
+                num_threads=self.local_scaler_num_threads,
+            )
 
     def _scalers_transform(self, dataset: TimeSeriesDataset) -> None:
         if self.scalers_:
-            for i, col in enumerate(dataset.temporal_cols):
-                scaler = self.scalers_.get(col, None)
-                if scaler is None:
-                    continue
-                ga = GroupedArray(dataset.temporal[:, i].numpy(), dataset.indptr)
-                dataset.temporal[:, i] = torch.from_numpy(scaler.transform(ga))
+            local_scalers_transform(
+                dataset.temporal,
+                dataset.indptr,
+                {col: i for i, col in enumerate(dataset.temporal_cols)},
+                self.scalers_,
+                num_threads=self.local_scaler_num_threads,
+            )
         if self.static_scalers_ and dataset.static is not None:
-            for i, col in enumerate(dataset.static_cols):
-                scaler = self.static_scalers_.get(col, None)
-                if scaler is None:
-                    continue
-                ga = GroupedArray(dataset.static[:, i].numpy(), np.array([0, dataset.static.shape[0]]))
-                dataset.static[:, i] = torch.from_numpy(scaler.transform(ga))
+            local_scalers_transform(
+                dataset.static,
+                np.array([0, dataset.static.shape[0]]),
+                {col: i for i, col in enumerate(dataset.static_cols)},
+                self.static_scalers_,
+                num_threads=self.local_scaler_num_threads,
+            )
 
     def _scalers_target_inverse_transform(
         self, data: np.ndarray, indptr: np.ndarray
     ) -> np.ndarray:
         if not self.scalers_:
             return data
-        for i in range(data.shape[1]):
-            ga = GroupedArray(data[:, i], indptr)
-            data[:, i] = self.scalers_[self.target_col].inverse_transform(ga)
-        return data
+        return local_scalers_inverse_transform(
+            data,
+            indptr,
+            self.scalers_[self.target_col],
+            num_threads=self.local_scaler_num_threads,
+        )
 
-    def _prepare_fit(self, df, static_df, id_col, time_col, target_col):
+    def _prepare_fit(self, df, static_df, id_col, time_col, target_col, n_jobs=1):
         # TODO: uids, last_dates and ds should be properties of the dataset class. See github issue.
         self.id_col = id_col
         self.time_col = time_col
         self.target_col = target_col
         self._check_nan(df, static_df, id_col, time_col, target_col)
 
+        # the dataset is read by other processes, building it in shared memory
+        # avoids copying it for them
+        share_memory = n_jobs != 1 or any(
+            (getattr(model, "dataloader_kwargs", None) or {}).get("num_workers", 0) > 0
+            for model in self.models
+        )
         dataset, uids, last_dates, ds = TimeSeriesDataset.from_df(
             df=df,
             static_df=static_df,
             id_col=id_col,
             time_col=time_col,
             target_col=target_col,
+            share_memory=share_memory,
         )
         self._scalers_fit_transform(dataset)
         return dataset, uids, last_dates, ds
@@ -396,11 +556,6 @@ class NeuralForecast:
             raise ValueError(
                 "Must set `distributed_config` when using a spark dataframe"
             )
-        if self.local_scaler_type is not None:
-            raise ValueError(
-                "Historic scaling isn't supported in distributed. "
-                "Please open an issue if this would be valuable to you."
-            )
         if self.local_static_scaler_type is not None:
             raise ValueError(
                 "Static scaling isn't supported in distributed. "
@@ -436,6 +591,7 @@ class NeuralForecast:
             time_col=time_col,
             target_col=target_col,
             min_size=df.groupBy(id_col).count().agg({"count": "min"}).first()[0],
+            local_scaler_type=self.local_scaler_type,
         )
 
     def _prepare_fit_for_local_files(
@@ -445,12 +601,8 @@ class NeuralForecast:
         id_col: str,
         time_col: str,
         target_col: str,
+        local_files_kwargs: Optional[Dict[str, Any]] = None,
     ):
-        if self.local_scaler_type is not None:
-            raise ValueError(
-                "Historic scaling isn't supported when the dataset is split between files. "
-                "Please open an issue if this would be valuable to you."
-            )
         if self.local_static_scaler_type is not None:
             raise ValueError(
                 "Static scaling isn't supported when the dataset is split between files. "
@@ -470,8 +622,11 @@ class NeuralForecast:
             id_col=id_col,
             time_col=time_col,
             target_col=target_col,
+            local_scaler_type=self.local_scaler_type,
+            **(local_files_kwargs or {}),
         )
 
+    @_pin_lazy_models
     def fit(
         self,
         df: Optional[Union[DataFrame, SparkDataFrame, Sequence[str]]] = None,
@@ -485,6 +640,8 @@ class NeuralForecast:
         target_col: str = "y",
         distributed_config: Optional[DistributedConfig] = None,
         prediction_intervals: Optional[PredictionIntervals] = None,
+        local_files_kwargs: Optional[Dict[str, Any]] = None,
+        n_jobs: int = 1,
     ) -> None:
         """Fit the core.NeuralForecast
 
@@ -509,6 +666,14 @@ class NeuralForecast:
             target_col (str): Column that contains the target.
             distributed_config (neuralforecast.DistributedConfig): Configuration to use for DDP training. Currently only spark is supported.
             prediction_intervals (PredictionIntervals, optional): Configuration to calibrate prediction intervals (Conformal Prediction).
+            local_files_kwargs (dict, optional): Keyword arguments for `LocalFilesTimeSeriesDataset.from_data_directories`
+                when `df` is a list of directories, e.g. `cache_size` or `cache_dir` to cache the decoded series.
+            n_jobs (int, optional): Number of processes used to fit the models concurrently, -1 uses all the CPUs.
+                The dataset is shared with the processes through shared memory and each model keeps its own
+                random seed, so the fitted models are the same as when fitting them one after another.
+                Auto models and distributed or local files datasets are always fitted sequentially.
+                Processes are started with `spawn`, so the calling script must be guarded by
+                `if __name__ == "__main__"`. Defaults to 1.
 
         Returns:
             NeuralForecast: Returns `NeuralForecast` class with fitted `models`.
@@ -525,6 +690,17 @@ class NeuralForecast:
         if val_df is not None and not isinstance(val_df, (pd.DataFrame, pl_DataFrame)):
             raise ValueError("val_df must be a pandas or polars DataFrame.")
 
+        if (
+            val_df is not None
+            and prediction_intervals is not None
+            and prediction_intervals.calibration == "holdout"
+        ):
+            # the holdout windows would be taken from the rows of val_df
+            raise ValueError(
+                "The holdout calibration can't be used with val_df. "
+                "Use val_size or calibration='cross_validation' instead."
+            )
+
         # Model and datasets interactions protections
         if (
             any(model.early_stop_patience_steps > 0 for model in self.models)
@@ -538,7 +714,7 @@ class NeuralForecast:
                 f"val_size must be either 0 or greater than or equal to the horizon: {self.h}"
             )
 
-        self._cs_df: Optional[DataFrame] = None
+        self._cs_scores: Optional[Dict[str, np.ndarray]] = None
         self.prediction_intervals: Optional[PredictionIntervals] = None
 
         # Process and save new dataset (in self)
@@ -550,6 +726,7 @@ class NeuralForecast:
                 id_col=id_col,
                 time_col=time_col,
                 target_col=target_col,
+                n_jobs=n_jobs,
             )
             if prediction_intervals is not None:
                 self.prediction_intervals = prediction_intervals
@@ -563,14 +740,19 @@ class NeuralForecast:
                         time_col=time_col,
                         target_col=target_col,
                     ).min_size
-                self._cs_df = self._conformity_scores(
-                    df=df,
-                    id_col=id_col,
-                    time_col=time_col,
-                    target_col=target_col,
-                    static_df=static_df,
-                    val_size=conformal_val_size,
-                )
+                if prediction_intervals.calibration == "cross_validation":
+                    self._cs_scores = self._conformity_scores(
+                        df=df,
+                        id_col=id_col,
+                        time_col=time_col,
+                        target_col=target_col,
+                        static_df=static_df,
+                        val_size=conformal_val_size,
+                    )
+                else:
+                    # The holdout calibration scores the final models after fitting
+                    # them, check that the series are long enough before
+                    self._check_conformity_size(self.dataset.min_size, val_size or 0)
 
         elif isinstance(df, SparkDataFrame):
             if static_df is not None and not isinstance(static_df, SparkDataFrame):
@@ -602,6 +784,7 @@ class NeuralForecast:
                 id_col=id_col,
                 time_col=time_col,
                 target_col=target_col,
+                local_files_kwargs=local_files_kwargs,
             )
             self.uids = self.dataset.indices
             self.last_dates = self.dataset.last_times
@@ -647,20 +830,7 @@ class NeuralForecast:
                     "Validation set size is larger than the shorter time-series."
                 )
 
-        for model in self.models:
-            input_size = getattr(model, "input_size", None)
-            if input_size is None:
-                continue  # Auto models have a tunable input_size; skip validation
-            train_size = self.dataset.min_size - (val_size or 0)
-            start_padding_enabled = getattr(model, "start_padding_enabled", False)
-            min_required = 1 if start_padding_enabled else input_size
-            if train_size < min_required:
-                raise ValueError(
-                    f"{model.__class__.__name__} requires at least {min_required} training "
-                    f"timestamp(s) (input_size={input_size}, start_padding_enabled="
-                    f"{start_padding_enabled}), but the shortest series has only "
-                    f"{train_size} timestamp(s) available for training after removing val_size."
-                )
+        self._check_train_size(self.dataset.min_size - (val_size or 0))
 
         # `_conformity_scores` (above) already ran the Auto* search and left the
         # results on the current models. Capture them before any reset so the search
@@ -674,10 +844,41 @@ class NeuralForecast:
         if use_init_models:
             self._reset_models()
 
+        # The holdout calibration keeps the last windows out of the training
+        holdout_size = 0
+        if (
+            self.prediction_intervals is not None
+            and self.prediction_intervals.calibration == "holdout"
+        ):
+            holdout_size = self.h + self.prediction_intervals.step_size * (
+                self.prediction_intervals.n_windows - 1
+            )
+
+        concurrent_idxs = []
+        if (
+            n_jobs != 1
+            and isinstance(self.dataset, TimeSeriesDataset)
+            and distributed_config is None
+        ):
+            concurrent_idxs = [
+                i for i, model in enumerate(self.models) if not isinstance(model, BaseAuto)
+            ]
+        if len(concurrent_idxs) > 1:
+            self._fit_models_concurrently(
+                concurrent_idxs,
+                val_size=val_size,
+                test_size=holdout_size,
+                n_jobs=n_jobs,
+            )
+        else:
+            concurrent_idxs = []
+
         # When `_conformity_scores` has already run the Auto* search, mark the
         # Auto* models so the search is reused instead of rerunning on the full dataset.
-        reuse_auto_search = self._cs_df is not None
+        reuse_auto_search = self._cs_scores is not None
         for i, model in enumerate(self.models):
+            if i in concurrent_idxs:
+                continue
             if reuse_auto_search and isinstance(model, BaseAuto):
                 # `_reset_models` swaps in fresh clones without results; restore the
                 # captured search results so the reuse guard in BaseAuto.fit passes.
@@ -686,13 +887,74 @@ class NeuralForecast:
                 model._reuse_search = True
             try:
                 self.models[i] = model.fit(
-                    self.dataset, val_size=val_size, distributed_config=distributed_config
+                    self.dataset,
+                    val_size=val_size,
+                    test_size=holdout_size,
+                    distributed_config=distributed_config,
                 )
             finally:
                 if isinstance(model, BaseAuto):
                     model._reuse_search = False
 
         self._fitted = True
+        if holdout_size:
+            self._cs_scores = self._conformity_scores(
+                df=df,
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+                static_df=static_df,
+                val_size=val_size,
+                use_fitted=True,
+            )
+            for model in self.models:
+                model.set_test_size(0)
+
+    def _check_train_size(self, train_size: int) -> None:
+        for model in self.models:
+            input_size = getattr(model, "input_size", None)
+            if input_size is None:
+                continue  # Auto models have a tunable input_size; skip validation
+            start_padding_enabled = getattr(model, "start_padding_enabled", False)
+            min_required = 1 if start_padding_enabled else input_size
+            if train_size < min_required:
+                raise ValueError(
+                    f"{model.__class__.__name__} requires at least {min_required} training "
+                    f"timestamp(s) (input_size={input_size}, start_padding_enabled="
+                    f"{start_padding_enabled}), but the shortest series has only "
+                    f"{train_size} timestamp(s) available for training after removing val_size."
+                )
+
+    def _fit_models_concurrently(
+        self, idxs: List[int], val_size: int, test_size: int, n_jobs: int
+    ):
+        import torch.multiprocessing as mp
+
+        n_cpus = os.cpu_count() or 1
+        n_jobs = min(len(idxs), n_cpus if n_jobs == -1 else n_jobs)
+        n_threads = max(torch.get_num_threads() // n_jobs, 1)
+
+        # Move the tensors to shared memory, the workers receive a handle to them
+        # instead of a copy of the data
+        self.dataset.share_memory()
+
+        with ProcessPoolExecutor(
+            max_workers=n_jobs, mp_context=mp.get_context("spawn")
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _fit_model,
+                    self.models[i],
+                    self.dataset,
+                    val_size,
+                    test_size,
+                    n_threads,
+                )
+                for i in idxs
+            ]
+            # keep the models in their original positions
+            for i, future in zip(idxs, futures):
+                self.models[i] = future.result()
 
     def make_future_dataframe(
         self, df: Optional[DFType] = None, h: Optional[int] = None
@@ -825,6 +1087,7 @@ class NeuralForecast:
             futr_exog_cols,
             models,
             freq,
+            local_scaler_type,
             id_col,
             time_col,
             target_col,
@@ -832,11 +1095,15 @@ class NeuralForecast:
         ) -> pd.DataFrame:
             from neuralforecast import NeuralForecast
 
-            nf = NeuralForecast(models=models, freq=freq)
+            # each partition holds complete series, so the local scalers fitted
+            # on it are the same ones used during training
+            nf = NeuralForecast(
+                models=models, freq=freq, local_scaler_type=local_scaler_type
+            )
             nf.id_col = id_col
             nf.time_col = time_col
             nf.target_col = target_col
-            nf.scalers_ = {}
+            nf.scalers_, nf.static_scalers_ = {}, {}
             nf._fitted = True
             if futr_exog_cols:
                 # if we have futr_exog we'll have extra rows with the future values
@@ -917,6 +1184,7 @@ class NeuralForecast:
                 futr_exog_cols=list(self._get_needed_futr_exog()),
                 models=self.models,
                 freq=self.freq,
+                local_scaler_type=self.local_scaler_type,
                 id_col=self.id_col,
                 time_col=self.time_col,
                 target_col=self.target_col,
@@ -924,6 +1192,7 @@ class NeuralForecast:
             ),
         )
 
+    @_pin_lazy_models
     def predict(
         self,
         df: Optional[Union[DataFrame, SparkDataFrame]] = None,
@@ -1155,6 +1424,7 @@ class NeuralForecast:
             futr_exog_cols,
             models,
             freq,
+            local_scaler_type,
             id_col,
             time_col,
             target_col,
@@ -1166,11 +1436,13 @@ class NeuralForecast:
         ) -> pd.DataFrame:
             from neuralforecast import NeuralForecast
 
-            nf = NeuralForecast(models=models, freq=freq)
+            nf = NeuralForecast(
+                models=models, freq=freq, local_scaler_type=local_scaler_type
+            )
             nf.id_col = id_col
             nf.time_col = time_col
             nf.target_col = target_col
-            nf.scalers_ = {}
+            nf.scalers_, nf.static_scalers_ = {}, {}
             nf._fitted = True
             if futr_exog_cols:
                 futr_rows = df[target_col].isnull()
@@ -1256,6 +1528,7 @@ class NeuralForecast:
                 futr_exog_cols=list(self._get_needed_futr_exog()),
                 models=self.models,
                 freq=self.freq,
+                local_scaler_type=self.local_scaler_type,
                 id_col=self.id_col,
                 time_col=self.time_col,
                 target_col=self.target_col,
@@ -1305,7 +1578,7 @@ class NeuralForecast:
         )
         fcsts_with_intervals, _ = prediction_interval_method(
             point_fcsts,
-            self._cs_df,
+            self._cs_scores,
             model=model_name,
             cs_n_windows=self.prediction_intervals.n_windows,
             n_series=n_series,
@@ -1328,6 +1601,7 @@ class NeuralForecast:
             method=method,
         )  # (n_series, n_paths, H)
 
+    @_pin_lazy_models
     def simulate(
         self,
         df: Optional[Union[DataFrame, SparkDataFrame]] = None,
@@ -1557,6 +1831,7 @@ class NeuralForecast:
             return pl_mod.from_pandas(tiled)
         return tiled
 
+    @_pin_lazy_models
     def explain(
         self,
         horizons: Optional[list[int]] = None,
@@ -1801,7 +2076,11 @@ class NeuralForecast:
         return fcsts_df, explanations
 
     def _reset_models(self):
-        self.models = [deepcopy(model) for model in self.models_init]
+        if isinstance(self.models_init, _LazyModels):
+            # the models are loaded again from their checkpoints
+            self.models = self.models_init.copy()
+        else:
+            self.models = [deepcopy(model) for model in self.models_init]
         if self._fitted:
             warnings.warn(
                 "Deleting previously fitted models because `use_init_models=True` "
@@ -1984,6 +2263,148 @@ class NeuralForecast:
                 for attr, value in _snapshot.items():
                     setattr(self, attr, value)
 
+    def _refit_cross_validation(
+        self,
+        df: DataFrame,
+        static_df: Optional[DataFrame],
+        n_windows: int,
+        step_size: int,
+        val_size: Optional[int],
+        test_size: int,
+        refit: Union[bool, int],
+        refit_max_steps: Optional[int],
+        refit_replay_fraction: float,
+        verbose: bool,
+        id_col: str,
+        time_col: str,
+        target_col: str,
+        h: int,
+        **data_kwargs,
+    ) -> DataFrame:
+        # The dataset is processed once. Each refit trains the models on the series
+        # trimmed from the right through the models' test_size, as the cross
+        # validation without refit does, and predicts its windows from the same data.
+        if (
+            any(model.early_stop_patience_steps > 0 for model in self.models)
+            and val_size == 0
+        ):
+            raise Exception("Set val_size>0 or provide a val_df if early stopping is enabled.")
+        if (val_size is not None) and (0 < val_size < self.h):
+            raise ValueError(
+                f"val_size must be either 0 or greater than or equal to the horizon: {self.h}"
+            )
+        validate_freq(df[time_col], self.freq)
+        self._cs_scores = None
+        self.prediction_intervals = None
+        dataset, uids, last_dates, ds = self._prepare_fit(
+            df=df,
+            static_df=static_df,
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+        )
+        # the first refit has the shortest training data
+        self._check_train_size(dataset.min_size - (val_size or 0) - test_size)
+
+        # Warm started models continue from the previous refit, training on the
+        # windows with new observations
+        warm_start = [
+            refit_max_steps is not None and isinstance(model, BaseModel)
+            for model in self.models
+        ]
+        fcsts_list: List[List[np.ndarray]] = [[] for _ in self.models]
+        try:
+            for first_window in range(0, n_windows, int(refit)):
+                n_refit_windows = min(int(refit), n_windows - first_window)
+                refit_test_size = test_size - first_window * step_size
+                if verbose:
+                    print(
+                        f"Fitting the models for windows {first_window + 1} to "
+                        f"{first_window + n_refit_windows} of {n_windows}."
+                    )
+                for i, model in enumerate(self.models):
+                    if warm_start[i] and first_window > 0:
+                        self.models[i] = model.refit(
+                            dataset=dataset,
+                            new_size=int(refit) * step_size,
+                            max_steps=refit_max_steps,
+                            replay_fraction=refit_replay_fraction,
+                            val_size=val_size,
+                            test_size=refit_test_size,
+                        )
+                    else:
+                        if warm_start[i]:
+                            model._keep_optimizer_state = True
+                        self.models[i] = model.fit(
+                            dataset=dataset,
+                            val_size=val_size,
+                            test_size=refit_test_size,
+                        )
+                    model_fcsts = self.models[i].predict(
+                        dataset, step_size=step_size, h=h, **data_kwargs
+                    )
+                    # every serie predicts the windows of the following refits too
+                    model_fcsts = model_fcsts.reshape(
+                        dataset.n_groups, -1, h, model_fcsts.shape[-1]
+                    )
+                    fcsts_list[i].append(model_fcsts[:, :n_refit_windows])
+        finally:
+            for model, keep_state in zip(self.models, warm_start):
+                if keep_state:
+                    model._keep_optimizer_state = False
+                    model._optimizer_state = None
+        fcsts = np.concatenate(
+            [
+                np.concatenate(model_fcsts, axis=1).reshape(-1, model_fcsts[0].shape[-1])
+                for model_fcsts in fcsts_list
+            ],
+            axis=-1,
+        )
+
+        # Store the training data of the last refit, as fitting on it does
+        sizes = np.diff(dataset.indptr)
+        serie_pos = np.arange(dataset.indptr[-1]) - np.repeat(dataset.indptr[:-1], sizes)
+        keep = serie_pos < np.repeat(sizes - refit_test_size, sizes)
+        self.dataset = TimeSeriesDataset.trim_dataset(
+            dataset, right_trim=refit_test_size
+        )
+        self.uids = uids
+        self.ds = ds[keep]
+        last_times = ds[dataset.indptr[1:] - 1 - refit_test_size]
+        if isinstance(last_dates, pd.Index):
+            self.last_dates = pd.Index(last_times, name=time_col)
+        else:
+            self.last_dates = pl_Series(time_col, last_times)
+        for model in self.models:
+            model.set_test_size(0)
+        self._fitted = True
+
+        fcsts_df = ufp.cv_times(
+            times=ds,
+            uids=uids,
+            indptr=dataset.indptr,
+            h=h,
+            test_size=test_size,
+            step_size=step_size,
+            id_col=id_col,
+            time_col=time_col,
+        )
+        # the cv_times is sorted by window and then id
+        fcsts_df = ufp.sort(fcsts_df, [id_col, "cutoff", time_col])
+        cols = self._get_model_names()
+        if isinstance(uids, pl_Series):
+            fcsts = pl_DataFrame(dict(zip(cols, fcsts.T)))
+        else:
+            fcsts = pd.DataFrame(fcsts, columns=cols)
+        fcsts_df = ufp.horizontal_concat([fcsts_df, fcsts])
+        return ufp.join(
+            fcsts_df,
+            df[[id_col, time_col, target_col]],
+            how="left",
+            on=[id_col, time_col],
+        )
+
+    @_pin_lazy_models
     def cross_validation(
         self,
         df: Optional[DataFrame] = None,
@@ -2003,6 +2424,8 @@ class NeuralForecast:
         level: Optional[List[Union[int, float]]] = None,
         quantiles: Optional[List[float]] = None,
         h: Optional[int] = None,
+        refit_max_steps: Optional[int] = None,
+        refit_replay_fraction: float = 0.1,
         **data_kwargs,
     ) -> DataFrame:
         """Temporal Cross-Validation with core.NeuralForecast.
@@ -2030,6 +2453,8 @@ class NeuralForecast:
             refit (bool or int): Retrain model for each cross validation window.
                 If False, the models are trained at the beginning and then used to predict each window.
                 If positive int, the models are retrained every `refit` windows.
+                Unless `prediction_intervals`, `level`, `quantiles` or `local_scaler_type` are set, `df`
+                is processed once and every refit trains on the series trimmed from the right.
             id_col (str): Column that identifies each serie.
             time_col (str): Column that identifies each timestep, its values can be timestamps or integers. Defaults to 'ds'.
             target_col (str): Column that contains the target.
@@ -2037,12 +2462,20 @@ class NeuralForecast:
             level (list of ints or floats, optional): Confidence levels between 0 and 100.
             quantiles (list of floats, optional): Alternative to level, target quantiles to predict.
             h (int, optional): Forecasting horizon. If None, uses the horizon of the fitted models.
+            refit_max_steps (int, optional): Warm start the refits. The first window trains the models
+                with their `max_steps`, every later refit continues from the previous weights, optimizer
+                state and learning rate schedule for `refit_max_steps` steps, training on the windows
+                with the new observations. Auto models are trained from scratch. Requires `refit`.
+            refit_replay_fraction (float): Fraction of the older training windows that warm started refits
+                train on again. Defaults to 0.1.
             data_kwargs (kwargs): Extra arguments to be passed to the dataset within each model.
 
         Returns:
             fcsts_df (pandas or polars DataFrame): DataFrame with insample `models` columns for point predictions and probabilistic
                 predictions for all fitted `models`.
         """
+        if refit_max_steps is not None and not refit:
+            raise ValueError("`refit_max_steps` requires `refit`.")
         if h is not None:
             if h > self.h:
                 # if only cross_validation called without fit() called first, prediction_intervals
@@ -2152,6 +2585,40 @@ class NeuralForecast:
             )
         if df is None:
             raise ValueError("Must specify `df` with `refit!=False`.")
+        # Without per window scalers, intervals nor recursive horizons the windows
+        # are trained and predicted from a single processed dataset.
+        single_dataset = (
+            prediction_intervals is None
+            and level is None
+            and quantiles is None
+            and self.local_scaler_type is None
+            and h == self.h
+            and ufp.counts_by_id(df, id_col)["counts"].min() > test_size
+        )
+        if refit_max_steps is not None and not single_dataset:
+            raise ValueError(
+                "`refit_max_steps` isn't supported with `prediction_intervals`, `level`, "
+                "`quantiles`, `local_scaler_type`, a horizon longer than the models' "
+                "or series shorter than the test size."
+            )
+        if single_dataset:
+            return self._refit_cross_validation(
+                df=df,
+                static_df=static_df,
+                n_windows=n_windows,
+                step_size=step_size,
+                val_size=val_size,
+                test_size=test_size,
+                refit=refit,
+                refit_max_steps=refit_max_steps,
+                refit_replay_fraction=refit_replay_fraction,
+                verbose=verbose,
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+                h=h,
+                **data_kwargs,
+            )
         validate_freq(df[time_col], self.freq)
         splits = ufp.backtest_splits(
             df,
@@ -2211,6 +2678,7 @@ class NeuralForecast:
         cols_order = first_out_cols + remaining_cols + [target_col]
         return ufp.sort(out[cols_order], by=[id_col, "cutoff", time_col])
 
+    @_pin_lazy_models
     def predict_insample(
         self,
         step_size: int = 1,
@@ -2245,7 +2713,7 @@ class NeuralForecast:
                 raise ValueError("You can't set both level and quantiles.")
             level_ = sorted(list(set(level)))
             quantiles_ = level_to_quantiles(level_)
-            if self._cs_df is not None:
+            if self._cs_scores is not None:
                 raise NotImplementedError(
                     "One or more models has been trained with conformal prediction intervals. They are not supported for insample predictions. Set level=None"
                 )
@@ -2255,7 +2723,7 @@ class NeuralForecast:
                 raise ValueError("You can't set both level and quantiles.")
             quantiles_ = sorted(list(set(quantiles)))
             level_ = quantiles_to_level(quantiles_)
-            if self._cs_df is not None:
+            if self._cs_scores is not None:
                 raise NotImplementedError(
                     "One or more models has been trained with conformal prediction intervals. They are not supported for insample predictions. Set quantiles=None"
                 )
@@ -2266,90 +2734,99 @@ class NeuralForecast:
                     f"Model {model} is multivariate. Insample predictions are not supported for multivariate models."
                 )
 
-        # Process each series separately
-        fcsts_dfs = []
-        trimmed_datasets = []
-
-        for i in range(self.dataset.n_groups):
-            # Calculate series-specific length and offset
-            series_length = self.dataset.indptr[i + 1] - self.dataset.indptr[i]
-            _, forefront_offset = np.divmod(
-                (series_length - test_size - self.h), step_size
+        # Trim every series in a single pass: drop `test_size` observations from
+        # the right and the forefront offset (so that the first window starts on
+        # a step boundary) from the left.
+        indptr = self.dataset.indptr
+        sizes = np.diff(indptr)
+        _, forefront_offsets = np.divmod(sizes - test_size - self.h, step_size)
+        trimmed_sizes = sizes - forefront_offsets - test_size
+        # every series needs at least one window
+        n_windows = (trimmed_sizes - self.h) // step_size + 1
+        if (n_windows < 1).any():
+            raise Exception(
+                f"test_size ({test_size}) plus h ({self.h}) and the step offset must not "
+                f"exceed the shorter time series ({self.dataset.min_size})"
             )
+        trimmed_indptr = np.append(0, trimmed_sizes.cumsum()).astype(indptr.dtype)
+        row_offsets = np.arange(trimmed_indptr[-1]) - np.repeat(
+            trimmed_indptr[:-1], trimmed_sizes
+        )
+        kept_rows = (
+            np.repeat(indptr[:-1] + forefront_offsets, trimmed_sizes) + row_offsets
+        )
+        fcsts_df = _insample_times(
+            times=self.ds[kept_rows],
+            uids=self.uids,
+            indptr=trimmed_indptr,
+            h=self.h,
+            freq=self.freq,
+            step_size=step_size,
+            id_col=self.id_col,
+            time_col=self.time_col,
+        )
 
-            if test_size > 0 or forefront_offset > 0:
-                # Create single-series dataset
-                series_dataset = TimeSeriesDataset(
-                    temporal=self.dataset.temporal[
-                        self.dataset.indptr[i] : self.dataset.indptr[i + 1]
-                    ],
-                    temporal_cols=self.dataset.temporal_cols,
-                    static=self.dataset.static,
-                    static_cols=self.dataset.static_cols,
-                    indptr=np.array([0, series_length]),
-                    y_idx=self.dataset.y_idx,
-                )
-                # Trim the series
-                trimmed_series = TimeSeriesDataset.trim_dataset(
-                    dataset=series_dataset,
-                    right_trim=test_size,
-                    left_trim=forefront_offset,
-                )
-
-                new_idxs = np.arange(
-                    self.dataset.indptr[i] + forefront_offset,
-                    self.dataset.indptr[i + 1] - test_size,
-                )
-                times = self.ds[new_idxs]
-            else:
-                trimmed_series = TimeSeriesDataset(
-                    temporal=self.dataset.temporal[
-                        self.dataset.indptr[i] : self.dataset.indptr[i + 1]
-                    ],
-                    temporal_cols=self.dataset.temporal_cols,
-                    static=self.dataset.static,
-                    static_cols=self.dataset.static_cols,
-                    indptr=np.array([0, series_length]),
-                    y_idx=self.dataset.y_idx,
+        # Predict the series by length buckets. Every series is left-padded to the
+        # longest one of its bucket, so the windows are aligned from the right and
+        # each series yields the `max_windows` windows of its bucket, of which only
+        # the last `n_windows` are real. Within a bucket `max_windows` is lower than
+        # twice `n_windows`, which bounds the work on the padding.
+        n_rows = n_windows * self.h
+        rows_indptr = np.append(0, n_rows.cumsum())
+        buckets = np.ceil(np.log2(n_windows)).astype(np.int64)
+        fcsts = None
+        h_backup = self.h
+        for bucket in np.unique(buckets):
+            series = np.flatnonzero(buckets == bucket)
+            bucket_sizes = trimmed_sizes[series]
+            bucket_indptr = np.append(0, bucket_sizes.cumsum()).astype(indptr.dtype)
+            bucket_rows = np.repeat(
+                kept_rows[trimmed_indptr[series]] - bucket_indptr[:-1], bucket_sizes
+            ) + np.arange(bucket_indptr[-1])
+            bucket_static = self.dataset.static
+            if bucket_static is not None:
+                bucket_static = bucket_static[torch.from_numpy(series)]
+            bucket_dataset = TimeSeriesDataset(
+                temporal=self.dataset.temporal[torch.from_numpy(bucket_rows)],
+                temporal_cols=self.dataset.temporal_cols,
+                static=bucket_static,
+                static_cols=self.dataset.static_cols,
+                indptr=bucket_indptr,
+                y_idx=self.dataset.y_idx,
+                # the gathered tensors are already copies
+                copy=False,
+            )
+            self.h = bucket_dataset.max_size
+            try:
+                bucket_fcsts, cols = self._generate_forecasts(
+                    dataset=bucket_dataset,
+                    uids=ufp.take_rows(self.uids, series),
+                    quantiles_=quantiles_,
+                    level_=level_,
+                    has_level=has_level,
+                    step_size=step_size,
+                    h=None,
                 )
-                times = self.ds[self.dataset.indptr[i] : self.dataset.indptr[i + 1]]
-
-            series_fcsts_df = _insample_times(
-                times=times,
-                uids=self.uids[i : i + 1],
-                indptr=trimmed_series.indptr,
-                h=self.h,
-                freq=self.freq,
-                step_size=step_size,
-                id_col=self.id_col,
-                time_col=self.time_col,
+            finally:
+                self.h = h_backup
+
+            # Scatter the forecasts back by series offsets
+            max_windows = (bucket_dataset.max_size - self.h) // step_size + 1
+            bucket_n_windows = n_windows[series]
+            bucket_n_rows = n_rows[series]
+            series_starts = (
+                np.arange(series.size) * max_windows + max_windows - bucket_n_windows
+            ) * self.h
+            offsets = np.arange(bucket_n_rows.sum()) - np.repeat(
+                bucket_n_rows.cumsum() - bucket_n_rows, bucket_n_rows
             )
-
-            fcsts_dfs.append(series_fcsts_df)
-            trimmed_datasets.append(trimmed_series)
-
-        # Combine all series forecasts DataFrames
-        fcsts_df = ufp.vertical_concat(fcsts_dfs)
-
-        h_backup = self.h
-        fcst_list = []
-        # Generate predictions for each dataset
-        for i, trimmed_dataset in enumerate(trimmed_datasets):
-            # Set test size to current series length
-            self.h = trimmed_dataset.max_size
-            fcsts, cols = self._generate_forecasts(
-                dataset=trimmed_dataset,
-                uids=self.uids[i : i + 1],
-                quantiles_=quantiles_,
-                level_=level_,
-                has_level=has_level,
-                step_size=step_size,
-                h=None,
+            if fcsts is None:
+                fcsts = np.empty(
+                    (rows_indptr[-1], bucket_fcsts.shape[1]), dtype=bucket_fcsts.dtype
+                )
+            fcsts[np.repeat(rows_indptr[series], bucket_n_rows) + offsets] = (
+                bucket_fcsts[np.repeat(series_starts, bucket_n_rows) + offsets]
             )
-            fcst_list.append(fcsts)
-
-        fcsts = np.vstack(fcst_list)
-        self.h = h_backup
 
         # Add original y values
         original_y = {
@@ -2380,12 +2857,14 @@ class NeuralForecast:
         return fcsts_df
 
     # Save list of models with pytorch lightning save_checkpoint function
+    @_pin_lazy_models
     def save(
         self,
         path: str,
         model_index: Optional[List] = None,
         save_dataset: bool = True,
         overwrite: bool = False,
+        dataset_format: str = "pickle",
     ):
         """Save NeuralForecast core class.
 
@@ -2398,7 +2877,14 @@ class NeuralForecast:
             model_index (list, optional): List to specify which models from list of self.models to save.
             save_dataset (bool): Whether to save dataset or not.
             overwrite (bool): Whether to overwrite files or not.
+            dataset_format (str): Format of the saved dataset. 'pickle' pickles it, 'numpy' writes its
+                arrays and times as `.npy` files with a JSON manifest, which `load(mmap=True)` memory-maps.
+                Defaults to 'pickle'.
         """
+        if dataset_format not in ("pickle", "numpy"):
+            raise ValueError(
+                f"dataset_format must be 'pickle' or 'numpy', got {dataset_format}."
+            )
         # In distributed training (DDP), only rank 0 should save
         try:
             import torch.distributed as dist
@@ -2464,8 +2950,15 @@ class NeuralForecast:
                     "You can set `save_dataset=False` and use the `df` argument in the predict method after loading "
                     "this model to use it for inference."
                 )
-            with fsspec.open(f"{path}/dataset.pkl", "wb") as f:
-                pickle.dump(self.dataset, f)
+            if dataset_format == "numpy":
+                if not isinstance(self.dataset, TimeSeriesDataset):
+                    raise ValueError(
+                        "dataset_format='numpy' is only supported for datasets built from a DataFrame."
+                    )
+                self.dataset.save_arrays(f"{path}/dataset")
+            else:
+                with fsspec.open(f"{path}/dataset.pkl", "wb") as f:
+                    pickle.dump(self.dataset, f)
         elif save_dataset:
             raise Exception(
                 "You need to have a stored dataset to save it, \
@@ -2479,13 +2972,15 @@ class NeuralForecast:
             "_fitted": self._fitted,
             "local_scaler_type": self.local_scaler_type,
             "local_static_scaler_type": self.local_static_scaler_type,
+            "local_scaler_num_threads": self.local_scaler_num_threads,
+            "window_cache_size": self.window_cache_size,
             "scalers_": self.scalers_,
             "static_scalers_": self.static_scalers_,
             "id_col": self.id_col,
             "time_col": self.time_col,
             "target_col": self.target_col,
         }
-        for attr in ["prediction_intervals", "_cs_df"]:
+        for attr in ["prediction_intervals", "_cs_scores"]:
             # conformal prediction related attributes was not available < 1.7.6
             config_dict[attr] = getattr(self, attr, None)
 
@@ -2497,12 +2992,25 @@ class NeuralForecast:
                     "ds": self.ds,
                 }
             )
+            # times with a numpy dtype are stored next to the dataset arrays
+            if dataset_format == "numpy" and self.ds.dtype != object:
+                with fsspec.open(f"{path}/dataset/ds.npy", "wb") as f:
+                    np.save(f, self.ds)
+                config_dict["ds"] = None
 
         with fsspec.open(f"{path}/configuration.pkl", "wb") as f:
             pickle.dump(config_dict, f)
 
     @staticmethod
-    def load(path, verbose=False, **kwargs):
+    def load(
+        path,
+        verbose=False,
+        mmap=False,
+        models: Optional[List[str]] = None,
+        lazy: bool = False,
+        max_memory: Optional[int] = None,
+        **kwargs,
+    ):
         """Load NeuralForecast
 
         `core.NeuralForecast`'s method to load checkpoint from path.
@@ -2510,17 +3018,32 @@ class NeuralForecast:
         Args:
             path (str): Directory with stored artifacts.
             verbose (bool): Defaults to False.
+            mmap (bool): Memory-map the models' weights and a dataset saved with
+                `dataset_format='numpy'` instead of reading them into memory, only for
+                local paths. Defaults to False.
+            models (List[str], optional): Aliases of the models to load, the other saved
+                models are skipped. Defaults to None, which loads every model.
+            lazy (bool): Load each model the first time it's accessed instead of
+                loading all of them upfront. Defaults to False.
+            max_memory (int, optional): Memory budget in bytes for the weights of the
+                lazily loaded models. The least recently used models are dropped
+                and loaded again on their next access. Only used with `lazy=True`.
+                Defaults to None, which keeps every loaded model.
             **kwargs: Additional keyword arguments to be passed to the function
                 `load_from_checkpoint`.
 
         Returns:
             result (NeuralForecast): Instantiated `NeuralForecast` class.
         """
+        if mmap:
+            kwargs["mmap"] = True
         # Standarize path without '/'
         if path[-1] == "/":
             path = path[:-1]
 
         fs, _, _ = fsspec.get_fs_token_paths(path)
+        if mmap and not _is_local_fs(fs):
+            raise ValueError("mmap is only supported for local paths.")
         files = [f.split("/")[-1] for f in fs.ls(path) if fs.isfile(f)]
 
         # Load models
@@ -2528,38 +3051,61 @@ class NeuralForecast:
         if len(models_ckpt) == 0:
             raise Exception("No model found in directory.")
 
-        if verbose:
-            print(10 * "-" + " Loading models " + 10 * "-")
-        models = []
         try:
             with fsspec.open(f"{path}/alias_to_model.pkl", "rb") as f:
                 alias_to_model = pickle.load(f)
         except FileNotFoundError:
             alias_to_model = {}
+        if models is not None:
+            aliases = ["_".join(model.split("_")[:-1]) for model in models_ckpt]
+            missing = set(models) - set(aliases)
+            if missing:
+                raise ValueError(f"Models {sorted(missing)} not found in directory.")
+            models_ckpt = [
+                model for model, alias in zip(models_ckpt, aliases) if alias in models
+            ]
+        if max_memory is not None and not lazy:
+            raise ValueError("max_memory can only be used with lazy=True.")
+        loaders = [
+            partial(_load_model, path, model, alias_to_model, **kwargs)
+            for model in models_ckpt
+        ]
 
-        for model in models_ckpt:
-            model_name = "_".join(model.split("_")[:-1])
-            model_class_name = alias_to_model.get(model_name, model_name)
-            loaded_model = MODEL_FILENAME_DICT[model_class_name].load(
-                f"{path}/{model}", **kwargs
-            )
-            loaded_model.alias = model_name
-            models.append(loaded_model)
+        if lazy:
+            loaded_models = None
+        else:
             if verbose:
-                print(f"Model {model_name} loaded.")
+                print(10 * "-" + " Loading models " + 10 * "-")
+            loaded_models = []
+            for loader in loaders:
+                loaded_models.append(loader())
+                if verbose:
+                    print(f"Model {loaded_models[-1].alias} loaded.")
 
         if verbose:
             print(10 * "-" + " Loading dataset " + 10 * "-")
         # Load dataset
-        try:
-            with fsspec.open(f"{path}/dataset.pkl", "rb") as f:
-                dataset = pickle.load(f)
+        ds = None
+        if fs.exists(f"{path}/dataset/manifest.json"):
+            dataset = TimeSeriesDataset.load_arrays(f"{path}/dataset", mmap=mmap)
+            if fs.exists(f"{path}/dataset/ds.npy"):
+                if mmap:
+                    ds = np.load(f"{path}/dataset/ds.npy", mmap_mode="c")
+                else:
+                    with fsspec.open(f"{path}/dataset/ds.npy", "rb") as f:
+                        ds = np.load(f)
             if verbose:
                 print("Dataset loaded.")
-        except FileNotFoundError:
-            dataset = None
-            if verbose:
-                print("No dataset found in directory.")
+        else:
+            try:
+                with fsspec.open(f"{path}/dataset.pkl", "rb") as f:
+                    dataset = pickle.load(f)
+                if verbose:
+                    print("Dataset loaded.")
+            except FileNotFoundError:
+                dataset = None
+                if verbose:
+                    print("No dataset found in directory.")
 
         if verbose:
             print(10 * "-" + " Loading configuration " + 10 * "-")
@@ -2578,20 +3124,30 @@ class NeuralForecast:
         default_scalar_type = getattr(dataset, "local_scaler_type", None)
         default_scalars_ = getattr(dataset, "scalers_", None)
 
+        if lazy:
+            # older saves don't store the horizon
+            h = config_dict["h"] if "h" in config_dict else loaders[0]().h
+            loaded_models = _LazyModels(loaders, h=h, max_memory=max_memory)
+
         # Create NeuralForecast object
         neuralforecast = NeuralForecast(
-            models=models,
+            models=loaded_models,
             freq=config_dict["freq"],
             local_scaler_type=config_dict.get("local_scaler_type", default_scalar_type),
-            local_static_scaler_type=config_dict.get("local_static_scaler_type", None)
+            local_static_scaler_type=config_dict.get("local_static_scaler_type", None),
+            local_scaler_num_threads=config_dict.get("local_scaler_num_threads", 1),
+            window_cache_size=config_dict.get("window_cache_size", 2**28),
         )
 
         attr_to_default = {"id_col": "unique_id", "time_col": "ds", "target_col": "y"}
         for attr, default in attr_to_default.items():
             setattr(neuralforecast, attr, config_dict.get(attr, default))
         # only restore attribute if available
-        for attr in ["prediction_intervals", "_cs_df"]:
-            setattr(neuralforecast, attr, config_dict.get(attr, None))
+        neuralforecast.prediction_intervals = config_dict.get("prediction_intervals", None)
+        # the scores were stored in a DataFrame before, which the intervals also accept
+        neuralforecast._cs_scores = config_dict.get(
+            "_cs_scores", config_dict.get("_cs_df", None)
+        )
 
         # Dataset
         if dataset is not None:
@@ -2603,6 +3159,8 @@ class NeuralForecast:
             ]
             for attr in restore_attrs:
                 setattr(neuralforecast, attr, config_dict[attr])
+            if ds is not None:
+                neuralforecast.ds = ds
 
         # Fitted flag
         neuralforecast._fitted = config_dict["_fitted"]
@@ -2612,6 +3170,18 @@ class NeuralForecast:
 
         return neuralforecast
 
+    def _check_conformity_size(self, min_size: int, val_size: int) -> None:
+        n_windows = self.prediction_intervals.n_windows
+        step_size = self.prediction_intervals.step_size
+        min_samples = self.h + step_size * (n_windows - 1) + 1 + val_size
+        if min_size < min_samples:
+            raise ValueError(
+                "Minimum required samples in each serie for the prediction intervals "
+                f"settings are: {min_samples}, shortest serie has: {min_size}. "
+                "Please reduce the number of windows, horizon, validation size or "
+                "remove those series."
+            )
+
     def _conformity_scores(
         self,
         df: DataFrame,
@@ -2620,7 +3190,8 @@ class NeuralForecast:
         target_col: str,
         static_df: Optional[DataFrame],
         val_size: int = 0,
-    ) -> DataFrame:
+        use_fitted: bool = False,
+    ) -> Dict[str, np.ndarray]:
         """Compute conformity scores.
 
         We need at least two cross validation errors to compute
@@ -2636,48 +3207,63 @@ class NeuralForecast:
             static_df (Optional[DataFrame]): DataFrame with static exogenous variables.
             val_size (int): Validation size used to retrain the models during
                 calibration, mirroring the validation size of the final fit.
+            use_fitted (bool): Score the fitted models on the windows they were
+                not trained on instead of training them again.
+
+        Returns:
+            Dict[str, np.ndarray]: Absolute errors of each model, of shape [n_series, n_windows, h].
         """
         if self.prediction_intervals is None:
             raise AttributeError(
                 "Please rerun the `fit` method passing a valid prediction_interval setting to compute conformity scores"
             )
 
-        min_size = ufp.counts_by_id(df, id_col)["counts"].min()
-        step_size = self.prediction_intervals.step_size
-        min_samples = (
-            self.h + step_size * (self.prediction_intervals.n_windows - 1) + 1 + val_size
+        self._check_conformity_size(
+            ufp.counts_by_id(df, id_col)["counts"].min(), val_size
         )
-        if min_size < min_samples:
-            raise ValueError(
-                "Minimum required samples in each serie for the prediction intervals "
-                f"settings are: {min_samples}, shortest serie has: {min_size}. "
-                "Please reduce the number of windows, horizon, validation size or "
-                "remove those series."
-            )
+        n_windows = self.prediction_intervals.n_windows
+        step_size = self.prediction_intervals.step_size
 
         self._add_level = True
-        cv_results = self.cross_validation(
-            df=df,
-            static_df=static_df,
-            n_windows=self.prediction_intervals.n_windows,
-            step_size=step_size,
-            val_size=val_size,
-            id_col=id_col,
-            time_col=time_col,
-            target_col=target_col,
-        )
-        self._add_level = False
-
-        kept = [time_col, id_col, "cutoff"]
-        # conformity score for each model
-        for model in self._get_model_names(add_level=True):
-            kept.append(model)
-
-            # compute absolute error for each model
-            abs_err = abs(cv_results[model] - cv_results[target_col])
-            cv_results = ufp.assign_columns(cv_results, model, abs_err)
-        dropped = list(set(cv_results.columns) - set(kept))
-        return ufp.drop_columns(cv_results, dropped)
+        try:
+            if use_fitted:
+                cv_results = self._no_refit_cross_validation(
+                    df=None,
+                    static_df=None,
+                    n_windows=n_windows,
+                    step_size=step_size,
+                    val_size=val_size,
+                    test_size=self.h + step_size * (n_windows - 1),
+                    use_fitted=True,
+                    verbose=False,
+                    id_col=id_col,
+                    time_col=time_col,
+                    target_col=target_col,
+                    h=self.h,
+                )
+            else:
+                cv_results = self.cross_validation(
+                    df=df,
+                    static_df=static_df,
+                    n_windows=n_windows,
+                    step_size=step_size,
+                    val_size=val_size,
+                    id_col=id_col,
+                    time_col=time_col,
+                    target_col=target_col,
+                )
+        finally:
+            self._add_level = False
+
+        # conformity score for each model, the results are sorted by serie,
+        # window and time
+        y = cv_results[target_col].to_numpy()
+        return {
+            model: np.abs(cv_results[model].to_numpy() - y)
+            .astype(np.float32)
+            .reshape(-1, n_windows, self.h)
+            for model in self._get_model_names(add_level=True)
+        }
 
     def _generate_forecasts(
         self,
@@ -2692,113 +3278,120 @@ class NeuralForecast:
         fcsts_list: List = []
         cols = []
         count_names = {"model": 0}
+        # the models share the batches of the dataset and the windows they have in common
+        window_cache = None
+        if getattr(self, "window_cache_size", None):
+            window_cache = WindowCache(max_bytes=self.window_cache_size)
         for model in self.models:
-            model_name = repr(model)
-            count_names[model_name] = count_names.get(model_name, -1) + 1
-            if count_names[model_name] > 0:
-                model_name += str(count_names[model_name])
+            # auto models predict with their best model
+            base_model = model.model if isinstance(model, BaseAuto) else model
+            base_model._window_cache = window_cache
+            try:
+                model_name = repr(model)
+                count_names[model_name] = count_names.get(model_name, -1) + 1
+                if count_names[model_name] > 0:
+                    model_name += str(count_names[model_name])
+
+                old_test_size = model.get_test_size()
+                model.set_test_size(
+                    h if h is not None else self.h
+                )  # To predict h steps ahead
+
+                # Predict for every quantile or level if requested and the loss function supports it
+                # case 1: DistributionLoss and MixtureLosses
+                if (
+                    quantiles_ is not None
+                    and not isinstance(model.loss, (IQLoss, HuberIQLoss))
+                    and hasattr(model.loss, "update_quantile")
+                    and callable(model.loss.update_quantile)
+                ):
+                    model_fcsts = model.predict(
+                        dataset=dataset, quantiles=quantiles_, h=h, **data_kwargs
+                    )
+                    fcsts_list.append(model_fcsts)
+                    col_names = []
+                    for i, quantile in enumerate(quantiles_):
+                        col_name = self._get_column_name(model_name, quantile, has_level)
+                        if i == 0:
+                            col_names.extend([f"{model_name}", col_name])
+                        else:
+                            col_names.extend([col_name])
+                    if hasattr(model.loss, "return_params") and model.loss.return_params:
+                        cols.extend(
+                            col_names
+                            + [
+                                model_name + param_name
+                                for param_name in model.loss.param_names
+                            ]
+                        )
+                    else:
+                        cols.extend(col_names)
+                # case 2: IQLoss
+                elif quantiles_ is not None and isinstance(
+                    model.loss, (IQLoss, HuberIQLoss)
+                ):
+                    # IQLoss does not give monotonically increasing quantiles, so we apply a hack: compute all quantiles, and take the quantile over the quantiles
+                    quantiles_iqloss = [
+                        0.01,
+                        0.05,
+                        0.1,
+                        0.2,
+                        0.3,
+                        0.5,
+                        0.7,
+                        0.8,
+                        0.9,
+                        0.95,
+                        0.99,
+                    ]
+                    fcsts_iqloss = model._predict_quantile_grid(
+                        dataset=dataset, quantiles=quantiles_iqloss, h=h, **data_kwargs
+                    )
 
-            old_test_size = model.get_test_size()
-            model.set_test_size(
-                h if h is not None else self.h
-            )  # To predict h steps ahead
+                    # Get the actual requested quantiles
+                    model_fcsts = np.quantile(fcsts_iqloss, quantiles_, axis=-1).T
+                    fcsts_list.append(model_fcsts)
 
-            # Predict for every quantile or level if requested and the loss function supports it
-            # case 1: DistributionLoss and MixtureLosses
-            if (
-                quantiles_ is not None
-                and not isinstance(model.loss, (IQLoss, HuberIQLoss))
-                and hasattr(model.loss, "update_quantile")
-                and callable(model.loss.update_quantile)
-            ):
-                model_fcsts = model.predict(
-                    dataset=dataset, quantiles=quantiles_, h=h, **data_kwargs
-                )
-                fcsts_list.append(model_fcsts)
-                col_names = []
-                for i, quantile in enumerate(quantiles_):
-                    col_name = self._get_column_name(model_name, quantile, has_level)
-                    if i == 0:
-                        col_names.extend([f"{model_name}", col_name])
-                    else:
+                    # Get the right column names
+                    col_names = []
+                    for i, quantile in enumerate(quantiles_):
+                        col_name = self._get_column_name(model_name, quantile, has_level)
                         col_names.extend([col_name])
-                if hasattr(model.loss, "return_params") and model.loss.return_params:
-                    cols.extend(
-                        col_names
-                        + [
-                            model_name + param_name
-                            for param_name in model.loss.param_names
-                        ]
-                    )
-                else:
                     cols.extend(col_names)
-            # case 2: IQLoss
-            elif quantiles_ is not None and isinstance(
-                model.loss, (IQLoss, HuberIQLoss)
-            ):
-                # IQLoss does not give monotonically increasing quantiles, so we apply a hack: compute all quantiles, and take the quantile over the quantiles
-                quantiles_iqloss = [
-                    0.01,
-                    0.05,
-                    0.1,
-                    0.2,
-                    0.3,
-                    0.5,
-                    0.7,
-                    0.8,
-                    0.9,
-                    0.95,
-                    0.99,
-                ]
-                fcsts_list_iqloss = []
-                for i, quantile in enumerate(quantiles_iqloss):
+                # case 3: PointLoss via prediction intervals
+                elif quantiles_ is not None and model.loss.outputsize_multiplier == 1:
+                    if self.prediction_intervals is None:
+                        raise AttributeError(
+                            f"You have trained {model_name} with loss={type(model.loss).__name__}(). \n"
+                            " You then must set `prediction_intervals` during fit to use level or quantiles during predict."
+                        )
                     model_fcsts = model.predict(
-                        dataset=dataset, quantiles=[quantile], h=h, **data_kwargs
+                        dataset=dataset, quantiles=quantiles_, h=h, **data_kwargs
                     )
-                    fcsts_list_iqloss.append(model_fcsts)
-                fcsts_iqloss = np.concatenate(fcsts_list_iqloss, axis=-1)
-
-                # Get the actual requested quantiles
-                model_fcsts = np.quantile(fcsts_iqloss, quantiles_, axis=-1).T
-                fcsts_list.append(model_fcsts)
-
-                # Get the right column names
-                col_names = []
-                for i, quantile in enumerate(quantiles_):
-                    col_name = self._get_column_name(model_name, quantile, has_level)
-                    col_names.extend([col_name])
-                cols.extend(col_names)
-            # case 3: PointLoss via prediction intervals
-            elif quantiles_ is not None and model.loss.outputsize_multiplier == 1:
-                if self.prediction_intervals is None:
-                    raise AttributeError(
-                        f"You have trained {model_name} with loss={type(model.loss).__name__}(). \n"
-                        " You then must set `prediction_intervals` during fit to use level or quantiles during predict."
+                    prediction_interval_method = get_prediction_interval_method(
+                        self.prediction_intervals.method
                     )
-                model_fcsts = model.predict(
-                    dataset=dataset, quantiles=quantiles_, h=h, **data_kwargs
-                )
-                prediction_interval_method = get_prediction_interval_method(
-                    self.prediction_intervals.method
-                )
-                fcsts_with_intervals, out_cols = prediction_interval_method(
-                    model_fcsts,
-                    self._cs_df,
-                    model=model_name,
-                    level=level_ if has_level else None,
-                    cs_n_windows=self.prediction_intervals.n_windows,
-                    n_series=len(uids),
-                    horizon=self.h,
-                    quantiles=quantiles_ if not has_level else None,
-                )
-                fcsts_list.append(fcsts_with_intervals)
-                cols.extend([model_name] + out_cols)
-            # base case: quantiles or levels are not supported or provided as arguments
-            else:
-                model_fcsts = model.predict(dataset=dataset, h=h, **data_kwargs)
-                fcsts_list.append(model_fcsts)
-                cols.extend(model_name + n for n in model.loss.output_names)
-            model.set_test_size(old_test_size)  # Set back to original value
+                    fcsts_with_intervals, out_cols = prediction_interval_method(
+                        model_fcsts,
+                        self._cs_scores,
+                        model=model_name,
+                        level=level_ if has_level else None,
+                        cs_n_windows=self.prediction_intervals.n_windows,
+                        n_series=len(uids),
+                        horizon=self.h,
+                        quantiles=quantiles_ if not has_level else None,
+                    )
+                    fcsts_list.append(fcsts_with_intervals)
+                    cols.extend([model_name] + out_cols)
+                # base case: quantiles or levels are not supported or provided as arguments
+                else:
+                    model_fcsts = model.predict(dataset=dataset, h=h, **data_kwargs)
+                    fcsts_list.append(model_fcsts)
+                    cols.extend(model_name + n for n in model.loss.output_names)
+                model.set_test_size(old_test_size)  # Set back to original value
+            finally:
+                # the cache keeps the dataset alive, it only lives for this prediction
+                base_model._window_cache = None
         fcsts = np.concatenate(fcsts_list, axis=-1)
 
         return fcsts, cols
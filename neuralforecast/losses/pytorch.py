@@ -700,6 +700,19 @@ class QuantileLayer(nn.Module):
         return self.output_layer(cos_emb_tau)
 
 
+def _predict_quantiles_map(loss, y_hat):
+    # Evaluates all the `predict_quantiles` of an `IQLoss` or `HuberIQLoss` on the
+    # same network output, [B, h, N] -> [B, h, N, Q]
+    quantiles = torch.tensor(
+        loss.predict_quantiles, device=y_hat.device, dtype=y_hat.dtype
+    )
+    quantiles = quantiles.expand(*y_hat.shape, -1).unsqueeze(-1)
+    emb_taus = loss.quantile_layer(quantiles)
+    emb_inputs = y_hat[..., None, None] * (1.0 + emb_taus)
+    emb_outputs = loss.output_layer(emb_inputs)
+    return emb_outputs.squeeze(-1)
+
+
 class IQLoss(QuantileLoss):
     r"""Implicit Quantile Loss.
 
@@ -766,8 +779,10 @@ class IQLoss(QuantileLoss):
         )
 
     def update_quantile(self, q: List[float] = [0.5]):
+        # Several quantiles are predicted in a single forward pass, see `domain_map`
         self.q = q[0]
-        self.output_names = [f"_ql{q[0]}"]
+        self.predict_quantiles = list(q)
+        self.output_names = [f"_ql{quantile}" for quantile in q]
         self.has_predicted = True
 
     def domain_map(self, y_hat):
@@ -781,6 +796,12 @@ class IQLoss(QuantileLoss):
         Returns:
             torch.Tensor: Domain mapped tensor.
         """
+        if (
+            self.eval()
+            and self.has_predicted
+            and len(getattr(self, "predict_quantiles", [])) > 1
+        ):
+            return _predict_quantiles_map(self, y_hat)
         if self.eval() and self.has_predicted:
             quantiles = torch.full(
                 size=y_hat.shape,
@@ -1802,6 +1823,267 @@ def isqf_scale_decouple(output, loc=None, scale=None):
     return (spline_knots, spline_heights, beta_l, beta_r, qk_y, qk_x_repeat, loc, scale)
 
 
+def _betainc(a: torch.Tensor, b: torch.Tensor, x: torch.Tensor, max_iter: int = 300):
+    """Regularized incomplete beta function $I_x(a, b)$.
+
+    Evaluated with the continued fraction of Numerical Recipes (modified Lentz),
+    using $I_x(a, b) = 1 - I_{1-x}(b, a)$ where the fraction converges faster.
+    """
+    a, b, x = torch.broadcast_tensors(a, b, x)
+    swap = x > (a + 1) / (a + b + 2)
+    a, b, x = torch.where(swap, b, a), torch.where(swap, a, b), torch.where(swap, 1 - x, x)
+    tiny = torch.finfo(x.dtype).tiny
+    eps = torch.finfo(x.dtype).eps
+
+    def clamp(t):
+        return torch.where(t.abs() < tiny, torch.full_like(t, tiny), t)
+
+    c = torch.ones_like(x)
+    d = 1 / clamp(1 - (a + b) * x / (a + 1))
+    h = d
+    for m in range(1, max_iter + 1):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((a + m2 - 1) * (a + m2))
+        d = 1 / clamp(1 + aa * d)
+        c = clamp(1 + aa / c)
+        h = h * d * c
+        aa = -(a + m) * (a + b + m) * x / ((a + m2) * (a + m2 + 1))
+        d = 1 / clamp(1 + aa * d)
+        c = clamp(1 + aa / c)
+        delta = d * c
+        h = h * delta
+        if m % 10 == 0 and ((delta - 1).abs() < eps).all():
+            break
+    log_front = (
+        a * torch.log(x)
+        + b * torch.log1p(-x)
+        - torch.lgamma(a)
+        - torch.lgamma(b)
+        + torch.lgamma(a + b)
+    )
+    out = torch.exp(log_front) * h / a
+    return torch.where(swap, 1 - out, out)
+
+
+def _bisect_continuous(
+    cdf,
+    q: torch.Tensor,
+    lo: torch.Tensor,
+    hi: torch.Tensor,
+    n_iter: int = 40,
+    tol: Optional[torch.Tensor] = None,
+):
+    """Solves cdf(x) = q by bisection for every element of `q` at once.
+
+    Stops after `n_iter` steps, or earlier once every bracket is narrower than `tol`.
+    """
+    for _ in range(n_iter):
+        if tol is not None and (hi - lo <= tol).all():
+            break
+        mid = (lo + hi) / 2
+        covered = cdf(mid) >= q
+        hi = torch.where(covered, mid, hi)
+        lo = torch.where(covered, lo, mid)
+    return (lo + hi) / 2
+
+
+def _newton_continuous(
+    cdf,
+    pdf,
+    q: torch.Tensor,
+    lo: torch.Tensor,
+    hi: torch.Tensor,
+    guess: torch.Tensor,
+    n_iter: int = 4,
+):
+    """Refines the solution `guess` of cdf(x) = q inside the brackets [lo, hi] with Newton steps.
+
+    Every step also shrinks the brackets, and falls back to their midpoint when the
+    Newton step leaves them.
+    """
+    x = guess
+    for _ in range(n_iter):
+        error = cdf(x) - q
+        covered = error >= 0
+        hi = torch.where(covered, x, hi)
+        lo = torch.where(covered, lo, x)
+        step = x - error / pdf(x)
+        # also false for nan steps
+        inside = (step > lo) & (step < hi)
+        x = torch.where(inside, step, (lo + hi) / 2)
+    return x
+
+
+def _bisect_discrete(cdf, q: torch.Tensor, guess: torch.Tensor):
+    """Smallest non-negative integer k with cdf(k) >= q, for every element of `q` at once."""
+    hi = torch.ceil(guess).clamp(min=1.0)
+    # grow the upper bounds until they cover the quantiles
+    for _ in range(64):
+        below = cdf(hi) < q
+        if not below.any():
+            break
+        hi = torch.where(below, 2 * hi, hi)
+    lo = torch.full_like(hi, -1.0)
+    n_iter = int(torch.log2(hi.max() + 1).ceil().item()) + 1
+    for _ in range(n_iter):
+        mid = torch.floor((lo + hi) / 2)
+        covered = cdf(mid) >= q
+        hi = torch.where(covered, mid, hi)
+        lo = torch.where(covered, lo, mid)
+    return hi
+
+
+def _student_t_cdf(t: torch.Tensor, df: torch.Tensor) -> torch.Tensor:
+    tail = 0.5 * _betainc(df / 2, torch.full_like(df, 0.5), df / (df + t**2))
+    return torch.where(t > 0, 1 - tail, tail)
+
+
+def _analytic_quantiles(distr: Distribution, quantiles: torch.Tensor) -> Optional[torch.Tensor]:
+    """Quantiles of the supported distributions without sampling.
+
+    Args:
+        distr (Distribution): Distribution with batch shape [B, H, N].
+        quantiles (torch.Tensor): Quantile levels [Q].
+
+    Returns:
+        torch.Tensor: Quantiles [B, H, N, Q], or None if the distribution isn't supported.
+    """
+
+    if not isinstance(distr, (Normal, StudentT, Poisson, NegativeBinomial, Bernoulli)):
+        return None
+
+    def param(p):
+        return p.expand(distr.batch_shape).unsqueeze(-1)
+
+    q = quantiles.to(distr.mean.dtype)
+    if isinstance(distr, Normal):
+        z = torch.erfinv(2 * q - 1) * np.sqrt(2)
+        return param(distr.loc) + param(distr.scale) * z
+    if isinstance(distr, StudentT):
+        df = param(distr.df)
+        q = q.expand(*distr.batch_shape, -1)
+        # a few bisection steps over atan(t), which maps the real line to a bounded
+        # interval, then Newton steps over t, each of them evaluating the CDF once
+        lo = torch.full_like(q, -np.pi / 2)
+        hi = torch.full_like(q, np.pi / 2)
+        for _ in range(12):
+            mid = (lo + hi) / 2
+            covered = _student_t_cdf(torch.tan(mid), df) >= q
+            hi = torch.where(covered, mid, hi)
+            lo = torch.where(covered, lo, mid)
+        # tan(+-pi / 2) changes sign in float32
+        bound = np.pi / 2 - 1e-6
+        standard = StudentT(df, validate_args=False)
+        t = _newton_continuous(
+            lambda t: _student_t_cdf(t, df),
+            lambda t: standard.log_prob(t).exp(),
+            q,
+            lo=torch.tan(lo.clamp(-bound, bound)),
+            hi=torch.tan(hi.clamp(-bound, bound)),
+            guess=torch.tan(((lo + hi) / 2).clamp(-bound, bound)),
+        )
+        return param(distr.loc) + param(distr.scale) * t
+    if isinstance(distr, Poisson):
+        rate = param(distr.rate)
+        q = q.expand(*distr.batch_shape, -1)
+        # P(X <= k) = Q(k + 1, rate)
+        return _bisect_discrete(
+            lambda k: torch.special.gammaincc(k + 1, rate),
+            q,
+            guess=rate + 6 * rate.sqrt() + 10,
+        )
+    if isinstance(distr, NegativeBinomial):
+        total_count, probs = param(distr.total_count), param(distr.probs)
+        mean, std = param(distr.mean), param(distr.stddev)
+        q = q.expand(*distr.batch_shape, -1)
+        # P(X <= k) = I_{1-p}(total_count, k + 1)
+        return _bisect_discrete(
+            lambda k: _betainc(total_count, k + 1, 1 - probs),
+            q,
+            guess=mean + 6 * std + 10,
+        )
+    # Bernoulli
+    return (q > 1 - param(distr.probs)).to(q.dtype)
+
+
+def _mixture_quantiles(
+    distr: MixtureSameFamily, quantiles: torch.Tensor, tol: float = 1e-4
+) -> Optional[torch.Tensor]:
+    """Quantiles of a mixture of Normal, Poisson or NegativeBinomial components without sampling.
+
+    The mixture CDF is the weighted sum of the component CDFs, which is inverted by
+    bisection for all the batch elements and quantile levels at once.
+
+    Args:
+        distr (MixtureSameFamily): Mixture with batch shape [B, H, N] and K components.
+        quantiles (torch.Tensor): Quantile levels [Q].
+        tol (float): Tolerance of the continuous quantiles, relative to the smallest
+            standard deviation of the components. Defaults to 1e-4.
+
+    Returns:
+        torch.Tensor: Quantiles [B, H, N, Q], or None if the components aren't supported.
+    """
+    components = distr.component_distribution
+    if not isinstance(components, (Normal, Poisson, NegativeBinomial)):
+        return None
+
+    # [B, H, N, K] -> [B, H, N, 1, K] to broadcast against the quantile levels
+    weights = distr.mixture_distribution.probs.unsqueeze(-2)
+    q = quantiles.to(weights.dtype).expand(*distr.batch_shape, -1)
+
+    def mixture_cdf(component_cdf):
+        return lambda x: (weights * component_cdf(x.unsqueeze(-1))).sum(-1)
+
+    if isinstance(components, Normal):
+        loc, scale = components.loc.unsqueeze(-2), components.scale.unsqueeze(-2)
+        lo = (loc - 10 * scale).amin(-1).expand_as(q)
+        hi = (loc + 10 * scale).amax(-1).expand_as(q)
+        # the float resolution of the brackets bounds the reachable tolerance
+        resolution = torch.finfo(q.dtype).eps * torch.maximum(lo.abs(), hi.abs())
+        return _bisect_continuous(
+            mixture_cdf(lambda x: 0.5 * torch.erfc((loc - x) / (scale * np.sqrt(2)))),
+            q,
+            lo=lo,
+            hi=hi,
+            n_iter=100,
+            tol=torch.maximum(tol * scale.amin(-1), 2 * resolution),
+        )
+    guess = (components.mean + 6 * components.stddev).amax(-1, keepdim=True) + 10
+    if isinstance(components, Poisson):
+        rate = components.rate.unsqueeze(-2)
+        # P(X <= k) = Q(k + 1, rate)
+        return _bisect_discrete(
+            mixture_cdf(lambda k: torch.special.gammaincc(k + 1, rate)),
+            q,
+            guess=guess,
+        )
+    total_count = components.total_count.unsqueeze(-2)
+    probs = components.probs.unsqueeze(-2)
+    # P(X <= k) = I_{1-p}(total_count, k + 1)
+    return _bisect_discrete(
+        mixture_cdf(lambda k: _betainc(total_count, k + 1, 1 - probs)),
+        q,
+        guess=guess,
+    )
+
+
+def _mixture_predict_quantiles(loss, distr_args, num_samples=None, **quantile_kwargs):
+    """Mean and quantiles of the mixture losses (`PMM`, `GMM` and `NBMM`).
+
+    The quantiles are found with `_mixture_quantiles`, or from samples when
+    `analytic_quantiles=False` or the components aren't supported.
+    """
+    if getattr(loss, "analytic_quantiles", True):
+        distr = loss.get_distribution(distr_args=distr_args)
+        quants = _mixture_quantiles(
+            distr, loss.quantiles.to(distr_args[0].device), **quantile_kwargs
+        )
+        if quants is not None:
+            return distr.mean, quants
+    _, sample_mean, quants = loss.sample(distr_args, num_samples=num_samples)
+    return sample_mean.squeeze(-1), quants
+
+
 class DistributionLoss(torch.nn.Module):
     """DistributionLoss
 
@@ -1830,6 +2112,8 @@ class DistributionLoss(torch.nn.Module):
         num_samples (int): Number of samples for the empirical quantiles.
         return_params (bool): Whether or not return the Distribution parameters.
         horizon_weight (Tensor): Tensor of size h, weight for each timestamp of the forecasting window.
+        analytic_quantiles (bool): Compute the mean and quantiles of the Normal, StudentT, Poisson,
+            NegativeBinomial and Bernoulli distributions without sampling. Defaults to True.
 
     Returns:
         tuple: Tuple with tensors of ISQF distribution arguments.
@@ -1849,6 +2133,7 @@ class DistributionLoss(torch.nn.Module):
         num_samples=1000,
         return_params=False,
         horizon_weight=None,
+        analytic_quantiles=True,
         **distribution_kwargs,
     ):
         super(DistributionLoss, self).__init__()
@@ -1927,6 +2212,7 @@ class DistributionLoss(torch.nn.Module):
         self.scale_decouple = scale_decouples[distribution]
         self.distribution_kwargs = distribution_kwargs
         self.num_samples = num_samples
+        self.analytic_quantiles = analytic_quantiles
         self.param_names = param_names[distribution]
 
         # If True, predict_step will return Distribution's parameters
@@ -1999,6 +2285,33 @@ class DistributionLoss(torch.nn.Module):
 
         return samples, sample_mean, quants
 
+    def predict_quantiles(
+        self, distr_args: torch.Tensor, num_samples: Optional[int] = None
+    ):
+        """
+        Mean and quantiles of the estimated Distribution, used when the samples aren't needed.
+        They're computed analytically for the Normal, StudentT, Poisson, NegativeBinomial and
+        Bernoulli distributions, and from `num_samples` samples for the other ones.
+
+        Args:
+            distr_args (torch.Tensor): Constructor arguments for the underlying Distribution type.
+            num_samples (int, optional): Overwrite number of samples for the empirical quantiles. Defaults to None.
+
+        Returns:
+            tuple: Tuple with the mean [B, H, N] and quantiles [B, H, N, Q].
+        """
+        if getattr(self, "analytic_quantiles", True):
+            distr = self.get_distribution(
+                distr_args=distr_args, **self.distribution_kwargs
+            )
+            quants = _analytic_quantiles(
+                distr, self.quantiles.to(distr_args[0].device)
+            )
+            if quants is not None:
+                return distr.mean, quants
+        _, sample_mean, quants = self.sample(distr_args, num_samples=num_samples)
+        return sample_mean.squeeze(-1), quants
+
     def update_quantile(self, q: Optional[List[float]] = None):
         if q is not None:
             self.quantiles = nn.Parameter(
@@ -2093,6 +2406,7 @@ class PMM(torch.nn.Module):
         return_params (bool, optional): Whether or not return the Distribution parameters. Defaults to False.
         batch_correlation (bool, optional): Whether or not model batch correlations. Defaults to False.
         horizon_correlation (bool, optional): Whether or not model horizon correlations. Defaults to False.
+        analytic_quantiles (bool, optional): Compute the mean and quantiles by inverting the mixture CDF instead of sampling. Defaults to True.
 
     References:
         - [Kin G. Olivares, O. Nganba Meetei, Ruijun Ma, Rohan Reddy, Mengfei Cao, Lee Dicker. Probabilistic Hierarchical Forecasting with Deep Poisson Mixtures. Submitted to the International Journal Forecasting, Working paper available at arxiv.](https://arxiv.org/pdf/2110.13179.pdf)
@@ -2108,6 +2422,7 @@ class PMM(torch.nn.Module):
         batch_correlation=False,
         horizon_correlation=False,
         weighted=False,
+        analytic_quantiles=True,
     ):
         super(PMM, self).__init__()
         # Transform level to MQLoss parameters
@@ -2123,6 +2438,7 @@ class PMM(torch.nn.Module):
         self.batch_correlation = batch_correlation
         self.horizon_correlation = horizon_correlation
         self.weighted = weighted
+        self.analytic_quantiles = analytic_quantiles
 
         # If True, predict_step will return Distribution's parameters
         self.return_params = return_params
@@ -2243,6 +2559,23 @@ class PMM(torch.nn.Module):
 
         return samples, sample_mean, quants
 
+    def predict_quantiles(
+        self, distr_args: torch.Tensor, num_samples: Optional[int] = None
+    ):
+        """
+        Mean and quantiles of the estimated Distribution, used when the samples aren't needed.
+        The quantiles are found by bisection of the mixture CDF, or from `num_samples` samples
+        when `analytic_quantiles=False`.
+
+        Args:
+            distr_args (torch.Tensor): Constructor arguments for the underlying Distribution type.
+            num_samples (int, optional): Overwrite number of samples for the empirical quantiles. Defaults to None.
+
+        Returns:
+            tuple: Tuple with the mean [B, H, N] and quantiles [B, H, N, Q].
+        """
+        return _mixture_predict_quantiles(self, distr_args, num_samples)
+
     def update_quantile(self, q: Optional[List[float]] = None):
         if q is not None:
             self.quantiles = nn.Parameter(
@@ -2323,6 +2656,8 @@ class GMM(torch.nn.Module):
         horizon_correlation (bool, optional): Whether or not model horizon correlations. Defaults to False.
         weighted (bool, optional): Whether or not model weighted components. Defaults to False.
         num_samples (int, optional): Number of samples for the empirical quantiles. Defaults to 1000.
+        analytic_quantiles (bool, optional): Compute the mean and quantiles by inverting the mixture CDF instead of sampling. Defaults to True.
+        quantile_tol (float, optional): Tolerance of the analytic quantiles, relative to the smallest standard deviation of the components. Defaults to 1e-4.
 
     References:
         - [Kin G. Olivares, O. Nganba Meetei, Ruijun Ma, Rohan Reddy, Mengfei Cao, Lee Dicker.
@@ -2340,6 +2675,8 @@ class GMM(torch.nn.Module):
         batch_correlation=False,
         horizon_correlation=False,
         weighted=False,
+        analytic_quantiles=True,
+        quantile_tol=1e-4,
     ):
         super(GMM, self).__init__()
         # Transform level to MQLoss parameters
@@ -2355,6 +2692,8 @@ class GMM(torch.nn.Module):
         self.batch_correlation = batch_correlation
         self.horizon_correlation = horizon_correlation
         self.weighted = weighted
+        self.analytic_quantiles = analytic_quantiles
+        self.quantile_tol = quantile_tol
 
         # If True, predict_step will return Distribution's parameters
         self.return_params = return_params
@@ -2478,6 +2817,25 @@ class GMM(torch.nn.Module):
 
         return samples, sample_mean, quants
 
+    def predict_quantiles(
+        self, distr_args: torch.Tensor, num_samples: Optional[int] = None
+    ):
+        """
+        Mean and quantiles of the estimated Distribution, used when the samples aren't needed.
+        The quantiles are found by bisection of the mixture CDF, or from `num_samples` samples
+        when `analytic_quantiles=False`.
+
+        Args:
+            distr_args (torch.Tensor): Constructor arguments for the underlying Distribution type.
+            num_samples (int, optional): Overwrite number of samples for the empirical quantiles. Defaults to None.
+
+        Returns:
+            tuple: Tuple with the mean [B, H, N] and quantiles [B, H, N, Q].
+        """
+        return _mixture_predict_quantiles(
+            self, distr_args, num_samples, tol=getattr(self, "quantile_tol", 1e-4)
+        )
+
     def update_quantile(self, q: Optional[List[float]] = None):
         if q is not None:
             self.quantiles = nn.Parameter(
@@ -2556,6 +2914,7 @@ class NBMM(torch.nn.Module):
         return_params (bool, optional): Whether or not return the Distribution parameters. Defaults to False.
         weighted (bool, optional): Whether or not model weighted components. Defaults to False.
         num_samples (int, optional): Number of samples for the empirical quantiles. Defaults to 1000.
+        analytic_quantiles (bool, optional): Compute the mean and quantiles by inverting the mixture CDF instead of sampling. Defaults to True.
 
     References:
         - [Kin G. Olivares, O. Nganba Meetei, Ruijun Ma, Rohan Reddy, Mengfei Cao, Lee Dicker.
@@ -2571,6 +2930,7 @@ class NBMM(torch.nn.Module):
         num_samples=1000,
         return_params=False,
         weighted=False,
+        analytic_quantiles=True,
     ):
         super(NBMM, self).__init__()
         # Transform level to MQLoss parameters
@@ -2584,6 +2944,7 @@ class NBMM(torch.nn.Module):
         self.quantiles = torch.nn.Parameter(qs, requires_grad=False)
         self.num_samples = num_samples
         self.weighted = weighted
+        self.analytic_quantiles = analytic_quantiles
 
         # If True, predict_step will return Distribution's parameters
         self.return_params = return_params
@@ -2717,6 +3078,23 @@ class NBMM(torch.nn.Module):
 
         return samples, sample_mean, quants
 
+    def predict_quantiles(
+        self, distr_args: torch.Tensor, num_samples: Optional[int] = None
+    ):
+        """
+        Mean and quantiles of the estimated Distribution, used when the samples aren't needed.
+        The quantiles are found by bisection of the mixture CDF, or from `num_samples` samples
+        when `analytic_quantiles=False`.
+
+        Args:
+            distr_args (torch.Tensor): Constructor arguments for the underlying Distribution type.
+            num_samples (int, optional): Overwrite number of samples for the empirical quantiles. Defaults to None.
+
+        Returns:
+            tuple: Tuple with the mean [B, H, N] and quantiles [B, H, N, Q].
+        """
+        return _mixture_predict_quantiles(self, distr_args, num_samples)
+
     def update_quantile(self, q: Optional[List[float]] = None):
         if q is not None:
             self.quantiles = nn.Parameter(
@@ -3185,8 +3563,10 @@ class HuberIQLoss(HuberQLoss):
         )
 
     def update_quantile(self, q: List[float] = [0.5]):
+        # Several quantiles are predicted in a single forward pass, see `domain_map`
         self.q = q[0]
-        self.output_names = [f"_ql{q[0]}"]
+        self.predict_quantiles = list(q)
+        self.output_names = [f"_ql{quantile}" for quantile in q]
         self.has_predicted = True
 
     def domain_map(self, y_hat):
@@ -3199,6 +3579,12 @@ class HuberIQLoss(HuberQLoss):
             - shape: [B, h, 1] for univariate
             - shape: [B, h, N] for multivariate
         """
+        if (
+            self.eval()
+            and self.has_predicted
+            and len(getattr(self, "predict_quantiles", [])) > 1
+        ):
+            return _predict_quantiles_map(self, y_hat)
         if self.eval() and self.has_predicted:
             quantiles = torch.full(
                 size=y_hat.shape,
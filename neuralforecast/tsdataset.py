@@ -5,10 +5,20 @@ __all__ = ['TimeSeriesLoader', 'BaseTimeSeriesDataset', 'TimeSeriesDataset', 'Lo
            'TimeSeriesDataModule']
 
 
+import hashlib
+import json
+import os
+import pickle
+import warnings
+from collections import OrderedDict
 from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import List, Optional, Sequence, Union
+from typing import Dict, List, Optional, Sequence, Union
 
+import fsspec
 import numpy as np
 import pandas as pd
 import pytorch_lightning as pl
@@ -17,6 +27,11 @@ import utilsforecast.processing as ufp
 from torch.utils.data import DataLoader, Dataset
 from utilsforecast.compat import DataFrame, pl_Series
 
+from neuralforecast.common._local_scalers import (
+    local_scalers_fit_transform,
+    scaled_temporal_cols,
+)
+
 
 class TimeSeriesLoader(DataLoader):
     """TimeSeriesLoader DataLoader.
@@ -35,16 +50,24 @@ class TimeSeriesLoader(DataLoader):
         sampler (Sampler or Iterable, optional): Defines the strategy to draw samples from the dataset. 
         Can be any Iterable with __len__ implemented. If specified, shuffle must not be specified. Defaults to None.
         drop_last (bool, optional): Set to True to drop the last incomplete batch. Defaults to False.
+        padding (_BatchPadding, optional): Padding of the batches of a `TimeSeriesDataset`.
+            Defaults to None, which pads every serie to the length of the longest one in the dataset.
         **kwargs: Additional keyword arguments for DataLoader.
     """
 
-    def __init__(self, dataset, **kwargs):
+    def __init__(self, dataset, padding: Optional["_BatchPadding"] = None, **kwargs):
         if "collate_fn" in kwargs:
             kwargs.pop("collate_fn")
         kwargs_ = {**kwargs, **dict(collate_fn=self._collate_fn)}
+        if padding is not None and isinstance(dataset, TimeSeriesDataset):
+            dataset = _PaddedBatches(dataset, padding)
         DataLoader.__init__(self, dataset=dataset, **kwargs_)
 
     def _collate_fn(self, batch):
+        # Batches built at once by the dataset (`__getitems__`)
+        if isinstance(batch, Mapping):
+            return batch
+
         elem = batch[0]
         elem_type = type(elem)
 
@@ -64,23 +87,112 @@ class TimeSeriesLoader(DataLoader):
 
         elif isinstance(elem, Mapping):
             if elem["static"] is None:
-                return dict(
+                out = dict(
                     temporal=self.collate_fn([d["temporal"] for d in batch]),
                     temporal_cols=elem["temporal_cols"],
                     y_idx=elem["y_idx"],
                 )
-
-            return dict(
-                static=self.collate_fn([d["static"] for d in batch]),
-                static_cols=elem["static_cols"],
-                temporal=self.collate_fn([d["temporal"] for d in batch]),
-                temporal_cols=elem["temporal_cols"],
-                y_idx=elem["y_idx"],
-            )
+            else:
+                out = dict(
+                    static=self.collate_fn([d["static"] for d in batch]),
+                    static_cols=elem["static_cols"],
+                    temporal=self.collate_fn([d["temporal"] for d in batch]),
+                    temporal_cols=elem["temporal_cols"],
+                    y_idx=elem["y_idx"],
+                )
+            # Position of each serie in the dataset, used to look up precomputed indices
+            if "idx" in elem:
+                out["idx"] = torch.tensor([d["idx"] for d in batch], dtype=torch.long)
+            return out
 
         raise TypeError(f"Unknown {elem_type}")
 
 
+@dataclass
+class _WindowsIndex:
+    """Valid training windows of every serie of a `TimeSeriesDataset`.
+
+    Windows are numbered by their position in the padded batch, as
+    produced by `BaseModel._create_windows`.
+
+    Args:
+        indptr (torch.Tensor): Offsets of the valid windows of each serie.
+        windows (torch.Tensor): Valid window positions, sorted within each serie.
+        n_windows (int): Number of windows per serie in the padded batch.
+    """
+
+    indptr: torch.Tensor
+    windows: torch.Tensor
+    n_windows: int
+
+    def to(self, device) -> "_WindowsIndex":
+        return _WindowsIndex(
+            indptr=self.indptr.to(device),
+            windows=self.windows.to(device),
+            n_windows=self.n_windows,
+        )
+
+    def batch_condition(
+        self, series_idxs: torch.Tensor, window_offset: int = 0
+    ) -> torch.Tensor:
+        """Flat indices (serie * n_windows + window) of the valid windows of a batch.
+
+        `window_offset` is the number of windows removed from the left of the batch
+        by its padding (see `_BatchPadding`).
+        """
+        counts = self.indptr[series_idxs + 1] - self.indptr[series_idxs]
+        starts = self.indptr[series_idxs]
+        batch_pos = torch.repeat_interleave(
+            torch.arange(len(series_idxs), device=counts.device), counts
+        )
+        offsets = torch.cumsum(counts, dim=0) - counts
+        positions = starts[batch_pos] + (
+            torch.arange(len(batch_pos), device=counts.device) - offsets[batch_pos]
+        )
+        windows = self.windows[positions] - window_offset
+        return batch_pos * (self.n_windows - window_offset) + windows
+
+
+@dataclass
+class _BatchPadding:
+    """Left padding of the batches built by `TimeSeriesDataset`.
+
+    Batches are padded up to the length of their longest serie plus `left_margin`,
+    and at least to `min_length`. The padding is removed from the left of the
+    dataset's padding in multiples of `alignment`, so the windows keep their
+    positions relative to the end of the series.
+
+    Args:
+        min_length (int): Minimum length of the batch. Defaults to 0.
+        left_margin (int): Padding kept to the left of the longest serie. Defaults to 0.
+        alignment (int): The removed padding is a multiple of it. Defaults to 1.
+    """
+
+    min_length: int = 0
+    left_margin: int = 0
+    alignment: int = 1
+
+    def left_trim(self, max_size: int, batch_max_size: int) -> int:
+        length = max(batch_max_size + self.left_margin, self.min_length)
+        return max(max_size - length, 0) // self.alignment * self.alignment
+
+
+def _empty_buffer(shape, share_memory: bool = False) -> torch.Tensor:
+    """Uninitialized float32 tensor owned by torch, in shared memory if `share_memory`."""
+    out = torch.empty(shape, dtype=torch.float32)
+    if share_memory:
+        # the pages of the new tensor aren't touched yet, so nothing is copied
+        out.share_memory_()
+    return out
+
+
+def _copy_buffer(x: Optional[torch.Tensor]) -> Optional[torch.Tensor]:
+    """Float32 copy of `x`, in shared memory if `x` is."""
+    if x is None:
+        return None
+    return _empty_buffer(x.shape, x.is_shared()).copy_(x)
+
+
 class BaseTimeSeriesDataset(Dataset):
     """Base class for time series datasets.
 
@@ -91,8 +203,12 @@ class BaseTimeSeriesDataset(Dataset):
         y_idx (int): Index of target variable.
         static (Optional): Static features array.
         static_cols (Optional): Column names for static features.
+        copy (bool): Whether to copy the arrays. Defaults to True.
     """
 
+    # tensors moved to shared memory by `share_memory`
+    _shared_attrs = ("static",)
+
     def __init__(
         self,
         temporal_cols,
@@ -101,12 +217,13 @@ class BaseTimeSeriesDataset(Dataset):
         y_idx: int,
         static=None,
         static_cols=None,
+        copy: bool = True,
     ):
         super().__init__()
         self.temporal_cols = pd.Index(list(temporal_cols))
 
         if static is not None:
-            self.static = self._as_torch_copy(static)
+            self.static = self._as_torch_copy(static, copy=copy)
             self.static_cols = static_cols
         else:
             self.static = static
@@ -122,29 +239,73 @@ class BaseTimeSeriesDataset(Dataset):
     def __len__(self):
         return self.n_groups
 
+    def share_memory(self) -> "BaseTimeSeriesDataset":
+        """Move the tensors of the dataset to shared memory.
+
+        The DataLoader workers then receive a handle to the shared memory instead of
+        their own copy of the data, so adding workers doesn't increase memory usage.
+        Moving a tensor copies it, datasets built with `share_memory=True` are already
+        in shared memory and aren't copied.
+
+        Returns:
+            BaseTimeSeriesDataset: The dataset itself.
+        """
+        for attr in self._shared_attrs:
+            x = getattr(self, attr, None)
+            if not isinstance(x, torch.Tensor) or x.is_shared():
+                continue
+            try:
+                x.share_memory_()
+            except RuntimeError:
+                # arrays that torch doesn't own, e.g. memory-mapped, can't be moved in place
+                shared = torch.empty_like(x).share_memory_()
+                shared.copy_(x)
+                setattr(self, attr, shared)
+        return self
+
     def _as_torch_copy(
         self,
         x: Union[np.ndarray, torch.Tensor],
         dtype: torch.dtype = torch.float32,
+        copy: bool = True,
     ) -> torch.Tensor:
         if isinstance(x, np.ndarray):
             x = torch.from_numpy(x)
-        return x.to(dtype, copy=False).clone()
+        x = x.to(dtype, copy=False)
+        return x.clone() if copy else x
 
     @staticmethod
-    def _ensure_available_mask(data: np.ndarray, temporal_cols):
-        if "available_mask" not in temporal_cols:
-            available_mask = np.ones((len(data), 1), dtype=np.float32)
-            temporal_cols = temporal_cols.append(pd.Index(["available_mask"]))
-            data = np.append(data, available_mask, axis=1)
-        return data, temporal_cols
+    def _ensure_available_mask(
+        data: np.ndarray, temporal_cols, out: Optional[np.ndarray] = None
+    ):
+        # float32 data with the mask as its last column, written in a single copy
+        has_mask = "available_mask" in temporal_cols
+        if out is None:
+            if has_mask:
+                return data.astype(np.float32, copy=False), temporal_cols
+            out = np.empty((len(data), data.shape[1] + 1), dtype=np.float32)
+        if has_mask:
+            out[:] = data
+            return out, temporal_cols
+        out[:, :-1] = data
+        out[:, -1] = 1.0
+        return out, temporal_cols.append(pd.Index(["available_mask"]))
 
     @staticmethod
-    def _extract_static_features(static_df, id_col):
+    def _extract_static_features(static_df, id_col, share_memory: bool = False):
         if static_df is not None:
-            static_df = ufp.sort(static_df, by=id_col)
+            ids = static_df[id_col]
+            if isinstance(static_df, pd.DataFrame):
+                is_sorted = ids.is_monotonic_increasing
+            else:
+                is_sorted = ids.is_sorted()
+            if not is_sorted:
+                static_df = ufp.sort(static_df, by=id_col)
             static_cols = [col for col in static_df.columns if col != id_col]
-            static = ufp.to_numpy(static_df[static_cols])
+            values = ufp.to_numpy(static_df[static_cols])
+            # new float32 tensor, owned by the dataset
+            static = _empty_buffer(values.shape, share_memory)
+            static.numpy()[:] = values
             static_cols = pd.Index(static_cols)
         else:
             static = None
@@ -162,8 +323,12 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
         y_idx (int): Index of target variable.
         static (Optional): Static features array.
         static_cols (Optional): Column names for static features.
+        copy (bool): Whether to copy the arrays, set to False to use them in place,
+            e.g. memory-mapped arrays. Defaults to True.
     """
 
+    _shared_attrs = ("temporal", "static")
+
     def __init__(
         self,
         temporal,
@@ -172,8 +337,9 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
         y_idx: int,
         static=None,
         static_cols=None,
+        copy: bool = True,
     ):
-        self.temporal = self._as_torch_copy(temporal)
+        self.temporal = self._as_torch_copy(temporal, copy=copy)
         self.indptr = indptr
         self.n_groups = self.indptr.size - 1
         sizes = np.diff(indptr)
@@ -184,7 +350,10 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
             y_idx=y_idx,
             static=static,
             static_cols=static_cols,
+            copy=copy,
         )
+        # Training windows indices, computed on demand and shared between models
+        self._windows_indices: Dict[tuple, _WindowsIndex] = {}
 
     def __getitem__(self, idx):
         if isinstance(idx, int):
@@ -209,11 +378,49 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
                 static=static,
                 static_cols=self.static_cols,
                 y_idx=self.y_idx,
+                idx=idx,
             )
 
             return item
         raise ValueError(f"idx must be int, got {type(idx)}")
 
+    def __getitems__(self, idxs: Sequence[int]) -> dict:
+        return self._get_batch(idxs)
+
+    def _get_batch(
+        self, idxs: Sequence[int], padding: Optional[_BatchPadding] = None
+    ) -> dict:
+        # Builds the left padded [B, C, T] batch with a single indexed copy
+        idxs = np.asarray(idxs, dtype=np.int64)
+        starts = self.indptr[idxs].astype(np.int64)
+        sizes = self.indptr[idxs + 1] - starts
+        left_trim = 0
+        if padding is not None:
+            left_trim = padding.left_trim(self.max_size, int(sizes.max()))
+        length = self.max_size - left_trim
+
+        offsets = np.cumsum(sizes) - sizes
+        steps = np.arange(sizes.sum()) - np.repeat(offsets, sizes)
+        batch_pos = torch.from_numpy(np.repeat(np.arange(len(idxs)), sizes))
+        rows = torch.from_numpy(np.repeat(starts, sizes) + steps)
+        times = torch.from_numpy(np.repeat(length - sizes, sizes) + steps)
+        temporal = torch.zeros(
+            size=(len(idxs), len(self.temporal_cols), length), dtype=torch.float32
+        )
+        temporal[batch_pos, :, times] = self.temporal[rows]
+
+        batch = dict(
+            temporal=temporal,
+            temporal_cols=self.temporal_cols,
+            y_idx=self.y_idx,
+            idx=torch.from_numpy(idxs),
+            left_trim=left_trim,
+        )
+        if self.static is not None:
+            batch["static"] = self.static[batch["idx"]]
+            batch["static_cols"] = self.static_cols
+        return batch
+
     def __repr__(self):
         return f"TimeSeriesDataset(n_data={self.temporal.shape[0]:,}, n_groups={self.n_groups:,})"
 
@@ -224,6 +431,179 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
             self.indptr, other.indptr
         )
 
+    def __getstate__(self):
+        # the windows indices are a cache, they're rebuilt on demand
+        state = self.__dict__.copy()
+        state["_windows_indices"] = {}
+        return state
+
+    def __setstate__(self, state):
+        state.setdefault("_windows_indices", {})
+        self.__dict__.update(state)
+
+    def save_arrays(self, path: str) -> None:
+        """Save the dataset as `.npy` arrays and a JSON manifest.
+
+        The arrays can be memory-mapped when loading them with `load_arrays`.
+
+        Args:
+            path (str): Directory where the arrays are written.
+        """
+        fs, _, _ = fsspec.get_fs_token_paths(path)
+        fs.makedirs(path, exist_ok=True)
+        arrays = dict(temporal=self.temporal.numpy(), indptr=np.asarray(self.indptr))
+        if self.static is not None:
+            arrays["static"] = self.static.numpy()
+        for name, array in arrays.items():
+            with fsspec.open(f"{path}/{name}.npy", "wb") as f:
+                np.save(f, np.ascontiguousarray(array))
+        manifest = dict(
+            arrays=list(arrays),
+            temporal_cols=self.temporal_cols.tolist(),
+            static_cols=None if self.static_cols is None else list(self.static_cols),
+            y_idx=int(self.y_idx),
+        )
+        with fsspec.open(f"{path}/manifest.json", "w") as f:
+            json.dump(manifest, f)
+
+    @staticmethod
+    def load_arrays(path: str, mmap: bool = False) -> "TimeSeriesDataset":
+        """Load a dataset saved with `save_arrays`.
+
+        Args:
+            path (str): Directory with the arrays and the manifest.
+            mmap (bool): Memory-map the arrays instead of reading them, only for local paths.
+                The arrays are mapped copy-on-write, so changes to the dataset aren't
+                written to the files. Defaults to False.
+
+        Returns:
+            TimeSeriesDataset: Loaded dataset.
+        """
+        fs, _, _ = fsspec.get_fs_token_paths(path)
+        if mmap and not _is_local_fs(fs):
+            raise ValueError("mmap is only supported for local paths.")
+        with fsspec.open(f"{path}/manifest.json", "r") as f:
+            manifest = json.load(f)
+        arrays = {}
+        for name in manifest["arrays"]:
+            if mmap:
+                arrays[name] = np.load(f"{path}/{name}.npy", mmap_mode="c")
+            else:
+                with fsspec.open(f"{path}/{name}.npy", "rb") as f:
+                    arrays[name] = np.load(f)
+        static_cols = manifest["static_cols"]
+        return TimeSeriesDataset(
+            temporal=arrays["temporal"],
+            temporal_cols=manifest["temporal_cols"],
+            indptr=np.array(arrays["indptr"]),
+            y_idx=manifest["y_idx"],
+            static=arrays.get("static"),
+            static_cols=None if static_cols is None else pd.Index(static_cols),
+            copy=False,
+        )
+
+    def windows_index(
+        self,
+        input_size: int,
+        h: int,
+        step_size: int,
+        min_insample_fraction: float,
+        min_outsample_fraction: float,
+        left_padding: int = 0,
+        right_padding: int = 0,
+        right_trim: int = 0,
+    ) -> _WindowsIndex:
+        """Index of the training windows that satisfy the availability thresholds.
+
+        The index is built from a cumulative sum of `available_mask`, so checking
+        a window is O(1). It is computed once per combination of arguments and
+        cached in the dataset, so models that share the same settings reuse it.
+
+        Args:
+            input_size (int): Insample size of the windows.
+            h (int): Outsample size of the windows.
+            step_size (int): Step size between consecutive windows.
+            min_insample_fraction (float): Minimum fraction of available insample points.
+            min_outsample_fraction (float): Minimum fraction of available outsample points.
+            left_padding (int, optional): Padding added to the left of the series. Defaults to 0.
+            right_padding (int, optional): Padding added to the right of the series. Defaults to 0.
+            right_trim (int, optional): Observations removed from the right of each serie
+                (validation and test sets). Defaults to 0.
+
+        Returns:
+            _WindowsIndex: Valid windows of every serie.
+        """
+        key = (
+            input_size,
+            h,
+            step_size,
+            min_insample_fraction,
+            min_outsample_fraction,
+            left_padding,
+            right_padding,
+            right_trim,
+        )
+        if key in self._windows_indices:
+            return self._windows_indices[key]
+
+        window_size = input_size + h
+        width = self.max_size - right_trim + left_padding + right_padding
+        n_windows = max((width - window_size) // step_size + 1, 0)
+        min_insample_points = max(1, int(input_size * min_insample_fraction))
+        min_outsample_points = max(1, int(h * min_outsample_fraction))
+
+        sizes = np.diff(self.indptr).astype(np.int64)
+        train_sizes = np.clip(sizes - right_trim, 0, None)
+        # position of the first observation of each serie in the padded batch
+        serie_starts = left_padding + self.max_size - sizes
+
+        # Only windows overlapping the available data can satisfy the thresholds
+        first_start = serie_starts - input_size + 1
+        last_start = serie_starts + train_sizes - 1
+        if h > 0:
+            last_start = last_start - input_size
+        first_window = -(-np.clip(first_start, 0, None) // step_size)
+        last_window = np.minimum(
+            np.floor_divide(last_start, step_size), n_windows - 1
+        )
+        counts = np.clip(last_window - first_window + 1, 0, None)
+        offsets = np.cumsum(counts) - counts
+        series = np.repeat(np.arange(self.n_groups), counts)
+        windows = np.repeat(first_window, counts) + (
+            np.arange(counts.sum()) - np.repeat(offsets, counts)
+        )
+
+        # Number of available points in [start, end) of every window
+        mask = self.temporal[:, self.temporal_cols.get_loc("available_mask")]
+        available_cumsum = np.append(0.0, np.cumsum(mask.numpy(), dtype=np.float64))
+        lower = serie_starts[series]
+        upper = lower + train_sizes[series]
+        row_offset = self.indptr[:-1].astype(np.int64)[series] - lower
+
+        def n_available(start, end):
+            start = np.clip(start, lower, upper) + row_offset
+            end = np.clip(end, lower, upper) + row_offset
+            return available_cumsum[end] - available_cumsum[start]
+
+        starts = windows * step_size
+        condition = (
+            n_available(starts, starts + input_size) >= min_insample_points
+        )
+        if h > 0:
+            outsample_available = n_available(
+                starts + input_size, starts + window_size
+            )
+            condition &= outsample_available >= min_outsample_points
+
+        valid_counts = np.bincount(series[condition], minlength=self.n_groups)
+        index = _WindowsIndex(
+            indptr=torch.from_numpy(np.append(0, np.cumsum(valid_counts))),
+            windows=torch.from_numpy(windows[condition]),
+            n_windows=int(n_windows),
+        )
+        self._windows_indices[key] = index
+        return index
+
     def align(
         self, df: DataFrame, id_col: str, time_col: str, target_col: str
     ) -> "TimeSeriesDataset":
@@ -269,28 +649,31 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
         # Define and fill new temporal with updated information
         len_temporal, col_temporal = self.temporal.shape
         len_futr = futr_dataset.temporal.shape[0]
-        new_temporal = torch.empty(size=(len_temporal + len_futr, col_temporal))
+        new_temporal = _empty_buffer(
+            (len_temporal + len_futr, col_temporal), self.temporal.is_shared()
+        )
         new_indptr = self.indptr + futr_dataset.indptr
 
-        for i in range(self.n_groups):
-            curr_slice = slice(self.indptr[i], self.indptr[i + 1])
-            curr_size = curr_slice.stop - curr_slice.start
-            futr_slice = slice(futr_dataset.indptr[i], futr_dataset.indptr[i + 1])
-            new_temporal[new_indptr[i] : new_indptr[i] + curr_size] = self.temporal[
-                curr_slice
-            ]
-            new_temporal[new_indptr[i] + curr_size : new_indptr[i + 1]] = (
-                futr_dataset.temporal[futr_slice]
-            )
+        # Rows of serie i are shifted by the future rows of the previous series,
+        # future rows by the current rows of the series up to i
+        curr_dst = np.arange(len_temporal) + np.repeat(
+            futr_dataset.indptr[:-1], np.diff(self.indptr)
+        )
+        futr_dst = np.arange(len_futr) + np.repeat(
+            self.indptr[1:], np.diff(futr_dataset.indptr)
+        )
+        new_temporal[torch.from_numpy(curr_dst)] = self.temporal
+        new_temporal[torch.from_numpy(futr_dst)] = futr_dataset.temporal
 
-        # Define new dataset
+        # Define new dataset, the scalers transform the static features in place
         return TimeSeriesDataset(
             temporal=new_temporal,
             temporal_cols=self.temporal_cols.copy(),
             indptr=new_indptr,
-            static=self.static,
+            static=_copy_buffer(self.static),
             y_idx=self.y_idx,
             static_cols=self.static_cols,
+            copy=False,
         )
 
     @staticmethod
@@ -325,38 +708,46 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
                                 must be lower than the shorter time series ({dataset.min_size})"
             )
 
-        # Define and fill new temporal with trimmed information
-        len_temporal, col_temporal = dataset.temporal.shape
-        total_trim = (left_trim + right_trim) * dataset.n_groups
-        new_temporal = torch.zeros(size=(len_temporal - total_trim, col_temporal))
-        new_indptr = [0]
-
-        acum = 0
-        for i in range(dataset.n_groups):
-            series_length = dataset.indptr[i + 1] - dataset.indptr[i]
-            new_length = series_length - left_trim - right_trim
-            new_temporal[acum : (acum + new_length), :] = dataset.temporal[
-                dataset.indptr[i] + left_trim : dataset.indptr[i + 1] - right_trim, :
-            ]
-            acum += new_length
-            new_indptr.append(acum)
-
-        # Define new dataset
+        # Gather the rows kept from every serie
+        new_sizes = np.diff(dataset.indptr) - left_trim - right_trim
+        new_indptr = np.append(0, np.cumsum(new_sizes)).astype(np.int32)
+        keep_rows = np.arange(new_indptr[-1]) + np.repeat(
+            dataset.indptr[:-1] + left_trim - new_indptr[:-1], new_sizes
+        )
+        new_temporal = torch.index_select(
+            dataset.temporal,
+            0,
+            torch.from_numpy(keep_rows),
+            out=_empty_buffer(
+                (len(keep_rows), dataset.temporal.shape[1]),
+                dataset.temporal.is_shared(),
+            ),
+        )
+
+        # Define new dataset, the scalers transform the static features in place
         return TimeSeriesDataset(
             temporal=new_temporal,
             temporal_cols=dataset.temporal_cols.copy(),
-            indptr=np.array(new_indptr, dtype=np.int32),
+            indptr=new_indptr,
             y_idx=dataset.y_idx,
-            static=dataset.static,
+            static=_copy_buffer(dataset.static),
             static_cols=dataset.static_cols,
+            copy=False,
         )
 
     @staticmethod
-    def from_df(df, static_df=None, id_col="unique_id", time_col="ds", target_col="y"):
+    def from_df(
+        df,
+        static_df=None,
+        id_col="unique_id",
+        time_col="ds",
+        target_col="y",
+        share_memory: bool = False,
+    ):
         # TODO: protect on equality of static_df + df indexes
         # Define indices if not given and then extract static features
         static, static_cols = TimeSeriesDataset._extract_static_features(
-            static_df, id_col
+            static_df, id_col, share_memory
         )
 
         ids, times, data, indptr, sort_idxs = ufp.process_df(
@@ -367,16 +758,19 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
             [target_col]
             + [c for c in df.columns if c not in (id_col, time_col, target_col)]
         )
-        temporal = data.astype(np.float32, copy=False)
         indices = ids
         if isinstance(df, pd.DataFrame):
             dates = pd.Index(times, name=time_col)
         else:
             dates = pl_Series(time_col, times)
 
-        # Add Available mask efficiently (without adding column to df)
-        temporal, temporal_cols = TimeSeriesDataset._ensure_available_mask(
-            data, temporal_cols
+        # Add Available mask efficiently (without adding column to df), the data is
+        # copied once into a tensor owned by the dataset, since it can be a view of
+        # df's memory. Building it in shared memory avoids copying it again for workers.
+        n_cols = data.shape[1] + ("available_mask" not in temporal_cols)
+        temporal = _empty_buffer((data.shape[0], n_cols), share_memory)
+        _, temporal_cols = TimeSeriesDataset._ensure_available_mask(
+            data, temporal_cols, out=temporal.numpy()
         )
 
         dataset = TimeSeriesDataset(
@@ -386,12 +780,113 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
             static_cols=static_cols,
             indptr=indptr,
             y_idx=0,
+            copy=False,
         )
         ds = df[time_col].to_numpy()
         if sort_idxs is not None:
             ds = ds[sort_idxs]
         return dataset, indices, dates, ds
 
+    @staticmethod
+    def from_lazy(
+        source,
+        static_df=None,
+        id_col="unique_id",
+        time_col="ds",
+        target_col="y",
+        chunk_size: int = 5_000_000,
+        share_memory: bool = False,
+    ):
+        """Create a dataset from a polars LazyFrame or a parquet dataset without loading it whole.
+
+        The sizes of the series are computed first to allocate the temporal buffer, then the
+        series are read in chunks of complete series sorted by id and written to their rows of
+        the buffer, so the peak memory stays close to the size of the dataset.
+
+        Args:
+            source (polars.LazyFrame or str): LazyFrame or path of a, possibly partitioned, parquet dataset.
+            static_df (DataFrame, optional): Static features DataFrame. Defaults to None.
+            id_col (str, optional): Name of ID column. Defaults to "unique_id".
+            time_col (str, optional): Name of time column. Defaults to "ds".
+            target_col (str, optional): Name of target column. Defaults to "y".
+            chunk_size (int, optional): Approximate number of rows read at once. Defaults to 5,000,000.
+            share_memory (bool, optional): Allocate the tensors in shared memory, to share them
+                with DataLoader workers or fit processes without copying them. Defaults to False.
+
+        Returns:
+            Tuple: Dataset, ids of the series, last time of each serie and times of every row,
+                like `TimeSeriesDataset.from_df`.
+        """
+        import polars as pl
+
+        if not isinstance(source, pl.LazyFrame):
+            source = pl.scan_parquet(source, hive_partitioning=True)
+        columns = source.collect_schema().names()
+        data_cols = [target_col] + [
+            c for c in columns if c not in (id_col, time_col, target_col)
+        ]
+        static, static_cols = TimeSeriesDataset._extract_static_features(
+            static_df, id_col, share_memory
+        )
+
+        sizes_df = (
+            source.group_by(id_col)
+            .agg(pl.len().alias("_size"), pl.col(time_col).max())
+            .sort(id_col)
+            .collect()
+        )
+        ids = sizes_df[id_col]
+        indptr = np.append(0, sizes_df["_size"].to_numpy().cumsum()).astype(np.int32)
+        n_series = len(ids)
+
+        temporal_cols = pd.Index(data_cols)
+        has_mask = "available_mask" in temporal_cols
+        if not has_mask:
+            temporal_cols = temporal_cols.append(pd.Index(["available_mask"]))
+        temporal_tensor = _empty_buffer((indptr[-1], len(temporal_cols)), share_memory)
+        temporal = temporal_tensor.numpy()
+        if not has_mask:
+            temporal[:, -1] = 1.0
+
+        # each chunk starts at the first serie past a multiple of chunk_size rows
+        bounds = np.searchsorted(indptr, np.arange(chunk_size, indptr[-1], chunk_size))
+        bounds = np.unique(np.concatenate([[0], bounds, [n_series]]))
+        ds = None
+        for first, last in zip(bounds[:-1], bounds[1:]):
+            chunk = (
+                source.filter(pl.col(id_col).is_between(ids[first], ids[last - 1]))
+                .sort([id_col, time_col])
+                .select([time_col, *[pl.col(c).cast(pl.Float32) for c in data_cols]])
+                .collect()
+            )
+            start, end = indptr[first], indptr[last]
+            if chunk.height != end - start:
+                raise ValueError("The source changed while the dataset was being built.")
+            for i, col in enumerate(data_cols):
+                temporal[start:end, i] = chunk[col].to_numpy()
+            times = chunk[time_col].to_numpy()
+            if ds is None:
+                ds = np.empty(indptr[-1], dtype=times.dtype)
+            ds[start:end] = times
+            del chunk
+
+        dataset = TimeSeriesDataset(
+            temporal=temporal_tensor,
+            temporal_cols=temporal_cols,
+            static=static,
+            static_cols=static_cols,
+            indptr=indptr,
+            y_idx=0,
+            copy=False,
+        )
+        dates = pl_Series(time_col, sizes_df[time_col])
+        return dataset, ids, dates, ds
+
+
+def _is_local_fs(fs) -> bool:
+    protocol = fs.protocol if isinstance(fs.protocol, tuple) else (fs.protocol,)
+    return "file" in protocol or "local" in protocol
+
 
 class _FilesDataset:
     def __init__(
@@ -403,6 +898,7 @@ class _FilesDataset:
         target_col: str,
         min_size: int,
         static_cols: Optional[List[str]] = None,
+        local_scaler_type: Optional[str] = None,
     ):
         self.files = files
         self.temporal_cols = pd.Index(temporal_cols)
@@ -411,6 +907,141 @@ class _FilesDataset:
         self.time_col = time_col
         self.target_col = target_col
         self.min_size = min_size
+        self.local_scaler_type = local_scaler_type
+
+
+def _directory_signature(dir_path: Path) -> tuple:
+    """Name, size and modification time of the parquet files of a directory.
+
+    Overwriting a file in place doesn't change the modification time of its
+    directory, so the files themselves are compared.
+    """
+    signature = []
+    for file in dir_path.glob("*.parquet"):
+        stat = file.stat()
+        signature.append((file.name, stat.st_size, stat.st_mtime_ns))
+    return tuple(sorted(signature))
+
+
+def _scan_directory(directory: str, time_col: str) -> dict:
+    """Rows, last time and columns of the parquet files of a serie directory."""
+    import pyarrow.parquet as pq
+
+    dir_path = Path(directory)
+    if not dir_path.is_dir():
+        raise ValueError(f"paths must be directories, {directory} is not.")
+    # taken before reading the files, so changes made while scanning are seen next time
+    signature = _directory_signature(dir_path)
+    total_rows = 0
+    last_time = None
+    files = []
+    for file in dir_path.glob("*.parquet"):
+        meta = pq.read_metadata(file)
+        rg = meta.row_group(0)
+        col2pos = {rg.column(i).path_in_schema: i for i in range(rg.num_columns)}
+
+        last_time_file = (
+            meta.row_group(meta.num_row_groups - 1)
+            .column(col2pos[time_col])
+            .statistics.max
+        )
+        last_time = (
+            max(last_time, last_time_file) if last_time is not None else last_time_file
+        )
+        total_rows += sum(
+            meta.row_group(i).num_rows for i in range(meta.num_row_groups)
+        )
+        files.append((str(file), list(col2pos.keys())))
+    return dict(
+        uid=dir_path.name.split("=")[-1],
+        total_rows=total_rows,
+        last_time=last_time,
+        files=files,
+        signature=signature,
+    )
+
+
+def _scan_directories(
+    directories: Sequence[str],
+    time_col: str,
+    n_jobs: int = 1,
+    backend: str = "thread",
+    manifest_path: Optional[str] = None,
+) -> List[dict]:
+    if backend not in ("thread", "process"):
+        raise ValueError(f"scan_backend must be 'thread' or 'process', got {backend}")
+
+    manifest = {}
+    if manifest_path is not None and Path(manifest_path).exists():
+        with open(manifest_path, "rb") as f:
+            manifest = pickle.load(f)
+        if manifest.get("time_col") != time_col:
+            manifest = {}
+    scanned = manifest.get("directories", {})
+
+    # Reuse the scans of the directories that didn't change
+    scans: List[Optional[dict]] = [None] * len(directories)
+    pending = []
+    for i, directory in enumerate(directories):
+        scan = scanned.get(str(directory))
+        dir_path = Path(directory)
+        if (
+            scan is not None
+            and dir_path.is_dir()
+            and _directory_signature(dir_path) == scan.get("signature")
+        ):
+            scans[i] = scan
+        else:
+            pending.append(i)
+
+    pending_dirs = [directories[i] for i in pending]
+    if n_jobs == 1 or len(pending_dirs) <= 1:
+        results = [_scan_directory(d, time_col) for d in pending_dirs]
+    else:
+        executor_class = (
+            ThreadPoolExecutor if backend == "thread" else ProcessPoolExecutor
+        )
+        max_workers = None if n_jobs == -1 else n_jobs
+        with executor_class(max_workers=max_workers) as executor:
+            # map keeps the order of the directories
+            results = list(
+                executor.map(
+                    partial(_scan_directory, time_col=time_col),
+                    pending_dirs,
+                    chunksize=1 if backend == "thread" else 64,
+                )
+            )
+    for i, result in zip(pending, results):
+        scans[i] = result
+
+    if manifest_path is not None and pending:
+        manifest = dict(
+            time_col=time_col,
+            directories={str(d): scan for d, scan in zip(directories, scans)},
+        )
+        tmp_path = f"{manifest_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(manifest, f)
+        os.replace(tmp_path, manifest_path)
+    return scans
+
+
+class _PaddedBatches(Dataset):
+    """Batches of a `TimeSeriesDataset` with the given padding."""
+
+    def __init__(self, dataset: TimeSeriesDataset, padding: _BatchPadding):
+        super().__init__()
+        self.dataset = dataset
+        self.padding = padding
+
+    def __len__(self):
+        return len(self.dataset)
+
+    def __getitem__(self, idx):
+        return self.dataset[idx]
+
+    def __getitems__(self, idxs: Sequence[int]) -> dict:
+        return self.dataset._get_batch(idxs, padding=self.padding)
 
 
 class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
@@ -429,6 +1060,13 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
         y_idx (int): Index of target variable.
         static (Optional): Static features array.
         static_cols (Optional): Column names for static features.
+        cache_size (int, optional): Maximum size in bytes of the in-memory LRU cache of
+            decoded series. Each DataLoader worker keeps its own cache. Defaults to None (no cache).
+        cache_dir (str, optional): Directory where the decoded series are stored as `.npy` files
+            and memory-mapped in later reads. The cache isn't invalidated when the parquet
+            files change, remove the directory in that case. Defaults to None (no disk cache).
+        local_scaler_type (str, optional): Scaler fitted to each serie when it's read and applied
+            to its temporal features. Defaults to None (no scaling).
     """
 
     def __init__(
@@ -445,6 +1083,9 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
         y_idx: int,
         static=None,
         static_cols=None,
+        cache_size: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+        local_scaler_type: Optional[str] = None,
     ):
         super().__init__(
             temporal_cols=temporal_cols,
@@ -463,24 +1104,120 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
         self.indices = indices
         self.n_groups = len(files_ds)
 
+        if cache_size is not None and cache_size < 0:
+            raise ValueError(f"cache_size must be non-negative, got {cache_size}")
+        self.cache_size = cache_size
+        self.cache_dir = cache_dir
+        self.local_scaler_type = local_scaler_type
+        if cache_dir is not None:
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        self._init_cache()
+
+    def _init_cache(self):
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_nbytes = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def __getstate__(self):
+        # the decoded series are process local
+        state = self.__dict__.copy()
+        for attr in ["_cache", "_cache_nbytes", "cache_hits", "cache_misses"]:
+            state.pop(attr, None)
+        return state
+
+    def __setstate__(self, state):
+        state.setdefault("cache_size", None)
+        state.setdefault("cache_dir", None)
+        state.setdefault("local_scaler_type", None)
+        self.__dict__.update(state)
+        self._init_cache()
+
+    def cache_info(self) -> dict:
+        """Statistics of the in-memory cache of decoded series.
+
+        Returns:
+            dict: Number of hits and misses, number of cached series and their size in bytes.
+        """
+        return dict(
+            hits=self.cache_hits,
+            misses=self.cache_misses,
+            n_series=len(self._cache),
+            nbytes=self._cache_nbytes,
+            max_nbytes=self.cache_size,
+        )
+
+    def _disk_cache_path(self, idx: int) -> Path:
+        key = f"{self.files_ds[idx]}|{'|'.join(self.temporal_cols)}"
+        return Path(self.cache_dir) / f"{hashlib.md5(key.encode()).hexdigest()}.npy"
+
+    def _read_serie(self, idx: int) -> np.ndarray:
+        # decoded serie as a float32 array of shape [n_temporal, n_rows]
+        if self.cache_dir is not None:
+            cache_path = self._disk_cache_path(idx)
+            if cache_path.exists():
+                return np.load(cache_path, mmap_mode="r")
+
+        data = pd.read_parquet(
+            self.files_ds[idx], columns=self.temporal_cols.tolist()
+        ).to_numpy()
+        data, _ = TimeSeriesDataset._ensure_available_mask(
+            data, self.temporal_cols.copy()
+        )
+        data = np.ascontiguousarray(data.T, dtype=np.float32)
+
+        if self.cache_dir is not None:
+            # write to a temporary file first, so concurrent readers never see partial files
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp.npy")
+            np.save(tmp_path, data)
+            os.replace(tmp_path, cache_path)
+        return data
+
+    def _get_serie(self, idx: int) -> np.ndarray:
+        if not self.cache_size:
+            return self._read_serie(idx)
+
+        data = self._cache.get(idx)
+        if data is not None:
+            self._cache.move_to_end(idx)
+            self.cache_hits += 1
+            return data
+
+        self.cache_misses += 1
+        data = self._read_serie(idx)
+        if data.nbytes <= self.cache_size:
+            # evict the least recently used series until the new one fits
+            while self._cache_nbytes + data.nbytes > self.cache_size:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_nbytes -= evicted.nbytes
+            self._cache[idx] = data
+            self._cache_nbytes += data.nbytes
+        return data
+
     def __getitem__(self, idx):
         if not isinstance(idx, int):
             raise ValueError(f"idx must be int, got {type(idx)}")
 
         temporal_cols = self.temporal_cols.copy()
-        data = pd.read_parquet(
-            self.files_ds[idx], columns=temporal_cols.tolist()
-        ).to_numpy()
-        data, temporal_cols = TimeSeriesDataset._ensure_available_mask(
-            data, temporal_cols
-        )
-        data = self._as_torch_copy(data)
+        if "available_mask" not in temporal_cols:
+            temporal_cols = temporal_cols.append(pd.Index(["available_mask"]))
+        data = self._get_serie(idx)
 
         # Pad the temporal data to the left
         temporal = torch.zeros(
             size=(len(temporal_cols), self.max_size), dtype=torch.float32
         )
-        temporal[: len(temporal_cols), -len(data) :] = data.permute(1, 0)
+        # copy through numpy, the cached arrays can be read-only memory maps
+        temporal.numpy()[: len(temporal_cols), -data.shape[1] :] = data
+        if self.local_scaler_type is not None:
+            # each file holds a complete serie, so its scaler is fitted here.
+            # the cache keeps the unscaled values
+            local_scalers_fit_transform(
+                temporal[:, -data.shape[1] :].T,
+                np.array([0, data.shape[1]]),
+                scaled_temporal_cols(temporal_cols),
+                scaler_type=self.local_scaler_type,
+            )
 
         # Add static data if available
         static = None if self.static is None else self.static[idx, :]
@@ -503,6 +1240,12 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
         id_col="unique_id",
         time_col="ds",
         target_col="y",
+        cache_size=None,
+        cache_dir=None,
+        n_jobs=1,
+        scan_backend="thread",
+        manifest_path=None,
+        local_scaler_type=None,
     ):
         """Create dataset from data directories.
 
@@ -518,17 +1261,36 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
             id_col (str, optional): Name of ID column. Defaults to "unique_id".
             time_col (str, optional): Name of time column. Defaults to "ds".
             target_col (str, optional): Name of target column. Defaults to "y".
+            cache_size (int, optional): Maximum size in bytes of the in-memory cache of decoded series.
+                Defaults to None (no cache).
+            cache_dir (str, optional): Directory for the memory-mapped cache of decoded series.
+                Defaults to None (no disk cache).
+            n_jobs (int, optional): Number of workers used to read the parquet metadata. Defaults to 1.
+            scan_backend (str, optional): Pool used for the metadata scan, 'thread' or 'process'.
+                Defaults to 'thread'.
+            manifest_path (str, optional): File where the results of the metadata scan are stored.
+                Directories whose parquet files kept their names, sizes and modification times
+                are not scanned again.
+                Defaults to None (no manifest).
+            local_scaler_type (str, optional): Scaler fitted to each serie when it's read.
+                Defaults to None (no scaling).
 
         Returns:
             LocalFilesTimeSeriesDataset: Dataset created from directories.
         """
-        import pyarrow as pa
-
         # Define indices if not given and then extract static features
         static, static_cols = TimeSeriesDataset._extract_static_features(
             static_df, id_col
         )
 
+        scans = _scan_directories(
+            directories,
+            time_col=time_col,
+            n_jobs=n_jobs,
+            backend=scan_backend,
+            manifest_path=manifest_path,
+        )
+
         max_size = 0
         min_size = float("inf")
         last_times = []
@@ -536,42 +1298,16 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
         expected_temporal = {target_col, *exogs}
         available_mask_seen = True
 
-        for dir in directories:
-            dir_path = Path(dir)
-            if not dir_path.is_dir():
-                raise ValueError(f"paths must be directories, {dir} is not.")
-            uid = dir_path.name.split("=")[-1]
-            total_rows = 0
-            last_time = None
-            for file in dir_path.glob("*.parquet"):
-                meta = pa.parquet.read_metadata(file)
-                rg = meta.row_group(0)
-                col2pos = {
-                    rg.column(i).path_in_schema: i for i in range(rg.num_columns)
-                }
-
-                last_time_file = (
-                    meta.row_group(meta.num_row_groups - 1)
-                    .column(col2pos[time_col])
-                    .statistics.max
-                )
-                last_time = (
-                    max(last_time, last_time_file)
-                    if last_time is not None
-                    else last_time_file
-                )
-                total_rows += sum(
-                    meta.row_group(i).num_rows for i in range(meta.num_row_groups)
-                )
-
+        for scan in scans:
+            for file, columns in scan["files"]:
                 # Check all the temporal columns are present
-                missing_cols = expected_temporal - col2pos.keys()
+                missing_cols = expected_temporal - set(columns)
                 if missing_cols:
                     raise ValueError(
                         f"Temporal columns: {missing_cols} not found in the file: {file}."
                     )
 
-                if "available_mask" not in col2pos.keys():
+                if "available_mask" not in columns:
                     available_mask_seen = False
                 elif not available_mask_seen:
                     # If this is triggered the available_mask column is present in this file but has been missing from previous files.
@@ -581,10 +1317,10 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
                 else:
                     expected_temporal.add("available_mask")
 
-            max_size = max(total_rows, max_size)
-            min_size = min(total_rows, min_size)
-            ids.append(uid)
-            last_times.append(last_time)
+            max_size = max(scan["total_rows"], max_size)
+            min_size = min(scan["total_rows"], min_size)
+            ids.append(scan["uid"])
+            last_times.append(scan["last_time"])
 
         last_times = pd.Index(last_times, name=time_col)
         ids = pd.Series(ids, name=id_col)
@@ -606,6 +1342,9 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
             y_idx=0,
             static=static,
             static_cols=static_cols,
+            cache_size=cache_size,
+            cache_dir=cache_dir,
+            local_scaler_type=local_scaler_type,
         )
         return dataset
 
@@ -619,7 +1358,12 @@ class TimeSeriesDataModule(pl.LightningDataModule):
         valid_batch_size (int, optional): Batch size for validation. Defaults to 1024.
         drop_last (bool, optional): Whether to drop the last incomplete batch. Defaults to False.
         shuffle_train (bool, optional): Whether to shuffle training data. Defaults to True.
-        **dataloaders_kwargs: Additional keyword arguments for data loaders.
+        train_padding (_BatchPadding, optional): Padding of the training batches. Defaults to None.
+        valid_padding (_BatchPadding, optional): Padding of the validation and prediction batches. Defaults to None.
+        **dataloaders_kwargs: Additional keyword arguments for data loaders. With `num_workers` > 0,
+            the tensors of `dataset` are moved to shared memory in place by the first module that
+            uses it, later modules reuse them. Build the dataset with `share_memory=True` to avoid
+            copying them.
     """
 
     def __init__(
@@ -629,14 +1373,24 @@ class TimeSeriesDataModule(pl.LightningDataModule):
         valid_batch_size=1024,
         drop_last=False,
         shuffle_train=True,
+        train_padding=None,
+        valid_padding=None,
         **dataloaders_kwargs
     ):
         super().__init__()
+        if dataloaders_kwargs.get("num_workers", 0) > 0:
+            try:
+                dataset.share_memory()
+            except RuntimeError as e:
+                # e.g. /dev/shm is too small, the workers get copies of the data
+                warnings.warn(f"Couldn't move the dataset to shared memory: {e}")
         self.dataset = dataset
         self.batch_size = batch_size
         self.valid_batch_size = valid_batch_size
         self.drop_last = drop_last
         self.shuffle_train = shuffle_train
+        self.train_padding = train_padding
+        self.valid_padding = valid_padding
         self.dataloaders_kwargs = dataloaders_kwargs
 
     def train_dataloader(self):
@@ -645,6 +1399,7 @@ class TimeSeriesDataModule(pl.LightningDataModule):
             batch_size=self.batch_size,
             shuffle=self.shuffle_train,
             drop_last=self.drop_last,
+            padding=self.train_padding,
             **self.dataloaders_kwargs
         )
         return loader
@@ -655,6 +1410,7 @@ class TimeSeriesDataModule(pl.LightningDataModule):
             batch_size=self.valid_batch_size,
             shuffle=False,
             drop_last=self.drop_last,
+            padding=self.valid_padding,
             **self.dataloaders_kwargs
         )
         return loader
@@ -664,6 +1420,7 @@ class TimeSeriesDataModule(pl.LightningDataModule):
             self.dataset,
             batch_size=self.valid_batch_size,
             shuffle=False,
+            padding=self.valid_padding,
             **self.dataloaders_kwargs
         )
         return loader
@@ -677,6 +1434,8 @@ class _DistributedTimeSeriesDataModule(TimeSeriesDataModule):
         valid_batch_size=1024,
         drop_last=False,
         shuffle_train=True,
+        train_padding=None,
+        valid_padding=None,
         **dataloaders_kwargs
     ):
         super(TimeSeriesDataModule, self).__init__()
@@ -685,6 +1444,8 @@ class _DistributedTimeSeriesDataModule(TimeSeriesDataModule):
         self.valid_batch_size = valid_batch_size
         self.drop_last = drop_last
         self.shuffle_train = shuffle_train
+        self.train_padding = train_padding
+        self.valid_padding = valid_padding
         self.dataloaders_kwargs = dataloaders_kwargs
 
     def setup(self, stage):
@@ -707,3 +1468,13 @@ class _DistributedTimeSeriesDataModule(TimeSeriesDataModule):
             time_col=self.files_ds.time_col,
             target_col=self.files_ds.target_col,
         )
+        scaler_type = getattr(self.files_ds, "local_scaler_type", None)
+        if scaler_type is not None:
+            # the partitions hold complete series, so the scalers fitted on them
+            # are the same as the ones fitted on the whole dataset
+            local_scalers_fit_transform(
+                self.dataset.temporal,
+                self.dataset.indptr,
+                scaled_temporal_cols(self.dataset.temporal_cols),
+                scaler_type=scaler_type,
+            )
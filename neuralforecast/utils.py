@@ -13,7 +13,7 @@ __all__ = ['AirPassengers', 'AirPassengersDF', 'unique_id', 'ds', 'y', 'AirPasse
 import math
 import random
 from itertools import chain
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -484,6 +484,7 @@ class PredictionIntervals:
         n_windows: int = 2,
         method: str = "conformal_distribution",
         step_size: int = 1,
+        calibration: str = "cross_validation",
     ):
         """Initialize PredictionIntervals.
 
@@ -492,6 +493,11 @@ class PredictionIntervals:
             method (str, optional): One of the supported methods for the computation of prediction intervals:
                 conformal_error or conformal_distribution. Defaults to "conformal_distribution".
             step_size (int, optional): Step size between each cross-validation window. Defaults to 1.
+            calibration (str, optional): How the conformity scores are computed. With "cross_validation"
+                the models are trained without the last `n_windows` windows to score them and then trained
+                again on all the data. With "holdout" the models are trained once without the last windows
+                and scored on them, so the final models don't see those observations. "holdout" can't be
+                used with a `val_df`. Defaults to "cross_validation".
         """
         if n_windows < 2:
             raise ValueError(
@@ -502,19 +508,45 @@ class PredictionIntervals:
             raise ValueError(f"method must be one of {allowed_methods}")
         if step_size < 1:
             raise ValueError("step_size must be at least 1")
+        allowed_calibrations = ["cross_validation", "holdout"]
+        if calibration not in allowed_calibrations:
+            raise ValueError(f"calibration must be one of {allowed_calibrations}")
         self.n_windows = n_windows
         self.method = method
         self.step_size = step_size
+        self.calibration = calibration
 
     def __repr__(self):
         return (
-            f"PredictionIntervals(n_windows={self.n_windows}, method='{self.method}', step_size={self.step_size})"
+            f"PredictionIntervals(n_windows={self.n_windows}, method='{self.method}', "
+            f"step_size={self.step_size}, calibration='{self.calibration}')"
         )
 
+    def __setstate__(self, state):
+        # intervals pickled before the calibration option was added
+        state.setdefault("calibration", "cross_validation")
+        self.__dict__.update(state)
+
+
+def _get_conformity_scores(
+    cs_df: Union[DFType, Dict[str, np.ndarray]],
+    model: str,
+    n_series: int,
+    cs_n_windows: int,
+    horizon: int,
+) -> np.ndarray:
+    # The scores are stored as an array of shape [n_series, n_windows, h] per model,
+    # older versions stored them in a long DataFrame sorted by serie, window and time.
+    if isinstance(cs_df, dict):
+        scores = cs_df[model]
+    else:
+        scores = cs_df[model].to_numpy()
+    return scores.reshape(n_series, cs_n_windows, horizon)
+
 
 def add_conformal_distribution_intervals(
     model_fcsts: np.array,
-    cs_df: DFType,
+    cs_df: Union[DFType, Dict[str, np.ndarray]],
     model: str,
     cs_n_windows: int,
     n_series: int,
@@ -528,7 +560,7 @@ def add_conformal_distribution_intervals(
 
     Args:
         model_fcsts (np.array): Model forecasts array.
-        cs_df (DFType): DataFrame containing conformal scores.
+        cs_df (DFType or dict): Conformity scores, an array of shape [n_series, n_windows, horizon] per model or a DataFrame with a column per model.
         model (str): Model name.
         cs_n_windows (int): Number of conformal score windows.
         n_series (int): Number of series.
@@ -550,7 +582,7 @@ def add_conformal_distribution_intervals(
     elif quantiles is not None:
         cuts = quantiles
 
-    scores = cs_df[model].to_numpy().reshape(n_series, cs_n_windows, horizon)
+    scores = _get_conformity_scores(cs_df, model, n_series, cs_n_windows, horizon)
     scores = scores.transpose(1, 0, 2)
     # restrict scores to horizon
     scores = scores[:, :, :horizon]
@@ -576,7 +608,7 @@ def add_conformal_distribution_intervals(
 
 def add_conformal_error_intervals(
     model_fcsts: np.array,
-    cs_df: DFType,
+    cs_df: Union[DFType, Dict[str, np.ndarray]],
     model: str,
     cs_n_windows: int,
     n_series: int,
@@ -590,7 +622,7 @@ def add_conformal_error_intervals(
 
     Args:
         model_fcsts (np.array): Model forecasts array.
-        cs_df (DFType): DataFrame containing conformal scores.
+        cs_df (DFType or dict): Conformity scores, an array of shape [n_series, n_windows, horizon] per model or a DataFrame with a column per model.
         model (str): Model name.
         cs_n_windows (int): Number of conformal score windows.
         n_series (int): Number of series.
@@ -613,7 +645,7 @@ def add_conformal_error_intervals(
         cuts = quantiles
 
     mean = model_fcsts.ravel()
-    scores = cs_df[model].to_numpy().reshape(n_series, cs_n_windows, horizon)
+    scores = _get_conformity_scores(cs_df, model, n_series, cs_n_windows, horizon)
     scores = scores.transpose(1, 0, 2)
     # restrict scores to horizon
     scores = scores[:, :, :horizon]
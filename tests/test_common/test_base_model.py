@@ -0,0 +1,395 @@
+import numpy as np
+import pandas as pd
+import pytest
+import torch
+
+from neuralforecast.common._base_model import _WarmStart
+from neuralforecast.losses.pytorch import DistributionLoss
+from neuralforecast.models import LSTM, NHITS, DeepAR, MLPMultivariate
+from neuralforecast.tsdataset import TimeSeriesDataset, TimeSeriesLoader
+from neuralforecast.utils import generate_series
+
+
+def _train_batch(n_series=3, n_time=60, n_cols=2, seed=0):
+    torch.manual_seed(seed)
+    temporal = torch.rand(n_series, n_cols + 1, n_time)
+    mask = (torch.rand(n_series, n_time) > 0.2).float()
+    # left padding as produced by TimeSeriesDataset for shorter series
+    mask[0, :15] = 0.0
+    temporal[0, :, :15] = 0.0
+    temporal[:, -1] = mask
+    temporal_cols = pd.Index(
+        ["y"] + [f"x_{i}" for i in range(n_cols - 1)] + ["available_mask"]
+    )
+    return dict(
+        temporal=temporal,
+        temporal_cols=temporal_cols,
+        static=torch.arange(n_series, dtype=torch.float32).unsqueeze(-1),
+        static_cols=pd.Index(["s"]),
+        y_idx=0,
+    )
+
+
+def _unfolded_train_windows(model, batch):
+    # Reference implementation: materialize every window of the batch
+    window_size = model.input_size + model.h
+    temporal = model.padder_train(batch["temporal"])
+    windows = temporal.unfold(dimension=-1, size=window_size, step=model.step_size)
+    available_idx = batch["temporal_cols"].get_loc("available_mask")
+    if model.MULTIVARIATE:
+        windows = windows.permute(2, 3, 1, 0)
+    else:
+        windows = windows.permute(0, 2, 3, 1).flatten(0, 1).unsqueeze(-1)
+    insample = windows[:, : model.input_size, available_idx].sum(dim=(1, -1))
+    outsample = windows[:, model.input_size :, available_idx].sum(dim=(1, -1))
+    min_insample = max(
+        1, int(model.input_size * model.min_insample_fraction * model.n_series)
+    )
+    min_outsample = max(1, int(model.h * model.min_outsample_fraction * model.n_series))
+    condition = (insample >= min_insample) & (outsample >= min_outsample)
+    return windows, torch.nonzero(condition).squeeze(-1)
+
+
+@pytest.mark.parametrize("threshold", [0.0, 0.6])
+@pytest.mark.parametrize("step_size", [1, 4])
+@pytest.mark.parametrize("start_padding_enabled", [False, True])
+def test_lazy_train_windows_match_unfold(threshold, step_size, start_padding_enabled):
+    model = NHITS(
+        h=6,
+        input_size=12,
+        step_size=step_size,
+        start_padding_enabled=start_padding_enabled,
+        training_data_availability_threshold=threshold,
+        max_steps=1,
+    )
+    batch = _train_batch()
+    expected_windows, expected_condition = _unfolded_train_windows(model, batch)
+
+    temporal, window_starts, final_condition = model._create_windows(
+        batch, step="train"
+    )
+    torch.testing.assert_close(final_condition, expected_condition)
+
+    windows = model._gather_train_windows(
+        batch=batch,
+        temporal=temporal,
+        window_starts=window_starts,
+        w_idxs_final=final_condition,
+    )
+    torch.testing.assert_close(windows["temporal"], expected_windows[final_condition])
+    n_starts = len(window_starts)
+    torch.testing.assert_close(
+        windows["static"],
+        batch["static"][torch.div(final_condition, n_starts, rounding_mode="floor")],
+    )
+
+
+def test_lazy_train_windows_multivariate():
+    model = MLPMultivariate(h=6, input_size=12, n_series=3, max_steps=1)
+    batch = _train_batch()
+    expected_windows, expected_condition = _unfolded_train_windows(model, batch)
+
+    temporal, window_starts, final_condition = model._create_windows(
+        batch, step="train"
+    )
+    torch.testing.assert_close(final_condition, expected_condition)
+    windows = model._gather_train_windows(
+        batch=batch,
+        temporal=temporal,
+        window_starts=window_starts,
+        w_idxs_final=final_condition,
+    )
+    torch.testing.assert_close(windows["temporal"], expected_windows[final_condition])
+
+
+@pytest.mark.parametrize("threshold", [0.0, (0.5, 0.8)])
+@pytest.mark.parametrize("step_size", [1, 3])
+@pytest.mark.parametrize("start_padding_enabled", [False, True])
+@pytest.mark.parametrize("val_size", [0, 5])
+def test_train_windows_index_matches_batch(
+    threshold, step_size, start_padding_enabled, val_size
+):
+    df = generate_series(n_series=8, min_length=20, max_length=60, seed=1)
+    df["available_mask"] = (np.random.default_rng(0).random(len(df)) > 0.3).astype(
+        np.float32
+    )
+    dataset, *_ = TimeSeriesDataset.from_df(df)
+    model = NHITS(
+        h=4,
+        input_size=8,
+        step_size=step_size,
+        start_padding_enabled=start_padding_enabled,
+        training_data_availability_threshold=threshold,
+        max_steps=1,
+    )
+    model.val_size = val_size
+    # shuffled batches that only contain some of the series
+    loader = TimeSeriesLoader(dataset, batch_size=3, shuffle=True)
+    for batch in loader:
+        model._train_windows_index = None
+        _, expected_starts, expected = model._create_windows(batch, step="train")
+        model._train_windows_index = model._build_train_windows_index(dataset)
+        _, window_starts, final_condition = model._create_windows(
+            batch, step="train"
+        )
+        torch.testing.assert_close(window_starts, expected_starts)
+        torch.testing.assert_close(final_condition, expected)
+    # computed once and shared between models with the same settings
+    assert model._build_train_windows_index(dataset) is model._train_windows_index
+
+
+@pytest.mark.parametrize("step_size", [1, 3])
+@pytest.mark.parametrize("start_padding_enabled", [False, True])
+def test_padded_batches_keep_train_windows(step_size, start_padding_enabled):
+    df = generate_series(n_series=10, min_length=20, max_length=120, seed=2)
+    dataset, *_ = TimeSeriesDataset.from_df(df)
+    model = NHITS(
+        h=4,
+        input_size=8,
+        step_size=step_size,
+        start_padding_enabled=start_padding_enabled,
+        max_steps=1,
+    )
+    model.val_size = 4
+    padding = model._batch_padding(step="train")
+    # batches of the shortest series are trimmed the most
+    idxs = np.argsort(np.diff(dataset.indptr))[:4].tolist()
+    full_batch = dataset._get_batch(idxs)
+    batch = dataset._get_batch(idxs, padding=padding)
+    assert batch["left_trim"] > 0
+    assert batch["left_trim"] % step_size == 0
+
+    for use_index in [False, True]:
+        model._train_windows_index = (
+            model._build_train_windows_index(dataset) if use_index else None
+        )
+        windows = []
+        for b in [full_batch, batch]:
+            temporal, window_starts, final_condition = model._create_windows(
+                b, step="train"
+            )
+            windows.append(
+                model._gather_train_windows(
+                    batch=b,
+                    temporal=temporal,
+                    window_starts=window_starts,
+                    w_idxs_final=final_condition,
+                )["temporal"]
+            )
+        torch.testing.assert_close(windows[0], windows[1])
+
+
+@pytest.mark.parametrize("model_cls", [NHITS, LSTM, MLPMultivariate])
+def test_compiled_predictor_matches_predict(model_cls):
+    h = 4
+    df = generate_series(n_series=5, min_length=30, max_length=60, seed=3)
+    dataset, *_ = TimeSeriesDataset.from_df(df)
+    kwargs = dict(n_series=5) if model_cls is MLPMultivariate else {}
+    model = model_cls(
+        h=h,
+        input_size=8,
+        max_steps=2,
+        valid_batch_size=2,
+        enable_progress_bar=False,
+        **kwargs,
+    )
+    model.fit(dataset)
+    # the last h rows of each serie are predicted
+    model.set_test_size(h)
+    expected = model.predict(dataset)
+
+    predictor = model.compile_predictor()
+    np.testing.assert_allclose(predictor.predict(dataset), expected, rtol=1e-5)
+    batch = dataset._get_batch(range(len(dataset)))
+    np.testing.assert_allclose(
+        predictor(batch["temporal"], temporal_cols=batch["temporal_cols"]),
+        expected,
+        rtol=1e-5,
+    )
+    assert model.n_predicts == 1
+    assert model.h == h
+
+
+@pytest.mark.parametrize("replay_fraction", [0.0, 1.0])
+def test_warm_start_windows(replay_fraction):
+    model = NHITS(h=6, input_size=12, max_steps=1)
+    batch = _train_batch(n_time=60)
+    _, window_starts, expected = model._create_windows(batch, step="train")
+
+    model._warm_start = _WarmStart(new_size=5, replay_fraction=replay_fraction)
+    _, _, final_condition = model._create_windows(batch, step="train")
+    if replay_fraction == 1.0:
+        torch.testing.assert_close(final_condition, expected)
+    else:
+        # the outsample of the windows reaches the last 5 observations
+        starts = window_starts[expected % len(window_starts)]
+        torch.testing.assert_close(final_condition, expected[starts >= 60 - 5 - 18 + 1])
+
+
+def test_refit_continues_optimization():
+    df = generate_series(n_series=4, min_length=60, max_length=60, seed=4)
+    dataset, *_ = TimeSeriesDataset.from_df(df)
+    model = NHITS(h=4, input_size=8, max_steps=6, enable_progress_bar=False)
+    model._keep_optimizer_state = True
+    model.fit(dataset, test_size=8)
+    assert model._optimizer_state["lr_scheduler"]["last_epoch"] == 6
+
+    model.refit(dataset, new_size=8, max_steps=3)
+    assert model._optimizer_state["lr_scheduler"]["last_epoch"] == 9
+    assert model.max_steps == 6
+    assert model.trainer_kwargs["max_steps"] == 6
+    assert model._warm_start is None
+
+
+@pytest.mark.parametrize("model_cls", [LSTM, DeepAR])
+def test_recurrent_sample_paths(model_cls):
+    h = 4
+    df = generate_series(n_series=3, min_length=30, max_length=60, seed=5)
+    dataset, *_ = TimeSeriesDataset.from_df(df)
+    kwargs = dict(recurrent=True) if model_cls is LSTM else {}
+    model = model_cls(
+        h=h,
+        input_size=8,
+        loss=DistributionLoss(distribution="Normal", level=[80]),
+        max_steps=2,
+        enable_progress_bar=False,
+        **kwargs,
+    )
+    model.fit(dataset)
+    expected = model.predict(dataset)
+    paths = model.predict(dataset, n_paths=5_000, random_seed=0)
+    assert paths.shape == expected.shape
+    assert np.isfinite(paths).all()
+    # the first step only depends on the history
+    atol = 0.05 * np.abs(expected).max()
+    np.testing.assert_allclose(
+        paths.reshape(3, h, -1)[:, 0], expected.reshape(3, h, -1)[:, 0], atol=atol
+    )
+    assert model.rnn_state is None
+    assert model.h == h
+
+    # the next predictions feed back the mean again
+    assert model.n_paths is None
+    np.testing.assert_allclose(model.predict(dataset), expected, rtol=1e-5)
+    model.set_test_size(h)
+    predictor = model.compile_predictor()
+    np.testing.assert_allclose(
+        predictor.predict(dataset), model.predict(dataset), rtol=1e-5
+    )
+
+
+def test_recurrent_sample_paths_in_chunks(monkeypatch):
+    import neuralforecast.common._base_model as base_model
+
+    paths = torch.randn(3, 101, 4, 2)
+    quantiles = torch.tensor([0.0, 0.1, 0.5, 0.975, 1.0])
+    torch.testing.assert_close(
+        base_model._paths_quantiles(paths, quantiles),
+        torch.quantile(paths, quantiles, dim=1).permute(1, 0, 2, 3),
+    )
+
+    h = 4
+    df = generate_series(n_series=5, min_length=30, max_length=60, seed=5)
+    dataset, *_ = TimeSeriesDataset.from_df(df)
+    model = DeepAR(
+        h=h,
+        input_size=8,
+        loss=DistributionLoss(distribution="Normal", level=[80]),
+        max_steps=1,
+        enable_progress_bar=False,
+    )
+    model.fit(dataset)
+    # two windows decoded at once
+    monkeypatch.setattr(base_model, "_PATHS_BATCH_SIZE", 200)
+    paths = model.predict(dataset, n_paths=100, random_seed=0)
+    assert paths.shape == model.predict(dataset).shape
+    assert np.isfinite(paths).all()
+
+
+def test_recurrent_simulate_returns_decoded_paths(monkeypatch):
+    import neuralforecast.utils
+
+    h = 4
+    df = generate_series(n_series=3, min_length=30, max_length=60, seed=5)
+    dataset, *_ = TimeSeriesDataset.from_df(df)
+    model = LSTM(
+        h=h,
+        input_size=8,
+        recurrent=True,
+        loss=DistributionLoss(distribution="Normal"),
+        max_steps=2,
+        enable_progress_bar=False,
+    )
+    model.fit(dataset)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("paths shouldn't be built from quantiles")
+
+    monkeypatch.setattr(neuralforecast.utils, "sample_from_quantiles", fail)
+    paths = model.simulate(dataset, n_paths=2_000, random_seed=0)
+    assert paths.shape == (3, 2_000, h)
+    np.testing.assert_array_equal(
+        paths, model.simulate(dataset, n_paths=2_000, random_seed=0)
+    )
+    # the mean of the paths is the one of the predictions with sample paths
+    expected = model.predict(dataset, n_paths=2_000, random_seed=0)
+    np.testing.assert_allclose(
+        paths.mean(axis=1).reshape(-1), expected[:, 0], rtol=1e-5, atol=1e-5
+    )
+
+    nhits = NHITS(h=h, input_size=8, loss=DistributionLoss(distribution="Normal"), max_steps=1)
+    nhits.fit(dataset)
+    with pytest.raises(Exception, match="only decoded by recurrent models"):
+        nhits.predict(dataset, n_paths=10)
+
+
+@pytest.mark.parametrize("scaler_type", ["identity", "standard"])
+def test_streaming_forecaster(scaler_type):
+    h = 4
+    df = generate_series(n_series=4, min_length=30, max_length=60, seed=6)
+    dataset, *_ = TimeSeriesDataset.from_df(df)
+    model = LSTM(
+        h=h,
+        input_size=8,
+        recurrent=True,
+        scaler_type=scaler_type,
+        max_steps=2,
+        enable_progress_bar=False,
+    )
+    model.fit(dataset)
+    # the last h rows of each serie are predicted
+    model.set_test_size(h)
+    expected = model.predict(dataset)
+
+    future = df.groupby("unique_id", observed=True).cumcount(ascending=False) < h
+    history = df[~future]
+    stream = model.streaming_forecaster(freq="D")
+    fcsts = stream.update(history).forecast()
+    assert fcsts.shape[0] == len(expected)
+    np.testing.assert_allclose(fcsts["LSTM"], expected[:, 0], rtol=1e-5, atol=1e-5)
+
+    # advancing one observation at a time matches a single update
+    batched = model.streaming_forecaster(freq="D").update(history).update(df[future])
+    stepwise = model.streaming_forecaster(freq="D").update(history)
+    steps = df[future].groupby("unique_id", observed=True).cumcount()
+    for step in range(h):
+        stepwise.update(df[future][steps == step])
+    pd.testing.assert_frame_equal(
+        stepwise.forecast(), batched.forecast(), check_exact=False, rtol=1e-5
+    )
+    subset = batched.forecast(ids=batched.uids[:2], h=2)
+    assert subset.shape[0] == 4
+
+    # the scaler keeps the statistics it had
+    model.scaler.x_shift = None
+    batched.forecast()
+    assert model.scaler.x_shift is None
+
+    # observations that were already added, gaps and missing values are rejected
+    with pytest.raises(ValueError, match="gaps or repeated times"):
+        batched.update(df[future])
+    last = df[future].groupby("unique_id", observed=True).tail(1)
+    with pytest.raises(ValueError, match="gaps or repeated times"):
+        batched.update(last.assign(ds=last["ds"] + pd.Timedelta(days=2)))
+    with pytest.raises(ValueError, match="missing values"):
+        batched.update(last.assign(ds=last["ds"] + pd.Timedelta(days=1), y=np.nan))
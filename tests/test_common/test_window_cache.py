@@ -0,0 +1,47 @@
+import torch
+
+from neuralforecast.common._window_cache import WindowCache
+from neuralforecast.tsdataset import TimeSeriesDataset, _BatchPadding
+from neuralforecast.utils import generate_series
+
+
+def _windows(n, calls):
+    def compute():
+        calls.append(n)
+        return dict(temporal=torch.zeros(n), static=None), torch.zeros(1), torch.ones(1)
+
+    return compute
+
+
+def test_window_cache_evicts_least_recently_used():
+    # each entry takes 48 bytes
+    cache = WindowCache(max_bytes=100)
+    calls = []
+    cache.windows(("a",), _windows(10, calls))
+    cache.windows(("a",), _windows(10, calls))
+    assert calls == [10]
+    cache.windows(("b",), _windows(10, calls))
+    cache.windows(("a",), _windows(10, calls))
+    cache.windows(("c",), _windows(10, calls))
+    assert cache.nbytes == 96
+    # b was the least recently used
+    cache.windows(("a",), _windows(10, calls))
+    cache.windows(("b",), _windows(10, calls))
+    assert calls == [10, 10, 10, 10]
+    # entries larger than the cache aren't stored
+    cache.windows(("d",), _windows(100, calls))
+    cache.windows(("d",), _windows(100, calls))
+    assert calls == [10, 10, 10, 10, 100, 100]
+
+
+def test_window_cache_reuses_larger_padding():
+    df = generate_series(n_series=5, min_length=10, max_length=40, seed=0)
+    dataset, *_ = TimeSeriesDataset.from_df(df)
+    cache = WindowCache(max_bytes=2**20)
+    large = list(cache.dataloader(dataset, 2, _BatchPadding(min_length=30)))
+    small = list(cache.dataloader(dataset, 2, _BatchPadding(min_length=20)))
+    assert len(large) == 3
+    for a, b in zip(large, small):
+        assert a["temporal"] is b["temporal"]
+    larger = list(cache.dataloader(dataset, 2, _BatchPadding(min_length=35)))
+    assert larger[0]["cache_key"] != large[0]["cache_key"]
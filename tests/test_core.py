@@ -16,6 +16,7 @@ import polars.testing
 import pytest
 import s3fs
 import torch
+import utilsforecast.processing as ufp
 from ray import tune
 
 from neuralforecast.auto import (
@@ -305,6 +306,91 @@ def test_neural_forecast_refit(setup_airplane_data):
             )
 
 
+# refit cross_validation processes df once and keeps the last refit's training data
+def test_refit_cross_validation_single_dataset(setup_airplane_data):
+    AirPassengersPanel_train, _ = setup_airplane_data
+    h, n_windows, refit = 12, 4, 2
+    models = [NHITS(h=h, input_size=24, max_steps=2, enable_progress_bar=False)]
+    nf = NeuralForecast(models=models, freq="M")
+    cv_res = nf.cross_validation(
+        df=AirPassengersPanel_train, n_windows=n_windows, refit=refit
+    )
+    splits = list(
+        ufp.backtest_splits(
+            AirPassengersPanel_train,
+            n_windows=n_windows,
+            h=h,
+            id_col="unique_id",
+            time_col="ds",
+            freq="M",
+        )
+    )
+    cols = ["unique_id", "ds", "cutoff", "y"]
+    expected = pd.concat(
+        [test.merge(cutoffs, on="unique_id")[cols] for cutoffs, _, test in splits]
+    )
+    expected = expected.sort_values(["unique_id", "cutoff", "ds"])
+    pd.testing.assert_frame_equal(
+        cv_res[cols].reset_index(drop=True), expected.reset_index(drop=True)
+    )
+    assert cv_res["NHITS"].notnull().all()
+
+    # same stored state as fitting on the training data of the last refit
+    _, last_train, _ = splits[(n_windows - 1) // refit * refit]
+    dataset, uids, last_dates, ds = TimeSeriesDataset.from_df(last_train)
+    torch.testing.assert_close(nf.dataset.temporal, dataset.temporal)
+    np.testing.assert_array_equal(nf.dataset.indptr, dataset.indptr)
+    pd.testing.assert_index_equal(nf.last_dates, last_dates)
+    np.testing.assert_array_equal(nf.ds, ds)
+    fcsts = nf.predict()
+    assert fcsts["ds"].min() > last_train["ds"].max()
+
+
+# warm started refits continue the training for refit_max_steps
+def test_cross_validation_refit_max_steps(setup_airplane_data, capsys):
+    import pytorch_lightning as pl
+
+    AirPassengersPanel_train, _ = setup_airplane_data
+
+    class _CaptureSteps(pl.Callback):
+        def __init__(self):
+            self.steps = []
+
+        def on_train_end(self, trainer, pl_module):
+            self.steps.append(trainer.global_step)
+
+    model = NHITS(
+        h=12,
+        input_size=24,
+        max_steps=5,
+        callbacks=[_CaptureSteps()],
+        enable_progress_bar=False,
+    )
+    nf = NeuralForecast(models=[model], freq="M")
+    capture = next(
+        cb
+        for cb in nf.models[0].trainer_kwargs["callbacks"]
+        if isinstance(cb, _CaptureSteps)
+    )
+    cv_res = nf.cross_validation(
+        df=AirPassengersPanel_train,
+        n_windows=3,
+        refit=True,
+        refit_max_steps=2,
+        verbose=True,
+    )
+    assert capture.steps == [5, 2, 2]
+    assert "windows 3 to 3 of 3" in capsys.readouterr().out
+    assert cv_res["NHITS"].notnull().all()
+    assert nf.models[0].max_steps == 5
+    assert nf.models[0]._optimizer_state is None
+
+    with pytest.raises(ValueError, match="requires `refit`"):
+        nf.cross_validation(
+            df=AirPassengersPanel_train, n_windows=3, refit=False, refit_max_steps=2
+        )
+
+
 # Cross_validation(refit=True, val_size=...) must give each refit window a fresh
 # EarlyStopping state. Otherwise the prior window's wait_count and best_score
 # carry over and subsequent refits stop on the first validation check.
@@ -771,6 +857,44 @@ def test_neural_forecast_static_scaling(config, scaler):
     )
 
 
+@pytest.mark.parametrize("scaler", _type2scaler.keys())
+@pytest.mark.parametrize("num_threads", [1, 3])
+def test_local_scalers_match_per_column(scaler, num_threads):
+    from coreforecast.grouped_array import GroupedArray
+
+    df = generate_series(n_series=6, min_length=20, max_length=50, seed=5)
+    rng = np.random.default_rng(0)
+    # boxcox needs positive values
+    df["y"] = df["y"].abs() + 1.0
+    for i in range(3):
+        df[f"exog_{i}"] = rng.uniform(1.0, 10.0 ** i, size=len(df))
+    dataset, *_ = TimeSeriesDataset.from_df(df)
+    nf = NeuralForecast(
+        models=[NHITS(h=4, input_size=8, max_steps=1)],
+        freq="D",
+        local_scaler_type=scaler,
+        local_scaler_num_threads=num_threads,
+    )
+    original = dataset.temporal.clone()
+    nf._scalers_fit_transform(dataset)
+
+    for i, col in enumerate(dataset.temporal_cols):
+        if col == "available_mask":
+            torch.testing.assert_close(dataset.temporal[:, i], original[:, i])
+            continue
+        ga = GroupedArray(original[:, i].numpy().copy(), dataset.indptr)
+        expected_scaler = _type2scaler[scaler]().fit(ga)
+        np.testing.assert_allclose(nf.scalers_[col].stats_, expected_scaler.stats_, rtol=1e-4, atol=1e-5)
+        np.testing.assert_allclose(dataset.temporal[:, i].numpy(), expected_scaler.transform(ga), rtol=1e-4, atol=1e-5)
+
+    y_idx = dataset.temporal_cols.get_loc("y")
+    restored = nf._scalers_target_inverse_transform(
+        dataset.temporal[:, [y_idx, y_idx]].numpy().copy(), dataset.indptr
+    )
+    np.testing.assert_allclose(restored[:, 0], original[:, y_idx].numpy(), rtol=1e-4)
+    np.testing.assert_allclose(restored[:, 1], original[:, y_idx].numpy(), rtol=1e-4)
+
+
 @pytest.fixture
 def data(size=300, n_series=3) -> pd.DataFrame:
     return pd.DataFrame({
@@ -970,6 +1094,85 @@ def test_predict_insample_diff_lengths(setup_models_for_insample):
         f"Shape mismatch in predict_insample: {len(forecasts)=}, {expected_size=}"
     )
 
+
+# Batched predict_insample matches predicting each series on its own
+@pytest.mark.parametrize("step_size", [1, 3])
+def test_predict_insample_batched_matches_single_series(step_size):
+    h = 4
+    df = generate_series(n_series=4, min_length=20, max_length=200, seed=1)
+    models = [
+        MLP(h=h, input_size=8, max_steps=1, scaler_type=None),
+        RNN(h=h, input_size=8, max_steps=1, scaler_type=None),
+    ]
+    nf = NeuralForecast(models=models, freq="D")
+    nf.fit(df=df)
+    batched = nf.predict_insample(step_size=step_size)
+
+    for uid in df["unique_id"].unique():
+        single_df = df[df["unique_id"] == uid]
+        nf.dataset, nf.uids, nf.last_dates, nf.ds = nf._prepare_fit(
+            df=single_df,
+            static_df=None,
+            id_col="unique_id",
+            time_col="ds",
+            target_col="y",
+        )
+        single = nf.predict_insample(step_size=step_size)
+        expected = batched[batched["unique_id"] == uid].reset_index(drop=True)
+        pd.testing.assert_frame_equal(
+            single.reset_index(drop=True), expected, check_categorical=False
+        )
+
+
+# predict_insample rejects series without a full window before test_size
+def test_predict_insample_short_series():
+    h = 4
+    df = generate_series(n_series=2, min_length=40, max_length=40, seed=1)
+    short = df[df["unique_id"] == df["unique_id"].iloc[0]].head(10)
+    df = pd.concat([short, df[df["unique_id"] != short["unique_id"].iloc[0]]])
+    nf = NeuralForecast(models=[MLP(h=h, input_size=2, max_steps=1)], freq="D")
+    nf.fit(df=df)
+    # the short series keeps 2 observations, fewer than h
+    nf.models[0].set_test_size(8)
+    with pytest.raises(Exception, match="must not exceed the shorter time series"):
+        nf.predict_insample()
+
+
+# Fitting the models in parallel processes gives the same models as fitting them sequentially
+def test_fit_n_jobs_matches_sequential(setup_airplane_data):
+    AirPassengersPanel_train, _ = setup_airplane_data
+
+    def make_models():
+        return [
+            MLP(h=12, input_size=24, max_steps=5, random_seed=1),
+            DLinear(h=12, input_size=24, max_steps=5, random_seed=2),
+            NHITS(h=12, input_size=24, max_steps=5, random_seed=3, alias="NHITS_3"),
+        ]
+
+    nf = NeuralForecast(models=make_models(), freq="M")
+    nf.fit(df=AirPassengersPanel_train)
+    expected = nf.predict()
+
+    nf_parallel = NeuralForecast(models=make_models(), freq="M")
+    nf_parallel.fit(df=AirPassengersPanel_train, n_jobs=2)
+    assert [repr(m) for m in nf_parallel.models] == [repr(m) for m in nf.models]
+    pd.testing.assert_frame_equal(nf_parallel.predict(), expected)
+
+
+# The dataset built by `from_df` is backed by numpy, it's shared with the workers anyway
+def test_fit_n_jobs_shares_from_df_dataset():
+    df, static_df = generate_series(n_series=4, min_length=60, max_length=80, n_static_features=2, seed=0)
+    models = [
+        MLP(h=12, input_size=24, max_steps=2, random_seed=1),
+        DLinear(h=12, input_size=24, max_steps=2, random_seed=2),
+    ]
+    nf = NeuralForecast(models=models, freq="D")
+    nf.fit(df=df, static_df=static_df, n_jobs=2)
+    assert nf.dataset.temporal.is_shared()
+    assert nf.dataset.static.is_shared()
+    assert nf.predict().shape[0] == 4 * 12
+
+
 @pytest.mark.parametrize("step_size, test_size", [(7, 0), (9, 0), (7, 5), (9, 5)])
 def test_predict_insample_step_size(setup_airplane_data, step_size, test_size):
     AirPassengersPanel_train, _ = setup_airplane_data
@@ -1436,6 +1639,87 @@ def test_save_load_no_dataset(setup_airplane_data):
     np.testing.assert_allclose(forecasts1["DilatedRNN"], forecasts2["DilatedRNN"])
 
 
+@pytest.mark.parametrize("mmap", [False, True])
+def test_save_load_numpy_dataset(setup_airplane_data, tmp_path, mmap):
+    AirPassengersPanel_train, AirPassengersPanel_test = setup_airplane_data
+    nf = NeuralForecast(
+        models=[
+            NHITS(
+                h=12,
+                input_size=24,
+                max_steps=1,
+                futr_exog_list=["trend"],
+                stat_exog_list=["airline1"],
+            )
+        ],
+        freq="M",
+    )
+    nf.fit(AirPassengersPanel_train, static_df=AirPassengersStatic)
+    expected = nf.predict(futr_df=AirPassengersPanel_test)
+    nf.save(str(tmp_path), dataset_format="numpy")
+    assert not (tmp_path / "dataset.pkl").exists()
+    for name in ["manifest.json", "temporal.npy", "indptr.npy", "static.npy", "ds.npy"]:
+        assert (tmp_path / "dataset" / name).exists()
+
+    nf2 = NeuralForecast.load(str(tmp_path), mmap=mmap)
+    torch.testing.assert_close(nf2.dataset.temporal, nf.dataset.temporal)
+    torch.testing.assert_close(nf2.dataset.static, nf.dataset.static)
+    np.testing.assert_array_equal(nf2.dataset.indptr, nf.dataset.indptr)
+    pd.testing.assert_index_equal(nf2.dataset.temporal_cols, nf.dataset.temporal_cols)
+    np.testing.assert_array_equal(nf2.ds, nf.ds)
+    pd.testing.assert_frame_equal(
+        nf2.predict(futr_df=AirPassengersPanel_test), expected
+    )
+
+
+def test_load_lazy_models(setup_airplane_data, tmp_path):
+    AirPassengersPanel_train, AirPassengersPanel_test = setup_airplane_data
+    nf = NeuralForecast(
+        models=[
+            NHITS(h=12, input_size=24, max_steps=1, alias="nhits"),
+            MLP(h=12, input_size=24, max_steps=1, alias="mlp"),
+        ],
+        freq="M",
+    )
+    nf.fit(AirPassengersPanel_train)
+    expected = nf.predict()
+    nf.save(str(tmp_path))
+
+    nf2 = NeuralForecast.load(str(tmp_path), models=["mlp"])
+    assert [model.alias for model in nf2.models] == ["mlp"]
+    pd.testing.assert_frame_equal(nf2.predict(), expected.drop(columns="nhits"))
+    with pytest.raises(ValueError, match="not found"):
+        NeuralForecast.load(str(tmp_path), models=["lstm"])
+
+    nf3 = NeuralForecast.load(str(tmp_path), lazy=True, max_memory=1)
+    assert nf3.h == 12
+    assert nf3.models.loaded == []
+    aliases = [model.alias for model in nf3.models]
+    # only the most recently used model is kept within the budget
+    assert nf3.models.loaded == [len(aliases) - 1]
+
+    # each model is loaded once per call, then the budget is enforced again
+    n_loads = [0] * len(aliases)
+
+    def counted(i, loader):
+        def load():
+            n_loads[i] += 1
+            return loader()
+
+        return load
+
+    nf3.models._loaders = [counted(i, f) for i, f in enumerate(nf3.models._loaders)]
+    pd.testing.assert_frame_equal(nf3.predict()[expected.columns], expected)
+    assert n_loads == [1] * (len(aliases) - 1) + [0]
+    assert len(nf3.models.loaded) == 1
+
+    # evicted models are loaded again with their test size
+    nf3.models[0].set_test_size(5)
+    nf3.models[1]
+    assert nf3.models.loaded == [1]
+    assert nf3.models[0].get_test_size() == 5
+
+
 def test_save_load_with_callbacks(setup_airplane_data, tmp_path):
     """Saving a model with trainer callbacks should not break predict after reload.
 
@@ -2268,6 +2552,78 @@ def test_neuralforecast_cross_validation_conformal_prediction(setup_airplane_dat
     assert all([col in cv2.columns for col in ["NHITS-lo-30", "NHITS-hi-30"]]), \
         "Expected conformal prediction columns not found in cross validation results"
 
+@pytest.mark.parametrize("calibration", ["cross_validation", "holdout"])
+def test_conformal_calibration(setup_airplane_data, calibration):
+    import pytorch_lightning as pl
+
+    AirPassengersPanel_train, AirPassengersPanel_test = setup_airplane_data
+
+    class _CountFits(pl.Callback):
+        def __init__(self):
+            self.n_fits = 0
+
+        def on_train_start(self, trainer, pl_module):
+            self.n_fits += 1
+
+    model = NHITS(
+        h=12, input_size=24, max_steps=2, callbacks=[_CountFits()], enable_progress_bar=False
+    )
+    nf = NeuralForecast(models=[model], freq="M")
+    counter = next(
+        cb for cb in nf.models[0].trainer_kwargs["callbacks"] if isinstance(cb, _CountFits)
+    )
+    prediction_intervals = PredictionIntervals(n_windows=3, calibration=calibration)
+    nf.fit(AirPassengersPanel_train, prediction_intervals=prediction_intervals)
+    assert counter.n_fits == (1 if calibration == "holdout" else 2)
+
+    # compact scores per model: [n_series, n_windows, h]
+    n_series = AirPassengersPanel_train["unique_id"].nunique()
+    assert list(nf._cs_scores) == ["NHITS"]
+    assert nf._cs_scores["NHITS"].shape == (n_series, 3, 12)
+    assert nf._cs_scores["NHITS"].dtype == np.float32
+    assert nf.models[0].get_test_size() == 0
+
+    preds = nf.predict(futr_df=AirPassengersPanel_test, level=[80])
+    assert (preds["NHITS-lo-80"] <= preds["NHITS"]).all()
+    assert (preds["NHITS-hi-80"] >= preds["NHITS"]).all()
+
+    with pytest.raises(ValueError, match="calibration must be one of"):
+        PredictionIntervals(calibration="full")
+
+
+def test_holdout_calibration_with_val_df(setup_airplane_data):
+    AirPassengersPanel_train, _ = setup_airplane_data
+    val_df = AirPassengersPanel_train.groupby("unique_id").tail(12)
+    train_df = AirPassengersPanel_train.drop(val_df.index)
+    nf = NeuralForecast(models=[NHITS(h=12, input_size=24, max_steps=1)], freq="M")
+    with pytest.raises(ValueError, match="holdout calibration can't be used with val_df"):
+        nf.fit(
+            train_df,
+            val_df=val_df,
+            prediction_intervals=PredictionIntervals(calibration="holdout"),
+        )
+    assert not nf._fitted
+
+
+def test_holdout_calibration_checks_sizes_before_fitting(setup_airplane_data, monkeypatch):
+    AirPassengersPanel_train, _ = setup_airplane_data
+    model = NHITS(h=12, input_size=24, max_steps=1)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the model shouldn't be trained")
+
+    monkeypatch.setattr(model, "fit", fail)
+    nf = NeuralForecast(models=[model], freq="M")
+    with pytest.raises(ValueError, match="Minimum required samples"):
+        nf.fit(
+            AirPassengersPanel_train,
+            prediction_intervals=PredictionIntervals(
+                n_windows=200, calibration="holdout"
+            ),
+        )
+    assert not nf._fitted
+
+
 @pytest.mark.parametrize("model", [NHITS])
 def test_neuralforecast_quantile_level_prediction(setup_airplane_data, model):
     """Test quantile and level argument in predict for different models and errors."""
@@ -2841,3 +3197,30 @@ def test_trainer_caching(setup_airplane_data):
     model._pred_trainer_kwargs = {**model._pred_trainer_kwargs, "enable_checkpointing": True}
     nf.predict()
     assert model._pred_trainer is not trainer_2, "Trainer should be replaced when a kwarg value changes"
+
+
+def test_window_cache_matches_uncached_predictions():
+    df = generate_series(n_series=6, min_length=40, max_length=80, seed=7)
+    models = [
+        NHITS(h=4, input_size=8, max_steps=2, alias="nhits1"),
+        NHITS(h=4, input_size=8, max_steps=2, random_seed=2, alias="nhits2"),
+        MLP(h=4, input_size=16, max_steps=2, scaler_type="standard"),
+        LSTM(h=4, input_size=8, max_steps=2, recurrent=True),
+    ]
+    nf = NeuralForecast(models=models, freq="D")
+    nf.fit(df)
+    cached = nf.predict()
+    assert all(getattr(model, "_window_cache", None) is None for model in nf.models)
+
+    nf.window_cache_size = None
+    pd.testing.assert_frame_equal(cached, nf.predict())
+
+
+def test_window_cache_released_on_error():
+    df = generate_series(n_series=2, min_length=40, max_length=40, seed=7)
+    nf = NeuralForecast(models=[NHITS(h=4, input_size=8, max_steps=1)], freq="D")
+    nf.fit(df)
+    # point losses need prediction intervals for levels
+    with pytest.raises(AttributeError, match="prediction_intervals"):
+        nf.predict(level=[80])
+    assert nf.models[0]._window_cache is None
@@ -1,13 +1,14 @@
 # %% Test IQLoss for all types of architectures
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import pytest
 import sys
 
 from neuralforecast import NeuralForecast
 from neuralforecast.common.enums import TimeSeriesDatasetEnum
-from neuralforecast.models import NBEATSx, NHITS, TSMixerx, LSTM, BiTCN
-from neuralforecast.losses.pytorch import IQLoss
+from neuralforecast.models import NBEATSx, NHITS, TSMixer, TSMixerx, LSTM, BiTCN
+from neuralforecast.losses.pytorch import HuberIQLoss, IQLoss
 from tests.helpers.data import air_passengers
 
 @pytest.mark.skipif(
@@ -129,3 +130,33 @@ def test_iqloss(show_plot=False):
         plt.legend()
         plt.grid()
         plt.show(block=True)
+
+
+# %% Test all the quantiles of a grid are predicted in a single pass
+@pytest.mark.parametrize("loss", [IQLoss, HuberIQLoss])
+def test_iqloss_quantile_grid(loss):
+    Y_train_df, _, _, _ = air_passengers(h=12)
+    models = [
+        NHITS(h=12, input_size=24, loss=loss(), valid_loss=loss(), max_steps=2),
+        TSMixer(
+            h=12,
+            input_size=24,
+            n_series=2,
+            loss=loss(),
+            valid_loss=loss(),
+            max_steps=2,
+        ),
+    ]
+    fcst = NeuralForecast(models=models, freq="M")
+    fcst.fit(df=Y_train_df)
+
+    quantiles = [0.1, 0.5, 0.9]
+    for model in fcst.models:
+        expected = np.concatenate(
+            [model.predict(fcst.dataset, quantiles=[q]) for q in quantiles], axis=-1
+        )
+        grid = model._predict_quantile_grid(fcst.dataset, quantiles=quantiles)
+        np.testing.assert_allclose(grid, expected, rtol=1e-5, atol=1e-5)
+        # the loss is back to a single quantile
+        assert model.loss.output_names == ["_ql0.5"]
+        assert not model.loss.has_predicted
@@ -1,9 +1,12 @@
 import warnings
 
+import pytest
 import torch
 
 from neuralforecast.losses.pytorch import (
+    GMM,
     MAE,
+    NBMM,
     PMM,
     DistributionLoss,
     HuberIQLoss,
@@ -160,3 +163,91 @@ def test_duplicate_level_and_quantiles_dedup():
         check = MQLoss(level=[80, 90])
         assert len(w) == 0
     assert len(check.quantiles) == 5
+
+
+# Analytic quantiles match the empirical quantiles of many samples
+@pytest.mark.parametrize(
+    "distribution, distr_args",
+    [
+        ("Normal", (torch.randn(2, 3, 1), torch.rand(2, 3, 1) + 0.5)),
+        ("StudentT", (torch.rand(2, 3, 1) * 5 + 3, torch.randn(2, 3, 1), torch.rand(2, 3, 1) + 0.5)),
+        ("Poisson", (torch.rand(2, 3, 1) * 50 + 0.1,)),
+        ("NegativeBinomial", (torch.rand(2, 3, 1) * 10 + 0.5, torch.rand(2, 3, 1) * 0.9 + 0.05)),
+        ("Bernoulli", (torch.rand(2, 3, 1),)),
+    ],
+)
+def test_DistributionLoss_analytic_quantiles(distribution, distr_args):
+    torch.manual_seed(0)
+    loss = DistributionLoss(distribution=distribution, level=[80, 90], num_samples=200_000)
+    mean, quants = loss.predict_quantiles(distr_args)
+    assert mean.shape == (2, 3, 1)
+    assert quants.shape == (2, 3, 1, 5)
+
+    _, sample_mean, sample_quants = loss.sample(distr_args)
+    scale = sample_quants[..., -1:] - sample_quants[..., :1] + 1.0
+    torch.testing.assert_close(mean, sample_mean.squeeze(-1), atol=0.05, rtol=0.02)
+    if distribution in ("Poisson", "NegativeBinomial", "Bernoulli"):
+        # discrete quantiles are the same values
+        assert ((quants - sample_quants).abs() <= 1.0).all()
+    else:
+        assert ((quants - sample_quants).abs() / scale < 0.02).all()
+
+    loss.analytic_quantiles = False
+    _, mc_quants = loss.predict_quantiles(distr_args, num_samples=100)
+    assert mc_quants.shape == quants.shape
+
+
+# Bisection of the mixture CDF matches the empirical quantiles of many samples
+@pytest.mark.parametrize(
+    "loss, distr_args",
+    [
+        (
+            GMM(n_components=3, weighted=True, num_samples=200_000),
+            (
+                torch.randn(2, 3, 1, 3) * 3,
+                torch.rand(2, 3, 1, 3) + 0.5,
+                torch.softmax(torch.randn(2, 3, 1, 3), dim=-1),
+            ),
+        ),
+        (PMM(n_components=3, num_samples=200_000), (torch.rand(2, 3, 1, 3) * 50 + 0.1,)),
+        (
+            NBMM(n_components=3, num_samples=200_000),
+            (torch.rand(2, 3, 1, 3) * 10 + 0.5, torch.rand(2, 3, 1, 3) * 0.9 + 0.05),
+        ),
+    ],
+)
+def test_mixture_analytic_quantiles(loss, distr_args):
+    torch.manual_seed(0)
+    mean, quants = loss.predict_quantiles(distr_args)
+    assert mean.shape == (2, 3, 1)
+    assert quants.shape == (2, 3, 1, 5)
+
+    _, sample_mean, sample_quants = loss.sample(distr_args)
+    scale = sample_quants[..., -1:] - sample_quants[..., :1] + 1.0
+    torch.testing.assert_close(mean, sample_mean.squeeze(-1), atol=0.05, rtol=0.02)
+    if isinstance(loss, GMM):
+        assert ((quants - sample_quants).abs() / scale < 0.02).all()
+    else:
+        # discrete quantiles are the same values
+        assert ((quants - sample_quants).abs() <= 1.0).all()
+
+    loss.analytic_quantiles = False
+    _, mc_quants = loss.predict_quantiles(distr_args, num_samples=100)
+    assert mc_quants.shape == quants.shape
+
+
+def test_GMM_quantile_tol():
+    distr_args = (torch.randn(4, 2, 1, 5) * 10, torch.rand(4, 2, 1, 5) + 0.1)
+    _, coarse = GMM(n_components=5, quantile_tol=1e-1).predict_quantiles(distr_args)
+    _, fine = GMM(n_components=5, quantile_tol=1e-5).predict_quantiles(distr_args)
+    assert ((coarse - fine).abs() <= 0.1 * distr_args[1].amin(-1, keepdim=True)).all()
+
+
+def test_mixture_quantiles_fall_back_to_sampling(monkeypatch):
+    import neuralforecast.losses.pytorch as losses
+
+    monkeypatch.setattr(losses, "_mixture_quantiles", lambda *args, **kwargs: None)
+    loss = PMM(n_components=3, num_samples=100)
+    mean, quants = loss.predict_quantiles((torch.rand(2, 3, 1, 3) * 50 + 0.1,))
+    assert mean.shape == (2, 3, 1)
+    assert quants.shape == (2, 3, 1, len(loss.quantiles))
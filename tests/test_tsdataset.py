@@ -1,10 +1,19 @@
+import os
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
 import polars
 import pytest
 import torch
 
-from neuralforecast.tsdataset import TimeSeriesDataModule, TimeSeriesDataset
+from neuralforecast.tsdataset import (
+    LocalFilesTimeSeriesDataset,
+    TimeSeriesDataModule,
+    TimeSeriesDataset,
+    TimeSeriesLoader,
+    _BatchPadding,
+)
 from neuralforecast.utils import generate_series
 
 
@@ -44,6 +53,73 @@ def test_data_module(setup_data):
         np.testing.assert_array_equal(batch["temporal_cols"], ["y", "available_mask"])
 
 
+def test_data_module_shares_memory_with_workers():
+    df, static_df = generate_series(n_series=20, n_static_features=2, seed=0)
+    dataset, *_ = TimeSeriesDataset.from_df(df=df, static_df=static_df)
+    expected = [dataset[i]["temporal"] for i in range(len(dataset))]
+    assert not dataset.temporal.is_shared()
+
+    data = TimeSeriesDataModule(
+        dataset=dataset,
+        batch_size=4,
+        shuffle_train=False,
+        num_workers=2,
+    )
+    assert dataset.temporal.is_shared()
+    assert dataset.static.is_shared()
+    batches = list(data.train_dataloader())
+    torch.testing.assert_close(
+        torch.cat([b["temporal"] for b in batches]), torch.stack(expected)
+    )
+
+
+def test_from_df_builds_shared_memory_dataset():
+    df, static_df = generate_series(n_series=20, n_static_features=2, seed=0)
+    expected, *_ = TimeSeriesDataset.from_df(df=df, static_df=static_df)
+    dataset, *_ = TimeSeriesDataset.from_df(
+        df=df, static_df=static_df, share_memory=True
+    )
+    assert dataset.temporal.is_shared()
+    assert dataset.static.is_shared()
+    torch.testing.assert_close(dataset.temporal, expected.temporal)
+    torch.testing.assert_close(dataset.static, expected.static)
+
+    # the module uses the shared tensors as they are
+    temporal, static = dataset.temporal, dataset.static
+    TimeSeriesDataModule(dataset=dataset, batch_size=4, num_workers=2)
+    assert dataset.temporal is temporal
+    assert dataset.static is static
+    # datasets derived from a shared one are shared too
+    trimmed = TimeSeriesDataset.trim_dataset(dataset, right_trim=5)
+    appended = dataset.append(trimmed)
+    for derived in (trimmed, appended):
+        assert derived.temporal.is_shared()
+        assert derived.static.is_shared()
+        assert derived.static is not dataset.static
+        torch.testing.assert_close(derived.static, expected.static)
+
+
+@pytest.mark.parametrize("with_mask", [False, True])
+def test_from_df_owns_its_buffers(with_mask):
+    df, static_df = generate_series(n_series=5, n_static_features=2, seed=0)
+    df["y"] = df["y"].astype(np.float32)
+    if with_mask:
+        df["available_mask"] = np.float32(1.0)
+    df_copy = df.copy()
+    static_copy = static_df.copy()
+    dataset, *_ = TimeSeriesDataset.from_df(df, static_df=static_df)
+    assert dataset.temporal.dtype == torch.float32
+    assert dataset.temporal_cols[-1] == "available_mask"
+    np.testing.assert_array_equal(dataset.temporal[:, -1].numpy(), 1.0)
+    np.testing.assert_allclose(dataset.temporal[:, 0].numpy(), df["y"].to_numpy())
+
+    # updates of the dataset, e.g. by the local scalers, don't reach the inputs
+    dataset.temporal.mul_(2)
+    dataset.static.mul_(2)
+    pd.testing.assert_frame_equal(df, df_copy)
+    pd.testing.assert_frame_equal(static_df, static_copy)
+
+
 def test_static_features(setup_data):
     temporal_df, sorted_temporal_df, unsorted_temporal_df = setup_data
     batch_size = 128
@@ -196,4 +272,244 @@ def test_polars_integration(temporal_df):
     pd.testing.assert_series_equal(indices.astype('int64'), indices_pl.to_pandas().astype('int64'))
     pd.testing.assert_index_equal(dates, pd.Index(dates_pl, name='ds'))
     np.testing.assert_array_equal(ds, ds_pl)
-    np.testing.assert_array_equal(dataset.indptr, dataset_pl.indptr)
\ No newline at end of file
+    np.testing.assert_array_equal(dataset.indptr, dataset_pl.indptr)
+
+
+@pytest.mark.parametrize("from_parquet", [False, True])
+def test_from_lazy_matches_from_df(tmp_path, from_parquet):
+    df, static_df = generate_series(
+        n_series=20, n_temporal_features=1, n_static_features=2, seed=0
+    )
+    df["temporal_0"] = df["temporal_0"].cat.codes
+    df["unique_id"] = df["unique_id"].astype(str)
+    static_df["unique_id"] = static_df["unique_id"].astype(str)
+    df = polars.from_pandas(df).sample(fraction=1.0, seed=0)
+    static_df = polars.from_pandas(static_df)
+    expected, expected_ids, expected_dates, expected_ds = TimeSeriesDataset.from_df(
+        df, static_df=static_df
+    )
+
+    if from_parquet:
+        df.write_parquet(tmp_path / "data", partition_by="unique_id")
+        source = str(tmp_path / "data")
+    else:
+        source = df.lazy()
+    # chunks of a few series
+    dataset, ids, dates, ds = TimeSeriesDataset.from_lazy(
+        source, static_df=static_df, chunk_size=500
+    )
+    assert dataset.temporal_cols.equals(expected.temporal_cols)
+    torch.testing.assert_close(dataset.temporal, expected.temporal)
+    torch.testing.assert_close(dataset.static, expected.static)
+    np.testing.assert_array_equal(dataset.indptr, expected.indptr)
+    np.testing.assert_array_equal(ids.to_numpy(), expected_ids.to_numpy())
+    np.testing.assert_array_equal(dates.to_numpy(), expected_dates.to_numpy())
+    np.testing.assert_array_equal(ds, expected_ds)
+
+
+def test_local_files_cache(tmp_path, monkeypatch):
+    df = generate_series(n_series=4, n_temporal_features=1, seed=0)
+    df["unique_id"] = df["unique_id"].astype(str)
+    df.to_parquet(tmp_path / "data", partition_cols=["unique_id"], index=False)
+    directories = sorted(str(p) for p in (tmp_path / "data").iterdir())
+
+    def build(**kwargs):
+        return LocalFilesTimeSeriesDataset.from_data_directories(
+            directories, exogs=["temporal_0"], **kwargs
+        )
+
+    expected = [build()[i]["temporal"] for i in range(4)]
+
+    # memory budget for two series of float32 y, temporal_0 and available_mask
+    serie_nbytes = 3 * 4 * max(df.groupby("unique_id").size())
+    dataset = build(cache_size=2 * serie_nbytes, cache_dir=str(tmp_path / "cache"))
+    for _ in range(2):
+        for i in range(4):
+            torch.testing.assert_close(dataset[i]["temporal"], expected[i])
+    info = dataset.cache_info()
+    assert info["hits"] + info["misses"] == 8
+    assert info["nbytes"] <= 2 * serie_nbytes
+    assert len(list((tmp_path / "cache").glob("*.npy"))) == 4
+
+    # repeated reads of a cached serie are hits
+    dataset[3]
+    dataset[3]
+    assert dataset.cache_info()["hits"] == info["hits"] + 2
+
+    # later datasets read the memory-mapped decoded series
+    cached = build(cache_dir=str(tmp_path / "cache"))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("parquet files shouldn't be read")
+
+    monkeypatch.setattr(pd, "read_parquet", fail)
+    for i in range(4):
+        torch.testing.assert_close(cached[i]["temporal"], expected[i])
+
+
+
+@pytest.mark.parametrize("local_scaler_type", ["standard", "robust"])
+def test_local_files_local_scaler(tmp_path, local_scaler_type):
+    from coreforecast.grouped_array import GroupedArray
+    from neuralforecast.common._local_scalers import _type2scaler
+
+    df = generate_series(n_series=4, min_length=20, max_length=40, seed=0)
+    df["x"] = np.random.default_rng(0).random(len(df))
+    df["unique_id"] = df["unique_id"].astype(str)
+    df.to_parquet(tmp_path / "data", partition_cols=["unique_id"], index=False)
+    directories = sorted(str(p) for p in (tmp_path / "data").iterdir())
+
+    def build(**kwargs):
+        return LocalFilesTimeSeriesDataset.from_data_directories(
+            directories, exogs=["x"], cache_size=10**6, **kwargs
+        )
+
+    raw = build()
+    dataset = build(local_scaler_type=local_scaler_type)
+    for _ in range(2):
+        for i in range(4):
+            expected = raw[i]["temporal"].clone()
+            n = int(expected[-1].sum())
+            for j in range(2):
+                values = expected[j, -n:].numpy().copy()
+                ga = GroupedArray(values, np.array([0, n]))
+                expected[j, -n:] = torch.from_numpy(
+                    _type2scaler[local_scaler_type]().fit(ga).transform(ga)
+                )
+            torch.testing.assert_close(dataset[i]["temporal"], expected)
+
+
+@pytest.mark.parametrize("scan_backend", ["thread", "process"])
+def test_local_files_parallel_scan(tmp_path, monkeypatch, scan_backend):
+    df = generate_series(n_series=6, n_temporal_features=1, seed=0)
+    df["unique_id"] = df["unique_id"].astype(str)
+    df.to_parquet(tmp_path / "data", partition_cols=["unique_id"], index=False)
+    directories = sorted(str(p) for p in (tmp_path / "data").iterdir())
+    manifest_path = str(tmp_path / "manifest.pkl")
+
+    def build(**kwargs):
+        return LocalFilesTimeSeriesDataset.from_data_directories(
+            directories, exogs=["temporal_0"], **kwargs
+        )
+
+    expected = build()
+    dataset = build(n_jobs=3, scan_backend=scan_backend, manifest_path=manifest_path)
+    for attr in ("max_size", "min_size", "n_groups"):
+        assert getattr(dataset, attr) == getattr(expected, attr)
+    pd.testing.assert_index_equal(dataset.last_times, expected.last_times)
+    pd.testing.assert_series_equal(dataset.indices, expected.indices)
+    assert dataset.temporal_cols.equals(expected.temporal_cols)
+
+    # unchanged directories are read from the manifest
+    import pyarrow.parquet as pq
+
+    def fail(*args, **kwargs):
+        raise AssertionError("metadata shouldn't be read")
+
+    monkeypatch.setattr(pq, "read_metadata", fail)
+    cached = build(manifest_path=manifest_path)
+    pd.testing.assert_index_equal(cached.last_times, expected.last_times)
+    assert cached.max_size == expected.max_size
+
+    # a file overwritten in place keeps the modification time of its directory
+    monkeypatch.undo()
+    directory = Path(directories[0])
+    dir_stat = directory.stat()
+    (file,) = directory.glob("*.parquet")
+    serie = pd.read_parquet(file)
+    longer = pd.concat([serie, serie.tail(5)], ignore_index=True)
+    longer["ds"] = pd.date_range(serie["ds"].iloc[0], periods=len(longer), freq="D")
+    longer.to_parquet(file, index=False)
+    os.utime(directory, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+    updated = build(manifest_path=manifest_path)
+    assert updated.last_times[0] == longer["ds"].iloc[-1]
+    assert updated.max_size == max(expected.max_size, len(longer))
+
+
+def test_append_and_trim_match_loops():
+    rng = np.random.default_rng(0)
+    sizes = rng.integers(5, 30, size=50)
+    futr_sizes = rng.integers(0, 4, size=50)
+    indptr = np.append(0, np.cumsum(sizes)).astype(np.int32)
+    futr_indptr = np.append(0, np.cumsum(futr_sizes)).astype(np.int32)
+    cols = pd.Index(["y", "x", "available_mask"])
+    dataset = TimeSeriesDataset(
+        temporal=rng.random((indptr[-1], 3), dtype=np.float32),
+        temporal_cols=cols,
+        indptr=indptr,
+        y_idx=0,
+    )
+    futr_dataset = TimeSeriesDataset(
+        temporal=rng.random((futr_indptr[-1], 3), dtype=np.float32),
+        temporal_cols=cols,
+        indptr=futr_indptr,
+        y_idx=0,
+    )
+
+    appended = dataset.append(futr_dataset)
+    for i in range(dataset.n_groups):
+        serie = appended.temporal[appended.indptr[i] : appended.indptr[i + 1]]
+        torch.testing.assert_close(
+            serie,
+            torch.cat(
+                [
+                    dataset.temporal[indptr[i] : indptr[i + 1]],
+                    futr_dataset.temporal[futr_indptr[i] : futr_indptr[i + 1]],
+                ]
+            ),
+            rtol=0,
+            atol=0,
+        )
+
+    trimmed = TimeSeriesDataset.trim_dataset(dataset, left_trim=2, right_trim=3)
+    np.testing.assert_array_equal(
+        trimmed.indptr, np.append(0, np.cumsum(sizes - 5))
+    )
+    assert trimmed.indptr.dtype == np.int32
+    for i in range(dataset.n_groups):
+        torch.testing.assert_close(
+            trimmed.temporal[trimmed.indptr[i] : trimmed.indptr[i + 1]],
+            dataset.temporal[indptr[i] + 2 : indptr[i + 1] - 3],
+            rtol=0,
+            atol=0,
+        )
+
+    # the results own their buffers and don't alias the source
+    for derived in (appended, trimmed):
+        assert derived.temporal.data_ptr() != dataset.temporal.data_ptr()
+        assert derived.temporal._base is None
+
+
+def test_batches_match_stacked_items(setup_data):
+    temporal_df, *_ = setup_data
+    _, static_df = generate_series(
+        n_series=1000, n_static_features=2, equal_ends=False
+    )
+    dataset, *_ = TimeSeriesDataset.from_df(df=temporal_df, static_df=static_df)
+    idxs = [5, 0, 999, 42]
+    items = [dataset[i] for i in idxs]
+
+    batch = dataset.__getitems__(idxs)
+    torch.testing.assert_close(
+        batch["temporal"], torch.stack([item["temporal"] for item in items])
+    )
+    torch.testing.assert_close(
+        batch["static"], torch.stack([item["static"] for item in items])
+    )
+    np.testing.assert_array_equal(batch["idx"].numpy(), idxs)
+
+    # padded to the longest serie of the batch
+    padding = _BatchPadding(left_margin=3)
+    batch = dataset._get_batch(idxs, padding=padding)
+    sizes = np.diff(dataset.indptr)[idxs]
+    assert batch["temporal"].shape[-1] == sizes.max() + 3
+    assert batch["left_trim"] == dataset.max_size - sizes.max() - 3
+    torch.testing.assert_close(
+        batch["temporal"],
+        torch.stack([item["temporal"] for item in items])[..., batch["left_trim"] :],
+    )
+
+    # the loader yields the batches built by the dataset
+    loader = TimeSeriesLoader(dataset, batch_size=4, padding=_BatchPadding(min_length=600))
+    batch = next(iter(loader))
+    assert batch["temporal"].shape == (4, 2, 500)